@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+"""This module contains the logic for the Linode API statistics callback plugin."""
+
+from __future__ import absolute_import, division, print_function
+
+# pylint: disable=invalid-name
+__metaclass__ = type
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    METRICS_RESULT_KEY,
+    histogram_percentile,
+    merge_histograms,
+)
+
+DOCUMENTATION = """
+    name: api_stats
+    type: aggregate
+    short_description: Summarizes Linode API usage across a playbook run
+    author:
+      - Linode (@linode)
+    requirements:
+        - python >= 3
+        - Enabled in the C(callbacks_enabled) setting of the Ansible configuration.
+    description:
+        - Aggregates the API metrics returned by Linode modules and prints a summary at the end of the run.
+        - The summary includes the total number of API requests, requests per module, the slowest endpoints,
+          estimated p50/p95/p99 request latencies, time spent polling and the number of retries and rate limited requests.
+        - Task time that was not spent making API requests or polling is reported as Ansible overhead.
+        - Modules only return metrics when the C(LINODE_ANSIBLE_METRICS) environment variable is set on the host
+          running them. This plugin sets it for modules run on the controller.
+    options:
+        report_path:
+            description: A path to write a JSON report of the aggregated metrics to.
+            type: path
+            env:
+                - name: LINODE_API_STATS_REPORT
+            ini:
+                - section: callback_linode_api_stats
+                  key: report_path
+        top_endpoints:
+            description: The number of slowest endpoints to include in the summary.
+            type: int
+            default: 10
+            env:
+                - name: LINODE_API_STATS_TOP_ENDPOINTS
+            ini:
+                - section: callback_linode_api_stats
+                  key: top_endpoints
+        enable_metrics:
+            description:
+                - Whether to set C(LINODE_ANSIBLE_METRICS) for modules run on the controller.
+                - When enabled, the plugin sets C(LINODE_ANSIBLE_METRICS=1) in the environment of the controller
+                  process unless it is already set. Every process the controller starts afterwards inherits it.
+            type: bool
+            default: true
+            env:
+                - name: LINODE_API_STATS_ENABLE_METRICS
+            ini:
+                - section: callback_linode_api_stats
+                  key: enable_metrics
+"""
+
+EXAMPLES = """
+# ansible.cfg
+[defaults]
+callbacks_enabled = linode.cloud.api_stats
+
+[callback_linode_api_stats]
+report_path = ./linode_api_stats.json
+top_endpoints = 5
+"""
+
+PERCENTILES = (50, 95, 99)
+
+
+class ApiStats:
+    """Aggregates the API metrics of many Linode tasks."""
+
+    def __init__(self) -> None:
+        self.tasks = 0
+        self.task_seconds = 0.0
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.totals: Dict[str, float] = {
+            "requests": 0,
+            "errors": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "api_seconds": 0.0,
+            "poll_seconds": 0.0,
+            "rate_limit_wait_seconds": 0.0,
+            "memo_hits": 0,
+            "module_seconds": 0.0,
+        }
+
+    def add(
+        self,
+        module: str,
+        metrics: Dict[str, Any],
+        task_seconds: Optional[float] = None,
+    ) -> None:
+        """Adds the metrics returned by a single module run."""
+
+        self.tasks += 1
+
+        poll_seconds = metrics.get("poll_sleep_seconds", 0) + metrics.get(
+            "event_poll_sleep_seconds", 0
+        )
+
+        for key in (
+            "requests",
+            "errors",
+            "retries",
+            "rate_limited",
+            "bytes_in",
+            "bytes_out",
+            "api_seconds",
+            "rate_limit_wait_seconds",
+            "memo_hits",
+        ):
+            self.totals[key] += metrics.get(key, 0)
+
+        self.totals["poll_seconds"] += poll_seconds
+        self.totals["module_seconds"] += metrics.get("duration_seconds", 0)
+
+        # Fall back to the module's own duration if the task was not timed
+        self.task_seconds += (
+            task_seconds
+            if task_seconds is not None
+            else metrics.get("duration_seconds", 0)
+        )
+
+        module_stats = self.modules.setdefault(
+            module,
+            {
+                "tasks": 0,
+                "requests": 0,
+                "api_seconds": 0.0,
+                "poll_seconds": 0.0,
+            },
+        )
+        module_stats["tasks"] += 1
+        module_stats["requests"] += metrics.get("requests", 0)
+        module_stats["api_seconds"] += metrics.get("api_seconds", 0)
+        module_stats["poll_seconds"] += poll_seconds
+
+        for endpoint, source in metrics.get("endpoints", {}).items():
+            target = self.endpoints.setdefault(
+                endpoint,
+                {
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "rate_limited": 0,
+                    "latency_seconds_total": 0.0,
+                    "latency_seconds_max": 0.0,
+                    "latency_histogram": {},
+                },
+            )
+
+            for key in (
+                "count",
+                "errors",
+                "retries",
+                "rate_limited",
+                "latency_seconds_total",
+            ):
+                target[key] += source.get(key, 0)
+
+            target["latency_seconds_max"] = max(
+                target["latency_seconds_max"],
+                source.get("latency_seconds_max", 0),
+            )
+
+            merge_histograms(
+                target["latency_histogram"],
+                source.get("latency_histogram", {}),
+            )
+
+    def latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """Returns the estimated request latency percentiles across all endpoints."""
+
+        histogram: Dict[str, int] = {}
+        max_latency = 0.0
+
+        for stats in self.endpoints.values():
+            merge_histograms(histogram, stats["latency_histogram"])
+            max_latency = max(max_latency, stats["latency_seconds_max"])
+
+        return {
+            f"p{v}": histogram_percentile(histogram, v, max_value=max_latency)
+            for v in PERCENTILES
+        }
+
+    def slowest_endpoints(self, limit: int) -> Dict[str, Dict[str, Any]]:
+        """Returns the endpoints that accounted for the most request time."""
+
+        ranked = sorted(
+            self.endpoints.items(),
+            key=lambda v: v[1]["latency_seconds_total"],
+            reverse=True,
+        )
+
+        return {
+            endpoint: {
+                "count": stats["count"],
+                "latency_seconds_total": stats["latency_seconds_total"],
+                "latency_seconds_mean": stats["latency_seconds_total"]
+                / max(stats["count"], 1),
+                "latency_seconds_max": stats["latency_seconds_max"],
+                **{
+                    f"latency_seconds_p{v}": histogram_percentile(
+                        stats["latency_histogram"],
+                        v,
+                        max_value=stats["latency_seconds_max"],
+                    )
+                    for v in PERCENTILES
+                },
+            }
+            for endpoint, stats in ranked[:limit]
+        }
+
+    def to_dict(self, top_endpoints: int) -> Dict[str, Any]:
+        """Returns a JSON-serializable report of the aggregated metrics."""
+
+        return {
+            "tasks": self.tasks,
+            **self.totals,
+            "task_seconds": self.task_seconds,
+            "overhead_seconds": max(
+                self.task_seconds
+                - self.totals["api_seconds"]
+                - self.totals["poll_seconds"],
+                0,
+            ),
+            "latency_seconds": self.latency_percentiles(),
+            "modules": dict(sorted(self.modules.items())),
+            "slowest_endpoints": self.slowest_endpoints(top_endpoints),
+            "endpoints": dict(sorted(self.endpoints.items())),
+        }
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:.2f}s"
+
+
+class CallbackModule(CallbackBase):
+    """
+    Prints a summary of the Linode API requests made by all tasks in a run.
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "linode.cloud.api_stats"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.stats = ApiStats()
+        self._task_started: Dict[Tuple[str, str], float] = {}
+
+    def set_options(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Sets the options of this plugin.
+
+        If enable_metrics is true, this also sets LINODE_ANSIBLE_METRICS in
+        the environment of the controller process if it is not already set.
+        """
+
+        super().set_options(*args, **kwargs)
+
+        if self.get_option("enable_metrics"):
+            # Modules run on the controller inherit its environment
+            os.environ.setdefault("LINODE_ANSIBLE_METRICS", "1")
+
+    @staticmethod
+    def _task_key(host: Any, task: Any) -> Tuple[str, str]:
+        return host.get_name(), task._uuid
+
+    @staticmethod
+    def _iter_metrics(result: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yields the metrics of a task result, including those of loop items."""
+
+        if METRICS_RESULT_KEY in result:
+            yield result[METRICS_RESULT_KEY]
+
+        for item in result.get("results", None) or []:
+            if isinstance(item, dict) and METRICS_RESULT_KEY in item:
+                yield item[METRICS_RESULT_KEY]
+
+    def _record(self, result: Any) -> None:
+        task = result._task
+        started = self._task_started.pop(
+            self._task_key(result._host, task), None
+        )
+
+        metrics = list(self._iter_metrics(result._result))
+        if len(metrics) < 1:
+            return
+
+        module = getattr(task, "resolved_action", None) or task.action
+
+        task_seconds = None
+        if started is not None:
+            # Split the task's wall time between its loop items
+            task_seconds = (time.monotonic() - started) / len(metrics)
+
+        for entry in metrics:
+            self.stats.add(module, entry, task_seconds=task_seconds)
+
+    def v2_runner_on_start(self, host: Any, task: Any) -> None:
+        self._task_started[self._task_key(host, task)] = time.monotonic()
+
+    def v2_runner_on_ok(self, result: Any) -> None:
+        self._record(result)
+
+    def v2_runner_on_failed(
+        self, result: Any, ignore_errors: bool = False
+    ) -> None:
+        self._record(result)
+
+    def v2_playbook_on_stats(self, stats: Any) -> None:
+        if self.stats.tasks < 1:
+            return
+
+        top_endpoints = self.get_option("top_endpoints")
+        report = self.stats.to_dict(top_endpoints)
+
+        self._display.banner("LINODE API STATS")
+
+        self._display.display(
+            f"Linode tasks: {report['tasks']}, "
+            f"API requests: {report['requests']} "
+            f"(errors: {report['errors']}, retries: {report['retries']}, "
+            f"rate limited: {report['rate_limited']})"
+        )
+
+        latency = report["latency_seconds"]
+        self._display.display(
+            "Request latency p50/p95/p99: "
+            + " / ".join(_format_seconds(latency[f"p{v}"]) for v in PERCENTILES)
+        )
+
+        self._display.display(
+            f"Task time: {_format_seconds(report['task_seconds'])} "
+            f"(API: {_format_seconds(report['api_seconds'])}, "
+            f"of which rate limit waits: "
+            f"{_format_seconds(report['rate_limit_wait_seconds'])}; "
+            f"polling: {_format_seconds(report['poll_seconds'])}; "
+            f"Ansible overhead: {_format_seconds(report['overhead_seconds'])})"
+        )
+
+        self._display.display("\nRequests per module:")
+        for module, module_stats in sorted(
+            report["modules"].items(),
+            key=lambda v: v[1]["requests"],
+            reverse=True,
+        ):
+            self._display.display(
+                f"  {module}: {module_stats['requests']} requests "
+                f"in {module_stats['tasks']} tasks "
+                f"(API: {_format_seconds(module_stats['api_seconds'])}, "
+                f"polling: {_format_seconds(module_stats['poll_seconds'])})"
+            )
+
+        self._display.display("\nSlowest endpoints:")
+        for endpoint, endpoint_stats in report["slowest_endpoints"].items():
+            self._display.display(
+                f"  {endpoint}: {endpoint_stats['count']} requests, "
+                f"total {_format_seconds(endpoint_stats['latency_seconds_total'])}, "
+                f"mean {_format_seconds(endpoint_stats['latency_seconds_mean'])}, "
+                f"p95 {_format_seconds(endpoint_stats['latency_seconds_p95'])}, "
+                f"max {_format_seconds(endpoint_stats['latency_seconds_max'])}"
+            )
+
+        report_path = self.get_option("report_path")
+        if report_path is not None:
+            report["generated_at"] = datetime.now(timezone.utc).isoformat()
+
+            with open(report_path, "w", encoding="utf-8") as report_file:
+                json.dump(report, report_file, indent=2)
+
+            self._display.display(f"\nWrote Linode API report to {report_path}")
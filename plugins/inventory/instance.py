@@ -8,16 +8,36 @@ from __future__ import absolute_import, division, print_function
 # pylint: disable=invalid-name
 __metaclass__ = type
 
+import copy
+import ipaddress
 import os
+import time
+from collections import Counter
+from contextlib import closing
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ansible.errors import AnsibleError, AnsibleParserError
 from ansible.module_utils.six import string_types
-from ansible.plugins.inventory import BaseInventoryPlugin, Constructable
+from ansible.plugins.inventory import (
+    BaseInventoryPlugin,
+    Cacheable,
+    Constructable,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
     COLLECTION_USER_AGENT,
 )
-from linode_api4.objects import Instance
+from ansible_collections.linode.cloud.plugins.module_utils.linode_events import (
+    PENDING_EVENT_STATUSES,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    MIN_PAGE_SIZE,
+    construct_api_filter,
+    find_by_values,
+    get_all_paginated,
+    iter_concurrent_results,
+    iter_paginated,
+)
+from linode_api4.objects import Instance, VPCIPAddress
 
 DOCUMENTATION = """
     name: instance
@@ -33,8 +53,15 @@ DOCUMENTATION = """
         - Linode labels are used by default as the hostnames.
         - The default inventory groups are built from groups (deprecated by
           Linode) and not tags.
+        - Instances and their networking information can be cached
+          between runs using an inventory cache plugin.
+        - With C(incremental) enabled, a cached inventory is refreshed from
+          the instance events on the account rather than rebuilt.
+        - The instances of multiple accounts can be added to one inventory
+          using C(api_tokens) and C(child_accounts).
     extends_documentation_fragment:
         - constructed
+        - inventory_cache
     options:
         plugin:
             description: Marks this as an instance of the 'linode' plugin
@@ -45,6 +72,30 @@ DOCUMENTATION = """
             required: true
             env:
                 - name: LINODE_API_TOKEN
+        api_tokens:
+          description:
+            - The personal access tokens of additional accounts to add the
+              instances of to the inventory.
+            - When the inventory contains multiple accounts, each host is
+              given an C(account) variable holding the EUUID of its account,
+              and instances with labels that are shared by instances of
+              other accounts are named C(<label>_<account>).
+            - Each token must have the C(account:read_only) scope so the
+              EUUID of its account can be retrieved.
+          default: []
+          type: list
+          elements: str
+        child_accounts:
+          description:
+            - Add the instances of each child account of the C(api_token)
+              account to the inventory, using a proxy token created for each
+              child account.
+            - Proxy tokens are revoked once the instances of their child
+              account have been retrieved.
+            - "NOTE: Parent/Child related features may not be generally
+              available."
+          default: false
+          type: bool
         regions:
           description: Populate inventory with instances in this region.
           default: []
@@ -57,6 +108,93 @@ DOCUMENTATION = """
           description: Populate inventory with instances with this type.
           default: []
           type: list
+        filters:
+          description:
+            - A list of filters to apply to the instances in the inventory.
+            - An instance passes a filter if its field matches at least one
+              of the filter's values.
+            - All filters, including C(regions), C(tags) and C(types), are
+              applied by the Linode API.
+          default: []
+          type: list
+          elements: dict
+          suboptions:
+            name:
+              description:
+                - The name of the field to filter on.
+                - Valid filterable fields can be found
+                  L(here,https://techdocs.akamai.com/linode-api/reference/get-linode-instances).
+              type: str
+              required: true
+            values:
+              description: A list of values to allow for this field.
+              type: list
+              required: true
+        enrich:
+          description:
+            - Additional information to add to the hostvars of each instance.
+            - C(configs), C(disks) and C(linode_interfaces) are requested for
+              each instance, up to C(max_workers) requests at a time.
+            - C(firewalls) adds the IDs of the firewalls assigned to each
+              instance as C(firewall_ids), using a single listing of the
+              firewalls on the account.
+          default: []
+          type: list
+          elements: str
+          choices: ['configs', 'disks', 'linode_interfaces', 'firewalls']
+        max_workers:
+          description:
+            - The maximum number of concurrent requests made to retrieve
+              the C(enrich) information of instances, and the networking
+              information of instances that can't be built in bulk.
+            - Also the maximum number of accounts retrieved concurrently
+              when the inventory contains multiple accounts.
+          default: 4
+          type: int
+        incremental:
+          description:
+            - Refresh a cached inventory by re-requesting only the instances
+              with C(linode_*) events since the inventory was cached, rather
+              than rebuilding it.
+            - Requires the inventory cache to be enabled. Cached inventories
+              that have expired according to C(cache_timeout) are rebuilt, so
+              C(cache_timeout) should be at least C(incremental_max_age).
+            - Changes that do not create an instance event, such as firewall
+              assignments, are only picked up when the inventory is rebuilt.
+            - Not supported with C(api_tokens) or C(child_accounts).
+          default: false
+          type: bool
+        incremental_max_age:
+          description:
+            - The number of seconds after which a cached inventory is fully
+              rebuilt rather than refreshed when C(incremental) is enabled.
+          default: 86400
+          type: int
+        group_by:
+          description:
+            - Add each instance to a group for each of its values of the
+              given fields, without templating.
+            - Groups are named C(region_<region>), C(type_<type>),
+              C(tag_<tag>), C(status_<status>) and C(vpc_<vpc_id>), the
+              same names as the equivalent C(keyed_groups) with the prefixes
+              C(region), C(type), C(tag), C(status) and C(vpc).
+            - Much faster than C(keyed_groups) for large inventories.
+          default: []
+          type: list
+          elements: str
+          choices: ['region', 'type', 'tags', 'status', 'vpc']
+        bulk_networking_info:
+          description:
+            - Build the C(networking_info) of each instance from account-wide
+              IP address listings rather than requesting it for each instance.
+            - Link-local IPv6 addresses are not included in these listings
+              and are derived from the interface identifier of the SLAAC
+              address.
+            - Instances with private, shared or reserved IPv4 addresses or
+              IPv6 ranges are still requested individually, up to
+              C(max_workers) requests at a time.
+          default: true
+          type: bool
 """
 
 EXAMPLES = """
@@ -71,6 +209,24 @@ regions:
 types:
   - g5-standard-2
 
+# Example with a filter on instance images
+plugin: linode.cloud.instance
+api_token: foobar
+tags:
+  - web
+filters:
+  - name: image
+    values:
+      - linode/ubuntu22.04
+      - linode/ubuntu24.04
+
+# Example with instances grouped by region and tag without templating
+plugin: linode.cloud.instance
+api_token: foobar
+group_by:
+  - region
+  - tags
+
 # Example with keyed_groups, groups, and compose
 plugin: linode.cloud.instance
 api_token: foobar
@@ -84,6 +240,45 @@ groups:
   mailservers: "'mail' in (tags|list)"
 compose:
   ansible_port: 2222
+
+# Example with the configs, disks and firewalls of each instance as hostvars
+plugin: linode.cloud.instance
+api_token: foobar
+enrich:
+  - configs
+  - disks
+  - firewalls
+max_workers: 8
+
+# Example with the instances of a parent account, its child accounts
+# and another account, grouped by account
+plugin: linode.cloud.instance
+api_token: foobar
+api_tokens:
+  - "{{ lookup('ansible.builtin.env', 'OTHER_LINODE_API_TOKEN') }}"
+child_accounts: true
+keyed_groups:
+  - key: account
+    prefix: account
+
+# Example with the instances cached on disk for an hour
+plugin: linode.cloud.instance
+api_token: foobar
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/linode_inventory
+cache_timeout: 3600
+
+# Example with the cached instances refreshed from account events
+# and rebuilt once a day
+plugin: linode.cloud.instance
+api_token: foobar
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/linode_inventory
+cache_timeout: 0
+incremental: true
+incremental_max_age: 86400
 """
 
 
@@ -97,8 +292,21 @@ except ImportError:
     HAS_LINODE = False
 
 
+# The prefix of link-local IPv6 addresses
+LINK_LOCAL_PREFIX = "fe80::/64"
+
+# The group name prefix of each group_by field
+GROUP_BY_PREFIXES = {
+    "region": "region",
+    "type": "type",
+    "tags": "tag",
+    "status": "status",
+    "vpc": "vpc",
+}
+
+
 # pylint: disable=too-many-ancestors
-class InventoryModule(BaseInventoryPlugin, Constructable):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     """Linode instance inventory plugin"""
 
     NAME = "linode.cloud.instance"
@@ -107,6 +315,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         super().__init__()
         self.client: Optional[LinodeClient] = None
         self.instances: List[Instance] = []
+        self.networking_info: Dict[str, Any] = {}
+        self.enrichment: Dict[str, Dict[str, Any]] = {}
+        self.events_cursor: Optional[Dict[str, Any]] = None
+        self.refreshed: Optional[float] = None
+        self.accounts: Dict[str, str] = {}
+        self.hostnames: Dict[str, str] = {}
         self.linode_groups: Set[str] = set()
 
     def _build_client(self) -> None:
@@ -135,76 +349,678 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         self.client = LinodeClient(api_token, user_agent=COLLECTION_USER_AGENT)
 
+    def _is_multi_account(self) -> bool:
+        """Returns whether the inventory contains multiple accounts."""
+        return len(self.get_option("api_tokens") or []) > 0 or bool(
+            self.get_option("child_accounts")
+        )
+
+    def _get_accounts(self) -> List[Dict[str, Any]]:
+        """
+        Returns the accounts to build the inventory from, each with either
+        a client or the EUUID of a child account to create a client for.
+        """
+        accounts: List[Dict[str, Any]] = [{"client": self.client}]
+
+        for api_token in self.get_option("api_tokens") or []:
+            if self.templar.is_template(api_token):
+                api_token = self.templar.template(
+                    variable=api_token, disable_lookups=False
+                )
+
+            accounts.append(
+                {
+                    "client": LinodeClient(
+                        api_token, user_agent=COLLECTION_USER_AGENT
+                    )
+                }
+            )
+
+        if self.get_option("child_accounts"):
+            try:
+                accounts.extend(
+                    {"euuid": entry["euuid"]}
+                    for entry in iter_paginated(
+                        self.client, "/account/child-accounts", None
+                    )
+                )
+            except LinodeApiError as exception:
+                raise AnsibleError(
+                    "Linode client raised: %s" % exception
+                ) from exception
+
+        return accounts
+
+    def _get_account_inventory(
+        self,
+        account: Dict[str, Any],
+        query_options: Tuple[Any, Any, Any, Any],
+        enrich: List[str],
+    ) -> "InventoryModule":
+        """
+        Retrieve the instances of the given account along with their
+        networking and enrich information into a shallow copy of the plugin
+        that uses the account's client.
+        """
+        result = copy.copy(self)
+        token_id = None
+
+        try:
+            if account.get("client") is not None:
+                result.client = account["client"]
+                euuid = result.client.get("/account")["euuid"]
+            else:
+                euuid = account["euuid"]
+                token = self.client.post(
+                    f"/account/child-accounts/{euuid}/token", data={}
+                )
+                token_id = token["id"]
+                result.client = LinodeClient(
+                    token["token"], user_agent=COLLECTION_USER_AGENT
+                )
+        except LinodeApiError as exception:
+            if account.get("client") is not None and exception.status in (
+                401,
+                403,
+            ):
+                raise AnsibleError(
+                    "Failed to retrieve the account of a token in api_tokens; "
+                    "tokens must have the account:read_only scope: %s"
+                    % exception
+                ) from exception
+
+            raise AnsibleError(
+                "Linode client raised: %s" % exception
+            ) from exception
+
+        try:
+            result._get_instances_inventory(*query_options)
+            result._get_networking_info()
+            result._get_enrichment(enrich)
+        finally:
+            if token_id is not None:
+                result._revoke_token(token_id)
+
+        result.accounts = {
+            str(instance.id): euuid for instance in result.instances
+        }
+
+        return result
+
+    def _revoke_token(self, token_id: int) -> None:
+        """
+        Revoke the given proxy token of a child account using the token
+        itself, so proxy tokens do not accumulate on the child account.
+        """
+        try:
+            self.client.delete(f"/profile/tokens/{token_id}")
+        except LinodeApiError as exception:
+            self.display.warning(
+                "Failed to revoke proxy token %s: %s" % (token_id, exception)
+            )
+
+    def _get_accounts_inventory(
+        self, query_options: Tuple[Any, Any, Any, Any], enrich: List[str]
+    ) -> None:
+        """
+        Retrieve the instances of each account in the inventory, up to
+        `max_workers` accounts at a time.
+        """
+        accounts = self._get_accounts()
+
+        self.instances = []
+        self.networking_info = {}
+        self.enrichment = {}
+        self.accounts = {}
+
+        results = iter_concurrent_results(
+            lambda account: self._get_account_inventory(
+                account, query_options, enrich
+            ),
+            accounts,
+            max_workers=self.get_option("max_workers") or 1,
+        )
+
+        with closing(results):
+            for result, exception in results:
+                if exception is not None:
+                    raise exception
+
+                self.instances.extend(result.instances)
+                self.networking_info.update(result.networking_info)
+                self.enrichment.update(result.enrichment)
+                self.accounts.update(result.accounts)
+
     def _get_instances_inventory(
-        self, regions: List[str], types: List[str], tags: List[str]
+        self,
+        regions: List[str],
+        types: List[str],
+        tags: List[str],
+        filters: List[Dict[str, Any]],
     ) -> None:
         """Retrieve Linode instance information from cloud inventory."""
-        filters = self._construct_config_filter(regions)
+        api_filter = self._construct_config_filter(
+            regions, types, tags, filters
+        )
 
         try:
-            if filters:
-                self.instances = self.client.linode.instances(filters)
-            else:
-                self.instances = self.client.linode.instances()
+            # Instances are filtered by the API and streamed page by page
+            self.instances = [
+                Instance(self.client, entry["id"], json=entry)
+                for entry in iter_paginated(
+                    self.client,
+                    "/linode/instances",
+                    api_filter.dct if api_filter is not None else None,
+                )
+            ]
         except LinodeApiError as exception:
             raise AnsibleError(
                 "Linode client raised: %s" % exception
             ) from exception
 
-        if types:
-            self._filter_instance_types(types)
+    def _get_networking_index(
+        self,
+    ) -> Tuple[Dict[int, Dict[str, List[Dict[str, Any]]]], Set[str]]:
+        """
+        Retrieve the IP addresses on the account indexed by instance ID and
+        the addresses IPv6 ranges are routed to, making one paginated sweep
+        of each account-wide listing.
+        """
+        index: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
 
-        if tags:
-            self._filter_instance_tags(tags)
+        def _index_entry(linode_id: int) -> Dict[str, List[Dict[str, Any]]]:
+            return index.setdefault(linode_id, {"ips": [], "vpc": []})
 
-    def _add_groups(self) -> None:
-        """Add Linode instance groups to the dynamic inventory."""
-        self.linode_groups = set(
-            filter(None, [instance.group for instance in self.instances])
-        )
+        for entry in iter_paginated(self.client, "/networking/ips", None):
+            if entry.get("linode_id") is not None:
+                _index_entry(entry["linode_id"])["ips"].append(entry)
 
-        for linode_group in self.linode_groups:
-            self.inventory.add_group(linode_group)
+        for entry in iter_paginated(self.client, "/vpcs/ips", None):
+            # IPv6 VPC ranges are not included in an instance's IPv4 VPC addresses
+            if entry.get("linode_id") is not None and (
+                entry.get("address") is not None
+                or entry.get("address_range") is not None
+            ):
+                _index_entry(entry["linode_id"])["vpc"].append(entry)
 
-    @staticmethod
-    def _construct_list_filter(attr: str, values: List[str]) -> Dict[str, Any]:
-        return {"+or": [{attr: value} for value in values]}
+        routed_addresses = {
+            entry["route_target"]
+            for entry in iter_paginated(
+                self.client, "/networking/ipv6/ranges", None
+            )
+            if entry.get("route_target") is not None
+        }
 
-    def _construct_config_filter(self, regions: List[str]) -> Optional[Filter]:
-        filters = []
+        return index, routed_addresses
 
-        if regions:
-            filters.append(self._construct_list_filter("region", regions))
+    @staticmethod
+    def _networking_info_from_index(
+        instance: Dict[str, Any],
+        index_entry: Dict[str, List[Dict[str, Any]]],
+        routed_addresses: Set[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the networking information of the given instance JSON built
+        from its account-wide IP listing entries, or None if the listings do
+        not cover all of its addresses.
+        """
+        ipv4 = [v for v in index_entry["ips"] if v.get("type") == "ipv4"]
 
-        if len(filters) < 1:
+        # Private and shared addresses are not included in the listings
+        # and reserved addresses are listed separately for each instance
+        if any(v.get("reserved") for v in ipv4) or not set(
+            instance.get("ipv4") or []
+        ).issubset(v["address"] for v in ipv4):
             return None
 
-        return Filter(
-            {
-                "+and": filters,
+        slaac = None
+        link_local = None
+
+        if instance.get("ipv6") is not None:
+            address = instance["ipv6"].split("/")[0]
+
+            # Routed ranges are only fully described per instance
+            if address in routed_addresses:
+                return None
+
+            slaac = next(
+                (
+                    v
+                    for v in index_entry["ips"]
+                    if v.get("type") == "ipv6" and v["address"] == address
+                ),
+                None,
+            )
+
+            if slaac is None:
+                return None
+
+            # Link-local addresses are not listed, but share the interface
+            # identifier of the SLAAC address
+            link_local = {
+                **slaac,
+                "address": str(
+                    ipaddress.IPv6Address(
+                        int(ipaddress.IPv6Network(LINK_LOCAL_PREFIX)[0])
+                        | int(ipaddress.IPv6Address(address)) & (2**64 - 1)
+                    )
+                ),
+                "rdns": None,
+                "public": False,
             }
+
+        return {
+            "ipv4": {
+                "public": ipv4,
+                "private": [],
+                "shared": [],
+                "reserved": [],
+                "vpc": [
+                    VPCIPAddress.from_json(v).dict for v in index_entry["vpc"]
+                ],
+            },
+            "ipv6": {
+                "slaac": slaac,
+                "link_local": link_local,
+                "ranges": [],
+            },
+        }
+
+    def _get_networking_info(
+        self, instances: Optional[List[Instance]] = None
+    ) -> None:
+        """
+        Retrieve the networking information of each inventory instance,
+        or only of the given instances.
+        """
+        index: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        routed_addresses: Set[str] = set()
+
+        if instances is None:
+            instances = self.instances
+
+            # Cache plugins may serialize keys as strings, so IDs are
+            # always stored as strings
+            self.networking_info = {}
+
+            if self.get_option("bulk_networking_info") and len(instances) > 0:
+                try:
+                    index, routed_addresses = self._get_networking_index()
+                except LinodeApiError as exception:
+                    self.display.vvv(
+                        "Failed to list IP addresses on the account, requesting "
+                        "networking info for each instance: %s" % exception
+                    )
+
+        try:
+            # Instances not covered by the listings are requested
+            # individually, up to max_workers at a time
+            fallback = []
+
+            for instance in instances:
+                networking_info = None
+
+                if instance.id in index:
+                    networking_info = self._networking_info_from_index(
+                        instance._raw_json, index[instance.id], routed_addresses
+                    )
+
+                if networking_info is None:
+                    fallback.append(instance)
+                    continue
+
+                self.networking_info[str(instance.id)] = networking_info
+
+            results = iter_concurrent_results(
+                lambda instance: instance.ips.dict,
+                fallback,
+                max_workers=self.get_option("max_workers") or 1,
+            )
+
+            with closing(results):
+                for instance, (result, err) in zip(fallback, results):
+                    if err is not None:
+                        raise err
+
+                    self.networking_info[str(instance.id)] = result
+        except LinodeApiError as exception:
+            raise AnsibleError(
+                "Linode client raised: %s" % exception
+            ) from exception
+
+    def _get_instance_enrichment(self, instance: Instance, field: str) -> Any:
+        """Retrieve a single per-instance enrich field for the given instance."""
+        if field == "linode_interfaces":
+            if instance._raw_json.get("interface_generation") != "linode":
+                return None
+
+            return self.client.get(
+                f"/linode/instances/{instance.id}/interfaces"
+            )
+
+        return get_all_paginated(
+            self.client, f"/linode/instances/{instance.id}/{field}", None
         )
 
-    def _filter_instance_tags(self, valid_tags: List[str]) -> None:
-        self.instances = [
-            instance
-            for instance in self.instances
-            if any(tag in instance.tags for tag in valid_tags)
+    def _get_firewall_ids(self) -> Dict[int, List[int]]:
+        """
+        Retrieve the IDs of the firewalls assigned to each instance,
+        making one paginated sweep of the firewalls on the account.
+        """
+        result: Dict[int, List[int]] = {}
+
+        for firewall in iter_paginated(
+            self.client, "/networking/firewalls", None
+        ):
+            for entity in firewall.get("entities") or []:
+                # Firewalls may also be assigned to an instance's interfaces
+                if entity.get("type") != "linode":
+                    entity = entity.get("parent_entity") or {}
+
+                if entity.get("type") == "linode":
+                    firewall_ids = result.setdefault(entity["id"], [])
+
+                    if firewall["id"] not in firewall_ids:
+                        firewall_ids.append(firewall["id"])
+
+        return result
+
+    def _get_enrichment(
+        self, enrich: List[str], instances: Optional[List[Instance]] = None
+    ) -> None:
+        """
+        Retrieve the enrich information of each inventory instance,
+        or only of the given instances.
+        """
+        if instances is None:
+            instances = self.instances
+            self.enrichment = {}
+
+        for instance in instances:
+            self.enrichment[str(instance.id)] = {}
+
+        if len(instances) < 1:
+            return
+
+        try:
+            if "firewalls" in enrich:
+                firewall_ids = self._get_firewall_ids()
+
+                for instance in instances:
+                    self.enrichment[str(instance.id)]["firewall_ids"] = (
+                        firewall_ids.get(instance.id, [])
+                    )
+
+            # The remaining fields can only be requested per instance
+            calls = [
+                (instance, field)
+                for instance in instances
+                for field in ("configs", "disks", "linode_interfaces")
+                if field in enrich
+            ]
+
+            results = iter_concurrent_results(
+                lambda call: self._get_instance_enrichment(*call),
+                calls,
+                max_workers=self.get_option("max_workers") or 1,
+            )
+
+            with closing(results):
+                for (instance, field), (result, exception) in zip(
+                    calls, results
+                ):
+                    if exception is not None:
+                        raise exception
+
+                    self.enrichment[str(instance.id)][field] = result
+        except LinodeApiError as exception:
+            raise AnsibleError(
+                "Linode client raised: %s" % exception
+            ) from exception
+
+    def _list_instance_events(
+        self,
+        cursor: Optional[Dict[str, Any]],
+        num_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the instance events on the account after the given
+        position, newest first.
+        """
+        filters: Dict[str, Any] = {
+            "entity.type": "linode",
+            "+order_by": "id",
+            "+order": "desc",
+        }
+
+        if cursor is not None:
+            filters["created"] = {"+gte": cursor["created"]}
+
+        return [
+            event
+            for event in get_all_paginated(
+                self.client, "/account/events", filters, num_results=num_results
+            )
+            if cursor is None or event["id"] > cursor["id"]
         ]
 
-    def _filter_instance_types(self, valid_types: List[str]) -> None:
+    @staticmethod
+    def _get_events_cursor(
+        events: List[Dict[str, Any]], cursor: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the position to list instance events after on the next
+        refresh, given the events listed after the current position.
+        Events that have not finished are listed again on the next refresh,
+        since their progress does not create new events.
+        """
+        pending = [
+            event
+            for event in events
+            if event.get("status") in PENDING_EVENT_STATUSES
+        ]
+
+        if len(pending) > 0:
+            oldest = min(pending, key=lambda event: event["id"])
+            return {"id": oldest["id"] - 1, "created": oldest["created"]}
+
+        if len(events) > 0:
+            newest = max(events, key=lambda event: event["id"])
+            return {"id": newest["id"], "created": newest["created"]}
+
+        return cursor
+
+    def _refresh_instances(
+        self, config_data: Dict[str, Any], enrich: List[str]
+    ) -> None:
+        """
+        Re-request the cached instances that have instance events since the
+        inventory was cached, along with their networking and enrich
+        information.
+        """
+        try:
+            events = self._list_instance_events(self.events_cursor)
+
+            instance_ids = {
+                event["entity"]["id"]
+                for event in events
+                if event.get("action", "").startswith("linode_")
+                and event.get("entity") is not None
+            }
+
+            api_filter = self._construct_config_filter(
+                *self._get_query_options(config_data)
+            )
+
+            # Instances that were deleted or no longer match the
+            # configured filters are not returned
+            refreshed = {
+                entry["id"]: Instance(self.client, entry["id"], json=entry)
+                for entry in find_by_values(
+                    self.client,
+                    "/linode/instances",
+                    "id",
+                    sorted(instance_ids),
+                    filters=(
+                        {"+and": api_filter.dct["+and"]}
+                        if api_filter is not None
+                        else None
+                    ),
+                )
+            }
+        except LinodeApiError as exception:
+            raise AnsibleError(
+                "Linode client raised: %s" % exception
+            ) from exception
+
+        cached_ids = {instance.id for instance in self.instances}
+
         self.instances = [
-            instance
+            refreshed.get(instance.id, instance)
             for instance in self.instances
-            if instance.type.id in valid_types
+            if instance.id not in instance_ids or instance.id in refreshed
+        ] + [v for k, v in sorted(refreshed.items()) if k not in cached_ids]
+
+        for instance_id in instance_ids - set(refreshed):
+            self.networking_info.pop(str(instance_id), None)
+            self.enrichment.pop(str(instance_id), None)
+
+        self._get_networking_info(list(refreshed.values()))
+        self._get_enrichment(enrich, list(refreshed.values()))
+
+        self.events_cursor = self._get_events_cursor(events, self.events_cursor)
+
+    def _build_source_data(
+        self, config_data: Dict[str, Any], enrich: List[str], incremental: bool
+    ) -> None:
+        """Retrieve all the API data the inventory is built from."""
+        self.events_cursor = None
+        self.refreshed = None
+
+        if incremental:
+            # The position is read first so that changes made while the
+            # inventory is built are applied on the next refresh
+            try:
+                self.events_cursor = self._get_events_cursor(
+                    self._list_instance_events(None, num_results=MIN_PAGE_SIZE),
+                    None,
+                )
+            except LinodeApiError as exception:
+                raise AnsibleError(
+                    "Linode client raised: %s" % exception
+                ) from exception
+
+            self.refreshed = time.time()
+
+        if self._is_multi_account():
+            self._get_accounts_inventory(
+                self._get_query_options(config_data), enrich
+            )
+            return
+
+        self.accounts = {}
+        self._get_instances_inventory(*self._get_query_options(config_data))
+        self._get_networking_info()
+        self._get_enrichment(enrich)
+
+    def _get_source_data(self, enrich: List[str]) -> Dict[str, Any]:
+        """Returns the API data the inventory is built from for caching."""
+        return {
+            "instances": [instance._raw_json for instance in self.instances],
+            "networking_info": self.networking_info,
+            "enrich": enrich,
+            "enrichment": self.enrichment,
+            "events_cursor": self.events_cursor,
+            "refreshed": self.refreshed,
+            "accounts": self.accounts,
+        }
+
+    def _load_source_data(
+        self, source_data: Dict[str, Any], enrich: List[str]
+    ) -> bool:
+        """
+        Loads the API data the inventory is built from out of the cache.
+        Returns False if the cached data does not include all requested
+        enrich information.
+        """
+        if not set(enrich).issubset(source_data.get("enrich") or []):
+            return False
+
+        self.instances = [
+            Instance(self.client, entry["id"], json=entry)
+            for entry in source_data["instances"]
         ]
+        self.networking_info = source_data["networking_info"]
+        self.enrichment = source_data["enrichment"]
+        self.events_cursor = source_data.get("events_cursor")
+        self.refreshed = source_data.get("refreshed")
+        self.accounts = source_data.get("accounts") or {}
+
+        return True
+
+    def _get_hostnames(self) -> None:
+        """
+        Get the inventory hostname of each instance. Labels are only unique
+        within an account, so labels shared by instances of multiple
+        accounts are suffixed with the account EUUID.
+        """
+        label_counts = Counter(instance.label for instance in self.instances)
+
+        self.hostnames = {
+            str(instance.id): (
+                instance.label
+                if label_counts[instance.label] < 2
+                else "%s_%s"
+                % (instance.label, self.accounts.get(str(instance.id)))
+            )
+            for instance in self.instances
+        }
+
+    def _add_groups(self) -> None:
+        """Add Linode instance groups to the dynamic inventory."""
+        self.linode_groups = set(
+            filter(None, [instance.group for instance in self.instances])
+        )
+
+        for linode_group in self.linode_groups:
+            self.inventory.add_group(linode_group)
+
+    @staticmethod
+    def _construct_config_filter(
+        regions: List[str],
+        types: List[str],
+        tags: List[str],
+        filters: List[Dict[str, Any]],
+    ) -> Optional[Filter]:
+        """
+        Compiles the query options into a single API filter that requires
+        every option to match at least one of its values.
+        """
+        value_filters = [
+            {"name": name, "values": values}
+            for name, values in (
+                ("region", regions),
+                ("type", types),
+                ("tags", tags),
+            )
+            if values
+        ] + filters
+
+        if len(value_filters) < 1:
+            return None
+
+        return Filter(
+            construct_api_filter({"filters": value_filters, "order": "asc"})
+        )
 
     def _add_instances_to_groups(self) -> None:
         """Add instance names to their dynamic inventory groups."""
         for instance in self.instances:
-            self.inventory.add_host(instance.label, group=instance.group)
+            hostname = self.hostnames[str(instance.id)]
+
+            self.inventory.add_host(hostname, group=instance.group)
             self.inventory.set_variable(
-                instance.label, "ansible_host", instance.ipv4[0]
+                hostname, "ansible_host", instance.ipv4[0]
             )
 
     def _add_hostvars_for_instances(self) -> None:
@@ -212,13 +1028,63 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         for instance in self.instances:
             hostvars = {}
             hostvars.update(instance._raw_json)
-            hostvars["networking_info"] = instance.ips.dict
+            hostvars["networking_info"] = self.networking_info[str(instance.id)]
+            hostvars.update(self.enrichment.get(str(instance.id)) or {})
+
+            if str(instance.id) in self.accounts:
+                hostvars["account"] = self.accounts[str(instance.id)]
 
             for hostvar_key in hostvars:
                 self.inventory.set_variable(
-                    instance.label, hostvar_key, hostvars[hostvar_key]
+                    self.hostnames[str(instance.id)],
+                    hostvar_key,
+                    hostvars[hostvar_key],
                 )
 
+    def _get_group_by_values(self, instance: Instance, field: str) -> List[Any]:
+        """Returns the values of the given group_by field for an instance."""
+        if field == "tags":
+            return instance._raw_json.get("tags") or []
+
+        if field == "vpc":
+            networking_info = self.networking_info[str(instance.id)]
+
+            return list(
+                dict.fromkeys(
+                    v["vpc_id"]
+                    for v in networking_info["ipv4"].get("vpc") or []
+                    if v.get("vpc_id") is not None
+                )
+            )
+
+        value = instance._raw_json.get(field)
+
+        return [value] if value is not None else []
+
+    def _add_instances_to_group_by_groups(self) -> None:
+        """
+        Add instances to the groups of their group_by field values, bucketing
+        the instance data directly rather than rendering templates.
+        """
+        group_names: Dict[str, str] = {}
+
+        for field in self.get_option("group_by") or []:
+            prefix = GROUP_BY_PREFIXES[field]
+
+            for instance in self.instances:
+                hostname = self.hostnames[str(instance.id)]
+
+                for value in self._get_group_by_values(instance, field):
+                    raw_name = "%s_%s" % (prefix, value)
+
+                    # Group names are only sanitized once per group
+                    if raw_name not in group_names:
+                        group_names[raw_name] = self.inventory.add_group(
+                            self._sanitize_group_name(raw_name)
+                        )
+
+                    self.inventory.add_host(hostname, group_names[raw_name])
+
     @staticmethod
     def _validate_option(
         name: str, desired_type: Any, option_value: Any
@@ -240,7 +1106,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
     def _get_query_options(
         self, config_data: Dict[str, Any]
-    ) -> Tuple[Any, Any, Any]:
+    ) -> Tuple[Any, Any, Any, Any]:
         """Get user specified query options from the configuration."""
         options = {
             "regions": {
@@ -252,6 +1118,10 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
                 "value": config_data.get("types", []),
             },
             "tags": {"type_to_be": list, "value": config_data.get("tags", [])},
+            "filters": {
+                "type_to_be": list,
+                "value": config_data.get("filters", []),
+            },
         }
 
         for name in options:
@@ -262,8 +1132,24 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
         regions = options["regions"]["value"]
         types = options["types"]["value"]
         tags = options["tags"]["value"]
+        filters = options["filters"]["value"]
+
+        for filter_opt in filters:
+            if (
+                not isinstance(filter_opt, dict)
+                or "name" not in filter_opt
+                or "values" not in filter_opt
+            ):
+                raise AnsibleParserError(
+                    "Each entry of the option filters (%s) must define "
+                    "a name and values" % filter_opt
+                )
+
+            filter_opt["values"] = self._validate_option(
+                "filters.values", list, filter_opt["values"]
+            )
 
-        return regions, types, tags
+        return regions, types, tags, filters
 
     def verify_file(self, path: str) -> bool:
         """Verify the Linode configuration file."""
@@ -289,30 +1175,88 @@ class InventoryModule(BaseInventoryPlugin, Constructable):
 
         strict = self.get_option("strict")
 
-        regions, types, tags = self._get_query_options(config_data)
-        self._get_instances_inventory(regions, types, tags)
+        cache_key = self.get_cache_key(path)
+
+        # The cache is only read when the user enables it and Ansible
+        # is not refreshing it (e.g. --flush-cache or refresh_inventory)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
 
+        enrich = self.get_option("enrich") or []
+        incremental = self.get_option("incremental") and user_cache_setting
+        cache_loaded = False
+
+        if incremental and self._is_multi_account():
+            raise AnsibleError(
+                "The incremental option is not supported with the "
+                "api_tokens or child_accounts options"
+            )
+
+        if attempt_to_read_cache:
+            try:
+                cache_loaded = self._load_source_data(
+                    self._cache[cache_key], enrich
+                )
+            except KeyError:
+                pass
+
+            # Inventories cached without incremental state are rebuilt
+            if (
+                cache_loaded
+                and incremental
+                and (
+                    self.refreshed is None
+                    or time.time() - self.refreshed
+                    > self.get_option("incremental_max_age")
+                )
+            ):
+                cache_loaded = False
+
+            cache_needs_update = not cache_loaded
+
+            if cache_loaded and incremental:
+                self._refresh_instances(config_data, enrich)
+                cache_needs_update = True
+
+        if not cache_loaded:
+            self._build_source_data(config_data, enrich, incremental)
+
+        if cache_needs_update:
+            self._cache[cache_key] = self._get_source_data(enrich)
+
+        self._get_hostnames()
         self._add_groups()
         self._add_instances_to_groups()
         self._add_hostvars_for_instances()
+        self._add_instances_to_group_by_groups()
+
+        groups = self.get_option("groups")
+        keyed_groups = self.get_option("keyed_groups")
+        compose = self.get_option("compose")
+
+        # Host variables are only collected if there is anything to template
+        if not (groups or keyed_groups or compose):
+            return
 
         for instance in self.instances:
-            variables = self.inventory.get_host(instance.label).get_vars()
+            hostname = self.hostnames[str(instance.id)]
+            variables = self.inventory.get_host(hostname).get_vars()
             self._add_host_to_composed_groups(
-                self.get_option("groups"),
+                groups,
                 variables,
-                instance.label,
+                hostname,
                 strict=strict,
             )
             self._add_host_to_keyed_groups(
-                self.get_option("keyed_groups"),
+                keyed_groups,
                 variables,
-                instance.label,
+                hostname,
                 strict=strict,
             )
             self._set_composite_vars(
-                self.get_option("compose"),
+                compose,
                 variables,
-                instance.label,
+                hostname,
                 strict=strict,
             )
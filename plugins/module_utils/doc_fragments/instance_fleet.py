@@ -0,0 +1,82 @@
+"""Documentation fragments for the instance_fleet module"""
+
+specdoc_examples = ['''
+- name: Converge a fleet of Linode instances.
+  linode.cloud.instance_fleet:
+    instances:
+      - label: web-0
+        type: g6-standard-1
+        region: us-east
+        image: linode/ubuntu22.04
+        root_pass: verysecurepassword!!!
+        tags:
+          - web
+      - label: web-1
+        type: g6-standard-1
+        region: us-east
+        image: linode/ubuntu22.04
+        root_pass: verysecurepassword!!!
+        tags:
+          - web
+      - label: web-old
+        state: absent''', '''
+- name: Create an instance for each host in the web group, 16 at a time.
+  linode.cloud.instance_fleet:
+    instances: "{{ groups['web'] | map('extract', hostvars, 'linode_instance') | list }}"
+    instance_concurrency: 16''']
+
+result_instances_samples = ['''[
+  {
+    "actions": [
+      "Created instance web-0"
+    ],
+    "changed": true,
+    "configs": [
+      {
+        "id": 23456,
+        "label": "My Ubuntu 22.04 LTS Profile",
+        "root_device": "/dev/sda"
+      }
+    ],
+    "disks": [
+      {
+        "filesystem": "ext4",
+        "id": 25674,
+        "label": "Ubuntu 22.04 Disk",
+        "size": 48640,
+        "status": "ready"
+      }
+    ],
+    "instance": {
+      "id": 123,
+      "label": "web-0",
+      "region": "us-east",
+      "status": "running",
+      "tags": [
+        "web"
+      ],
+      "type": "g6-standard-1"
+    },
+    "label": "web-0",
+    "linode_interfaces": null,
+    "networking": {
+      "ipv4": {
+        "public": [
+          {
+            "address": "97.107.143.141",
+            "linode_id": 123,
+            "public": true,
+            "type": "ipv4"
+          }
+        ]
+      }
+    }
+  },
+  {
+    "actions": [],
+    "changed": false,
+    "failed": true,
+    "label": "web-1",
+    "msg": "Error from Linode API: 400: Region is not available"
+  }
+]''']
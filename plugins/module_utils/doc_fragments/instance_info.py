@@ -6,4 +6,11 @@ specdoc_examples = ['''
     label: 'my-instance' ''', '''
 - name: Get info about an instance by id
   linode.cloud.instance_info:
-    id: 12345''']
+    id: 12345''', '''
+- name: Get info about many instances by label
+  linode.cloud.instance_info:
+    labels:
+      - my-instance-1
+      - my-instance-2
+    include:
+      - disks''']
@@ -0,0 +1,68 @@
+"""Documentation fragments for the wait_for module"""
+
+specdoc_examples = [
+    """
+- name: Wait for an instance, a volume and a database to be ready
+  linode.cloud.wait_for:
+    entities:
+      - type: instance
+        id: 12345
+      - type: volume
+        id: 23456
+      - type: database
+        id: 34567
+    wait_timeout: 1800""",
+    """
+- name: Wait for the nodes of two LKE clusters to be ready
+  linode.cloud.wait_for:
+    entities:
+      - type: lke_cluster
+        id: 45678
+      - type: lke_cluster
+        id: 56789""",
+    """
+- name: Wait for an instance to be powered off
+  linode.cloud.wait_for:
+    entities:
+      - type: instance
+        id: 12345
+        status: offline""",
+]
+
+result_entities_samples = ["""[
+  {
+    "entity": {
+      "id": 12345,
+      "label": "my-linode",
+      "region": "us-east",
+      "status": "running",
+      "type": "g6-standard-1"
+    },
+    "id": 12345,
+    "ready": true,
+    "status": "running",
+    "type": "instance"
+  },
+  {
+    "entity": {
+      "id": 23456,
+      "label": "my-volume",
+      "region": "us-east",
+      "size": 20,
+      "status": "active"
+    },
+    "id": 23456,
+    "ready": true,
+    "status": "active",
+    "type": "volume"
+  }
+]"""]
+
+result_pending_samples = ["""[
+  {
+    "id": 34567,
+    "ready": false,
+    "status": "provisioning",
+    "type": "database"
+  }
+]"""]
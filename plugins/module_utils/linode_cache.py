@@ -0,0 +1,673 @@
+"""This module contains an opt-in on-disk HTTP response cache for Linode API clients."""
+
+from __future__ import absolute_import, division, print_function
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Responses for these API paths (and any paths nested under them) are never
+# cached because they are polled for changes (e.g. by event pollers) or
+# contain secrets that must not be written to disk.
+UNCACHED_PATHS = (
+    "/account/events",
+    # Database root credentials, e.g. /databases/mysql/instances/1/credentials
+    "/credentials",
+    # LKE kubeconfigs, e.g. /lke/clusters/1/kubeconfig
+    "/kubeconfig",
+    "/profile/tokens",
+    "/profile/apps",
+    "/account/oauth-clients",
+    "/object-storage/keys",
+)
+
+# Response headers that are persisted alongside cached response bodies
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Warning")
+
+CACHE_LOCK_FILE = ".lock"
+CACHE_ENTRY_SUFFIX = ".json"
+
+# The request memo for the currently running module, if enabled
+# pylint: disable-next=invalid-name
+_active_request_memo: Optional["RequestMemo"] = None
+
+# The response cache for the currently running module, if enabled
+# pylint: disable-next=invalid-name
+_active_response_cache: Optional["ResponseCache"] = None
+
+# The number of open module-wide suspensions of the memo and the cache.
+# These also apply to a memo or cache created while a suspension is open,
+# e.g. when a module first uses its client inside a polling loop.
+# pylint: disable-next=invalid-name
+_request_memo_suspensions = 0
+# pylint: disable-next=invalid-name
+_response_cache_suspensions = 0
+_suspensions_lock = threading.Lock()
+
+
+def hash_token(token: str) -> str:
+    """Returns a short, non-reversible identifier for the given API token."""
+
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def locked_json_state(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the JSON object stored in the given file while holding an
+    exclusive lock on it, and persists any changes made to it.
+    This is used for state that is shared between processes.
+    """
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    with os.fdopen(fd, "r+", encoding="utf-8") as state_file:
+        fcntl.flock(state_file, fcntl.LOCK_EX)
+
+        try:
+            try:
+                state = json.loads(state_file.read() or "{}")
+            except ValueError:
+                state = {}
+
+            yield state
+
+            state_file.seek(0)
+            state_file.truncate()
+            json.dump(state, state_file)
+            state_file.flush()
+        finally:
+            fcntl.flock(state_file, fcntl.LOCK_UN)
+
+
+def paths_related(path_a: str, path_b: str) -> bool:
+    """
+    Returns whether one of the given URL paths is equal to or nested under the other.
+    This is used to determine which cached resources are affected by a write.
+    """
+
+    segments_a = [v for v in path_a.split("/") if v != ""]
+    segments_b = [v for v in path_b.split("/") if v != ""]
+
+    shortest = min(len(segments_a), len(segments_b))
+
+    return segments_a[:shortest] == segments_b[:shortest]
+
+
+def is_uncached_path(path: str) -> bool:
+    """Returns whether responses for the given URL path must never be cached."""
+
+    normalized = "/" + "/".join(v for v in path.split("/") if v != "")
+
+    return any(
+        normalized.endswith(v) or f"{v}/" in normalized for v in UNCACHED_PATHS
+    )
+
+
+def request_token(request: PreparedRequest) -> str:
+    """Returns the bearer token used to authenticate the given request."""
+
+    return (request.headers.get("Authorization") or "").replace(
+        "Bearer ", "", 1
+    )
+
+
+def build_response(request: PreparedRequest, entry: Dict[str, Any]) -> Response:
+    """Reconstructs a response object from a cache entry."""
+
+    response = Response()
+    response.status_code = entry["status"]
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = entry["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+
+    return response
+
+
+class ResponseCache:
+    """
+    A size-bounded on-disk store of GET responses that can be safely shared
+    between multiple processes.
+
+    Entries are keyed by a hash of the API token, URL and filter header,
+    expire after `ttl` seconds, and are evicted in least-recently-used order
+    once the total size of the cache exceeds `max_size` bytes.
+    """
+
+    def __init__(self, path: str, ttl: float = 60, max_size: int = 64 << 20):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._suspended = 0
+        self._suspended_lock = threading.Lock()
+
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ResponseCache":
+        # API objects reference the client and are sometimes deep-copied;
+        # copies should keep suspending the cache of the current module run.
+        return self
+
+    @property
+    def suspended(self) -> bool:
+        """Whether cached entries must be revalidated before they are used."""
+
+        return self._suspended > 0 or _response_cache_suspensions > 0
+
+    @contextlib.contextmanager
+    def suspend(self) -> Iterator[None]:
+        """Revalidates every cached entry for the duration of the context, e.g. while polling."""
+
+        with self._suspended_lock:
+            self._suspended += 1
+
+        try:
+            yield
+        finally:
+            with self._suspended_lock:
+                self._suspended -= 1
+
+    @staticmethod
+    def key(token: str, url: str, filters: Optional[str] = None) -> str:
+        """Returns the cache key for the given request attributes."""
+
+        digest = hashlib.sha256(
+            "\n".join([token, url, filters or ""]).encode("utf-8")
+        ).hexdigest()
+
+        # The token hash prefix allows entries to be invalidated per token
+        return f"{hash_token(token)}-{digest}"
+
+    @contextlib.contextmanager
+    def _lock(self, exclusive: bool = False) -> Iterator[None]:
+        """Holds an advisory lock on the cache directory across processes."""
+
+        with open(
+            os.path.join(self.path, CACHE_LOCK_FILE), "a", encoding="utf-8"
+        ) as lock_file:
+            fcntl.flock(
+                lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key + CACHE_ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached entry for the given key, if one exists."""
+
+        entry_path = self._entry_path(key)
+
+        with self._lock():
+            try:
+                with open(entry_path, "r", encoding="utf-8") as entry_file:
+                    entry = json.load(entry_file)
+
+                # Track recent use for LRU eviction
+                os.utime(entry_path)
+            except (OSError, ValueError):
+                return None
+
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Returns whether the given entry can be used without revalidation."""
+
+        return (
+            not self.suspended
+            and time.time() - entry.get("stored_at", 0) < self.ttl
+        )
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Stores the given entry and evicts old entries if necessary."""
+
+        entry["stored_at"] = time.time()
+
+        with self._lock(exclusive=True):
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                    json.dump(entry, tmp_file)
+
+                os.replace(tmp_path, self._entry_path(key))
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+                return
+
+            self._evict()
+
+    def invalidate(self, token: str, path: str) -> None:
+        """Removes all entries for the given token that are related to the given path."""
+
+        prefix = hash_token(token) + "-"
+
+        with self._lock(exclusive=True):
+            for name in os.listdir(self.path):
+                if not name.startswith(prefix):
+                    continue
+
+                entry_path = os.path.join(self.path, name)
+
+                try:
+                    with open(entry_path, "r", encoding="utf-8") as entry_file:
+                        entry_url = json.load(entry_file).get("url", "")
+
+                    if paths_related(urlparse(entry_url).path, path):
+                        os.remove(entry_path)
+                except (OSError, ValueError):
+                    continue
+
+    def _evict(self) -> None:
+        """Removes least-recently-used entries until the cache fits its size limit."""
+
+        entries = []
+
+        for name in os.listdir(self.path):
+            if not name.endswith(CACHE_ENTRY_SUFFIX):
+                continue
+
+            with contextlib.suppress(OSError):
+                stat = os.stat(os.path.join(self.path, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(self.path, name))
+                total_size -= size
+
+
+class CachingAdapter(BaseAdapter):
+    """
+    A transport adapter that serves GET requests from a ResponseCache and
+    revalidates stale entries using conditional requests.
+
+    All other requests are passed through to the wrapped adapter and
+    invalidate any cached entries for the affected resource.
+    """
+
+    def __init__(self, cache: ResponseCache, adapter: BaseAdapter):
+        super().__init__()
+
+        self.cache = cache
+        self.adapter = adapter
+
+    @staticmethod
+    def _is_cacheable(request: PreparedRequest) -> bool:
+        return request.method == "GET" and not is_uncached_path(
+            urlparse(request.url).path
+        )
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        kwargs = {
+            "stream": stream,
+            "timeout": timeout,
+            "verify": verify,
+            "cert": cert,
+            "proxies": proxies,
+        }
+        token = request_token(request)
+
+        if not self._is_cacheable(request):
+            response = self.adapter.send(request, **kwargs)
+
+            if request.method != "GET" and response.status_code < 400:
+                self.cache.invalidate(token, urlparse(request.url).path)
+
+            return response
+
+        key = self.cache.key(
+            token, request.url, request.headers.get("X-Filter")
+        )
+        entry = self.cache.get(key)
+
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return build_response(request, entry)
+
+            # Revalidate the stale entry rather than downloading it again
+            if entry["headers"].get("ETag") is not None:
+                request.headers["If-None-Match"] = entry["headers"]["ETag"]
+
+            if entry["headers"].get("Last-Modified") is not None:
+                request.headers["If-Modified-Since"] = entry["headers"][
+                    "Last-Modified"
+                ]
+
+        response = self.adapter.send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.put(key, entry)
+            return build_response(request, entry)
+
+        if response.status_code == 200:
+            self.cache.put(
+                key,
+                {
+                    "url": request.url,
+                    "status": response.status_code,
+                    "headers": {
+                        k: response.headers[k]
+                        for k in CACHED_HEADERS
+                        if k in response.headers
+                    },
+                    "body": response.text,
+                },
+            )
+
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_response_cache(session: Any, cache: ResponseCache) -> None:
+    """Wraps the transport adapters of the given session with a CachingAdapter."""
+
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix, CachingAdapter(cache, session.get_adapter(prefix))
+        )
+
+
+class RequestMemo:
+    """
+    An in-memory store of GET responses that lives for a single module run.
+
+    Entries are kept for the whole run and dropped when a related resource
+    path is written to or the memo is invalidated. Polling loops suspend
+    the memo so that they always observe fresh data.
+
+    Identical requests made concurrently are coalesced: while one thread
+    fetches a response, other threads requesting it wait for it to be stored.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+
+        self._entries: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._in_flight: Dict[
+            Tuple[str, Optional[str]], Tuple[int, threading.Event]
+        ] = {}
+        self._suspended = 0
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "RequestMemo":
+        # API objects reference the client and are sometimes deep-copied;
+        # copies should keep sharing the memo of the current module run.
+        return self
+
+    @property
+    def suspended(self) -> bool:
+        """Whether responses are currently neither stored nor reused."""
+
+        return self._suspended > 0 or _request_memo_suspensions > 0
+
+    @contextlib.contextmanager
+    def suspend(self) -> Iterator[None]:
+        """Bypasses and clears the memo for the duration of the context, e.g. while polling."""
+
+        with self._lock:
+            self._suspended += 1
+            self._entries.clear()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._suspended -= 1
+
+    def get(
+        self, url: str, filters: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored entry for the given request, if it is still valid.
+
+        If no entry is returned, the caller is expected to fetch the response
+        and `put(...)` or `release(...)` it. Until then, other threads
+        requesting the same entry wait for it.
+        """
+
+        key = (url, filters)
+
+        while True:
+            with self._lock:
+                if self.suspended:
+                    return None
+
+                owner, in_flight = self._in_flight.get(key, (None, None))
+
+                if in_flight is None or owner == threading.get_ident():
+                    entry = self._entries.get(key)
+
+                    if entry is not None:
+                        self.hits += 1
+                        return entry
+
+                    if in_flight is None:
+                        self._in_flight[key] = (
+                            threading.get_ident(),
+                            threading.Event(),
+                        )
+
+                    return None
+
+            in_flight.wait()
+
+    def put(
+        self, url: str, filters: Optional[str], entry: Dict[str, Any]
+    ) -> None:
+        """Stores the given entry unless the memo is suspended."""
+
+        with self._lock:
+            if not self.suspended:
+                self._entries[(url, filters)] = entry
+
+        self.release(url, filters)
+
+    def release(self, url: str, filters: Optional[str] = None) -> None:
+        """Wakes up threads waiting for the given request to be fetched."""
+
+        with self._lock:
+            _, in_flight = self._in_flight.pop((url, filters), (None, None))
+
+        if in_flight is not None:
+            in_flight.set()
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drops all entries related to the given URL path,
+        or every entry if no path is given.
+        """
+
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+
+            for key in [
+                k
+                for k in self._entries
+                if paths_related(urlparse(k[0]).path, path)
+            ]:
+                del self._entries[key]
+
+
+class MemoizingAdapter(BaseAdapter):
+    """
+    A transport adapter that reuses identical GET responses from a RequestMemo.
+
+    PUT and DELETE requests invalidate entries for the affected resource path.
+    POST requests clear the memo entirely because actions (e.g. attaching a
+    volume) can change resources under unrelated paths.
+    """
+
+    def __init__(self, memo: RequestMemo, adapter: BaseAdapter):
+        super().__init__()
+
+        self.memo = memo
+        self.adapter = adapter
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        kwargs = {
+            "stream": stream,
+            "timeout": timeout,
+            "verify": verify,
+            "cert": cert,
+            "proxies": proxies,
+        }
+        path = urlparse(request.url).path
+
+        if request.method != "GET":
+            self.memo.invalidate(None if request.method == "POST" else path)
+            return self.adapter.send(request, **kwargs)
+
+        if stream or is_uncached_path(path):
+            return self.adapter.send(request, **kwargs)
+
+        filters = request.headers.get("X-Filter")
+
+        entry = self.memo.get(request.url, filters)
+        if entry is not None:
+            return build_response(request, entry)
+
+        try:
+            response = self.adapter.send(request, **kwargs)
+
+            if response.status_code == 200:
+                self.memo.put(
+                    request.url,
+                    filters,
+                    {
+                        "status": response.status_code,
+                        "headers": dict(response.headers),
+                        "body": response.text,
+                    },
+                )
+        finally:
+            # Let any waiting threads make the request themselves
+            self.memo.release(request.url, filters)
+
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_request_memo(session: Any, memo: RequestMemo) -> None:
+    """Wraps the transport adapters of the given session with a MemoizingAdapter."""
+
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix, MemoizingAdapter(memo, session.get_adapter(prefix))
+        )
+
+
+def set_active_request_memo(memo: Optional[RequestMemo]) -> None:
+    """Sets the memo that module-wide helpers invalidate and suspend."""
+
+    global _active_request_memo  # pylint: disable=global-statement
+    _active_request_memo = memo
+
+
+def invalidate_request_memo(path: Optional[str] = None) -> None:
+    """Drops memoized responses for the given path (or all responses), if enabled."""
+
+    if _active_request_memo is not None:
+        _active_request_memo.invalidate(path)
+
+
+@contextlib.contextmanager
+def suspend_request_memo() -> Iterator[None]:
+    """Bypasses the active memo, if any, for the duration of the context."""
+
+    global _request_memo_suspensions  # pylint: disable=global-statement
+
+    with _suspensions_lock:
+        _request_memo_suspensions += 1
+
+    try:
+        if _active_request_memo is None:
+            yield
+            return
+
+        with _active_request_memo.suspend():
+            yield
+    finally:
+        with _suspensions_lock:
+            _request_memo_suspensions -= 1
+
+
+def set_active_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Sets the response cache that module-wide helpers suspend."""
+
+    global _active_response_cache  # pylint: disable=global-statement
+    _active_response_cache = cache
+
+
+@contextlib.contextmanager
+def suspend_response_cache() -> Iterator[None]:
+    """
+    Revalidates entries of the active response cache, if any, for the
+    duration of the context.
+    """
+
+    global _response_cache_suspensions  # pylint: disable=global-statement
+
+    with _suspensions_lock:
+        _response_cache_suspensions += 1
+
+    try:
+        if _active_response_cache is None:
+            yield
+            return
+
+        with _active_response_cache.suspend():
+            yield
+    finally:
+        with _suspensions_lock:
+            _response_cache_suspensions -= 1
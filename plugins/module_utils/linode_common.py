@@ -3,12 +3,35 @@
 from __future__ import absolute_import, division, print_function
 
 import traceback
-from typing import Any, Type
+from typing import Any, Dict, Optional, Type
 
 import polling
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    RequestMemo,
+    ResponseCache,
+    mount_request_memo,
+    mount_response_cache,
+    set_active_request_memo,
+    set_active_response_cache,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_events import (
+    AdaptivePollingGroup,
+    EventSpool,
+    SharedPollingGroup,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
     format_generic_error,
 )
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    METRICS_RESULT_KEY,
+    ApiMetrics,
+    mount_metrics,
+    set_active_metrics,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_rate_limit import (
+    RateLimiter,
+    mount_retry_adapter,
+)
 
 try:
     from ansible.module_utils.ansible_release import (
@@ -82,6 +105,54 @@ LINODE_COMMON_ARGS = {
         "description": "A path to a custom certificate authority for using alternate APIs.",
         "fallback": (env_fallback, ["LINODE_CA"]),
     },
+    "metrics": {
+        "type": "bool",
+        "description": "Whether to return metrics about the API requests made "
+        "by this task under the `_linode_metrics` key.",
+        "doc_hide": True,
+        "fallback": (env_fallback, ["LINODE_ANSIBLE_METRICS"]),
+        "default": False,
+    },
+    "rate_limit": {
+        "type": "bool",
+        "description": "Whether to share an API rate limit budget "
+        "with all other processes using the same token.",
+        "fallback": (env_fallback, ["LINODE_RATE_LIMIT"]),
+        "default": True,
+    },
+    "share_event_polling": {
+        "type": "bool",
+        "description": "Whether to wait for account events through a single "
+        "events feed shared with all other processes using the same token.",
+        "fallback": (env_fallback, ["LINODE_SHARE_EVENT_POLLING"]),
+        "default": True,
+    },
+    "memoize_requests": {
+        "type": "bool",
+        "description": "Whether to reuse identical GET responses "
+        "within a single module run.",
+        "fallback": (env_fallback, ["LINODE_MEMOIZE_REQUESTS"]),
+        "default": True,
+    },
+    "cache_dir": {
+        "type": "str",
+        "description": "A directory to cache GET responses in across module runs. "
+        "Caching is disabled if undefined.",
+        "fallback": (env_fallback, ["LINODE_CACHE_DIR"]),
+    },
+    "cache_ttl": {
+        "type": "float",
+        "description": "The number of seconds a cached response can be used "
+        "before it must be revalidated.",
+        "fallback": (env_fallback, ["LINODE_CACHE_TTL"]),
+        "default": 60,
+    },
+    "cache_max_size": {
+        "type": "int",
+        "description": "The maximum size of the response cache in megabytes.",
+        "fallback": (env_fallback, ["LINODE_CACHE_MAX_SIZE"]),
+        "default": 64,
+    },
 }
 
 RESOURCE_NAMES = (
@@ -101,13 +172,19 @@ RESOURCE_NAMES = (
 )
 
 MAX_RETRIES = 5
-RETRY_INTERVAL_SECONDS = float(4)
+RETRY_BACKOFF_SECONDS = float(1)
 RETRY_STATUSES = {408, 429, 502}
 
+MB_TO_BYTES = 1024 * 1024
+
 
 class LinodeModuleBase:
     """A base for all Linode resource modules."""
 
+    _metrics: Optional[ApiMetrics] = None
+    _rate_limiter: Optional[RateLimiter] = None
+    _request_memo: Optional[RequestMemo] = None
+
     def __init__(
         self,
         module_arg_spec: dict,
@@ -149,6 +226,10 @@ class LinodeModuleBase:
             timeout_seconds=timeout_param
         )
 
+        if self.module.params.get("metrics"):
+            self._metrics = ApiMetrics()
+            set_active_metrics(self._metrics)
+
         if not HAS_LINODE:
             self.fail(
                 msg=missing_required_lib("linode_api4"),
@@ -168,7 +249,7 @@ class LinodeModuleBase:
             except Exception as err:
                 self.fail(msg=format_generic_error(err, self.module._verbosity))
 
-            self.module.exit_json(**res)
+            self.module.exit_json(**self._with_metrics(res))
 
     def fail(self, msg: str, **kwargs: Any) -> None:
         """
@@ -178,7 +259,21 @@ class LinodeModuleBase:
         :param kwargs: Any key=value pairs
         :return: None
         """
-        self.module.fail_json(msg=msg, **kwargs)
+        self.module.fail_json(msg=msg, **self._with_metrics(kwargs))
+
+    def _with_metrics(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the given result with the API metrics for this task, if enabled."""
+
+        if self._metrics is None:
+            return result
+
+        if self._rate_limiter is not None:
+            self._metrics.rate_limit_wait_seconds = self._rate_limiter.waited
+
+        if self._request_memo is not None:
+            self._metrics.memo_hits = self._request_memo.hits
+
+        return {**result, METRICS_RESULT_KEY: self._metrics.to_dict()}
 
     def warn(self, msg: str) -> None:
         """
@@ -246,10 +341,58 @@ class LinodeModuleBase:
                 api_token,
                 base_url=f"{api_url}{api_version}",
                 user_agent=user_agent,
-                retry_rate_limit_interval=RETRY_INTERVAL_SECONDS,
+                retry_rate_limit_interval=RETRY_BACKOFF_SECONDS,
                 retry_max=MAX_RETRIES,
                 retry_statuses=RETRY_STATUSES,
                 ca_path=ca_path,
             )
 
+            if self.module.params.get("rate_limit", True):
+                self._rate_limiter = RateLimiter(api_token)
+
+            # Retries use jittered exponential backoff and, unless disabled,
+            # are coordinated with all other processes using this token.
+            mount_retry_adapter(
+                self._client.session,
+                max_retries=MAX_RETRIES,
+                retry_statuses=RETRY_STATUSES,
+                backoff_seconds=RETRY_BACKOFF_SECONDS,
+                limiter=self._rate_limiter,
+            )
+
+            # Event pollers back off between polls, and those of all
+            # processes using this token share a single poll of the events
+            # feed unless disabled.
+            if self.module.params.get("share_event_polling", True):
+                self._client.polling = SharedPollingGroup(
+                    self._client, EventSpool(self._client, api_token)
+                )
+            else:
+                self._client.polling = AdaptivePollingGroup(self._client)
+
+            cache_dir = self.module.params.get("cache_dir")
+            if cache_dir is not None:
+                cache_max_size_mb = self.module.params.get("cache_max_size", 64)
+
+                response_cache = ResponseCache(
+                    cache_dir,
+                    ttl=self.module.params.get("cache_ttl", 60),
+                    max_size=cache_max_size_mb * MB_TO_BYTES,
+                )
+                set_active_response_cache(response_cache)
+
+                mount_response_cache(self._client.session, response_cache)
+
+            # Metrics are recorded outside of the cache so cache hits are counted
+            if self._metrics is not None:
+                mount_metrics(self._client.session, self._metrics)
+
+            # Memoized responses never leave the process, so they are only
+            # reflected in the metrics as memo hits.
+            if self.module.params.get("memoize_requests", True):
+                self._request_memo = RequestMemo()
+                set_active_request_memo(self._request_memo)
+
+                mount_request_memo(self._client.session, self._request_memo)
+
         return self._client
@@ -5,6 +5,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+from contextlib import closing
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union
@@ -17,6 +18,10 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
 )
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    DEFAULT_RESULT_CONCURRENCY,
+    iter_concurrent_results,
+)
 from ansible_specdoc.objects import (
     FieldType,
     SpecDocMeta,
@@ -77,6 +82,10 @@ class InfoModuleAttr:
 
         description (Optional[str]): An optional description of this attribute.
                                      If not specified, a description will be generated.
+        batch_get (Optional[Callable]): A function to retrieve the resources whose
+                                        `name` field matches any of a list of values.
+                                        If specified, the resources can be resolved
+                                        in a single task using the `batch_name` option.
     """
 
     name: str
@@ -85,6 +94,19 @@ class InfoModuleAttr:
     get: Callable[[LinodeClient, Dict[str, Any]], Any]
 
     description: Optional[str] = None
+    batch_get: Optional[
+        Callable[[LinodeClient, List[Any], Dict[str, Any]], List[Any]]
+    ] = None
+
+    @property
+    def batch_name(self) -> str:
+        """The name of the option used to resolve many resources by this attribute."""
+        return f"{self.name}s"
+
+    @property
+    def batch_field_name(self) -> str:
+        """The name of the field batch results for this attribute are returned in."""
+        return f"results_by_{self.name}"
 
 
 @dataclass
@@ -115,6 +137,51 @@ class InfoModuleResult:
     ] = None
 
 
+def result_selection_options(
+    display_name: str, field_names: List[str]
+) -> Dict[str, SpecField]:
+    """
+    Returns the `include` and `exclude` options that select which of the given
+    results related to a resource are fetched.
+    """
+
+    return {
+        "include": SpecField(
+            type=FieldType.list,
+            element_type=FieldType.string,
+            choices=field_names,
+            conflicts_with=["exclude"],
+            description=[
+                f"The results related to the {display_name} to fetch and return.",
+                "If undefined, all related results are returned.",
+            ],
+        ),
+        "exclude": SpecField(
+            type=FieldType.list,
+            element_type=FieldType.string,
+            choices=field_names,
+            conflicts_with=["include"],
+            description=[
+                f"The results related to the {display_name} to skip.",
+                "Skipped results are returned as null.",
+            ],
+        ),
+    }
+
+
+def is_result_selected(field_name: str, params: Dict[str, Any]) -> bool:
+    """
+    Returns whether the given related result is selected by the
+    `include` and `exclude` options in the given module params.
+    """
+
+    include = params.get("include")
+    if include is not None:
+        return field_name in include
+
+    return field_name not in (params.get("exclude") or [])
+
+
 class InfoModule(LinodeModuleBase):
     """A common module for listing API resources given a set of filters."""
 
@@ -173,9 +240,115 @@ class InfoModule(LinodeModuleBase):
             ]
         }
 
+    @property
+    def batch_attributes(self) -> List[InfoModuleAttr]:
+        """Returns the attributes that can resolve many resources at once."""
+        return [v for v in self.attributes if v.batch_get is not None]
+
+    @property
+    def _attribute_names(self) -> List[str]:
+        """Returns the names of all options that select the primary result."""
+        return [v.name for v in self.attributes] + [
+            v.batch_name for v in self.batch_attributes
+        ]
+
+    def _get_secondary_results(
+        self, primary_results: List[Any], params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the selected secondary results for each of the given
+        primary results.
+        """
+
+        selected_results = [
+            v
+            for v in self.secondary_results
+            if is_result_selected(v.field_name, params)
+        ]
+
+        calls = [
+            (i, primary_result, attr)
+            for i, primary_result in enumerate(primary_results)
+            for attr in selected_results
+        ]
+
+        results: List[Dict[str, Any]] = [
+            {v.field_name: None for v in self.secondary_results}
+            for _ in primary_results
+        ]
+
+        # Secondary results only depend on their primary result,
+        # so they can be fetched concurrently
+        secondary_results = iter_concurrent_results(
+            lambda call: call[2].get(self.client, call[1], params),
+            calls,
+            max_workers=params.get("result_concurrency") or 1,
+        )
+
+        with closing(secondary_results):
+            for (i, _, attr), (secondary_result, exception) in zip(
+                calls, secondary_results
+            ):
+                if exception is not None:
+                    self.fail(
+                        msg=f"Failed to get {attr.display_name} for "
+                        f"{self.primary_result.display_name}: {exception}"
+                    )
+                results[i][attr.field_name] = secondary_result
+
+        return results
+
+    def _exec_batch(
+        self, attr: InfoModuleAttr, values: List[Any], params: Dict[str, Any]
+    ) -> dict:
+        """Resolves the resources matching any of the given attribute values."""
+
+        values = list(dict.fromkeys(values))
+
+        try:
+            entries = attr.batch_get(self.client, values, params)
+        except Exception as exception:
+            self.fail(
+                msg=f"Failed to get {self.primary_result.display_name} "
+                f"with {attr.display_name}s: {exception}"
+            )
+
+        primary_results: Dict[Any, Any] = {}
+        for entry in entries:
+            primary_results.setdefault(entry.get(attr.name), entry)
+
+        missing = [str(v) for v in values if v not in primary_results]
+        if len(missing) > 0:
+            self.fail(
+                msg=f"Failed to get {self.primary_result.display_name} "
+                f"with {attr.display_name} {', '.join(missing)}: "
+                "No matching resource found."
+            )
+
+        primary_results = [primary_results[v] for v in values]
+
+        self.results[attr.batch_field_name] = {
+            value: {
+                self.primary_result.field_name: primary_result,
+                **secondary_results,
+            }
+            for value, primary_result, secondary_results in zip(
+                values,
+                primary_results,
+                self._get_secondary_results(primary_results, params),
+            )
+        }
+
+        return self.results
+
     def exec_module(self, **kwargs: Any) -> Optional[dict]:
         """Entrypoint for info modules."""
 
+        for attr in self.batch_attributes:
+            values = kwargs.get(attr.batch_name)
+            if values is not None:
+                return self._exec_batch(attr, values, kwargs)
+
         primary_result = None
 
         # Get the primary result using the attr get functions
@@ -207,17 +380,9 @@ class InfoModule(LinodeModuleBase):
             raise ValueError("Expected a result; got None")
 
         self.results[self.primary_result.field_name] = primary_result
-
-        # Pass primary result into secondary result get functions
-        for attr in self.secondary_results:
-            try:
-                secondary_result = attr.get(self.client, primary_result, kwargs)
-            except Exception as exception:
-                self.fail(
-                    msg=f"Failed to get {attr.display_name} for "
-                    f"{self.primary_result.display_name}: {exception}"
-                )
-            self.results[attr.field_name] = secondary_result
+        self.results.update(
+            self._get_secondary_results([primary_result], kwargs)[0]
+        )
 
         return self.results
 
@@ -248,19 +413,54 @@ class InfoModule(LinodeModuleBase):
 
                 options[param.name] = param_spec
 
+        attribute_names = self._attribute_names
+
         # Add attrs to spec
         for attr in self.attributes:
             options[attr.name] = SpecField(
                 type=attr.type,
-                required=len(self.attributes) == 1,
-                conflicts_with=[
-                    v.name for v in self.attributes if v.name != attr.name
-                ],
+                required=len(attribute_names) == 1,
+                conflicts_with=[v for v in attribute_names if v != attr.name],
                 description=attr.description
                 or f"The {attr.display_name} of the "
                 f"{self.primary_result.display_name} to resolve.",
             )
 
+        for attr in self.batch_attributes:
+            options[attr.batch_name] = SpecField(
+                type=FieldType.list,
+                element_type=attr.type,
+                conflicts_with=[
+                    v for v in attribute_names if v != attr.batch_name
+                ],
+                description=[
+                    f"The {attr.display_name}s of the "
+                    f"{self.primary_result.display_name}s to resolve.",
+                    f"Results are returned in `{attr.batch_field_name}`.",
+                ],
+            )
+
+        if len(self.secondary_results) > 0:
+            options.update(
+                result_selection_options(
+                    self.primary_result.display_name,
+                    [v.field_name for v in self.secondary_results],
+                )
+            )
+
+        # Batch lookups fetch the related results of many resources at once
+        if len(self.secondary_results) > 1 or (
+            len(self.secondary_results) > 0 and len(self.batch_attributes) > 0
+        ):
+            options["result_concurrency"] = SpecField(
+                type=FieldType.integer,
+                description=[
+                    "The maximum number of results related to the "
+                    f"{self.primary_result.display_name} to fetch concurrently.",
+                ],
+                default=DEFAULT_RESULT_CONCURRENCY,
+            )
+
         # Add responses to spec
         responses = {
             v.field_name: SpecReturnValue(
@@ -272,6 +472,14 @@ class InfoModule(LinodeModuleBase):
             for v in [self.primary_result] + self.secondary_results
         }
 
+        for attr in self.batch_attributes:
+            responses[attr.batch_field_name] = SpecReturnValue(
+                description=f"The returned results for each "
+                f"{self.primary_result.display_name} resolved by "
+                f"`{attr.batch_name}`, keyed by {attr.display_name}.",
+                type=FieldType.dict,
+            )
+
         description = self.description
 
         if self.requires_beta and BETA_DISCLAIMER not in description:
@@ -300,12 +508,17 @@ class InfoModule(LinodeModuleBase):
             "mutually_exclusive": [],
         }
 
-        attribute_names = [v.name for v in self.attributes]
+        attribute_names = self._attribute_names
 
         if len(attribute_names) > 0:
             base_module_args["required_one_of"].append(attribute_names)
             base_module_args["mutually_exclusive"].append(attribute_names)
 
+        if len(self.secondary_results) > 0:
+            base_module_args["mutually_exclusive"].append(
+                ["include", "exclude"]
+            )
+
         for entry in self.param_groups:
             if InfoModuleParamGroupPolicy.EXACTLY_ONE_OF in entry.policies:
                 param_names = [param.name for param in entry.params]
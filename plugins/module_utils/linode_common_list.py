@@ -15,10 +15,13 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     BETA_DISCLAIMER,
     global_authors,
     global_requirements,
+    pagination_samples,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    DEFAULT_PAGE_CONCURRENCY,
+    PaginationStats,
     construct_api_filter,
-    get_all_paginated,
+    iter_paginated,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -124,12 +127,21 @@ class ListModule(
             docs = self.custom_field_resolver(self.module.params)
             self.endpoint_template = docs["endpoint_template"]
 
-        self.results[self.result_field_name] = get_all_paginated(
-            self.client,
-            self.endpoint_template.format(**self.module.params),
-            filter_dict,
-            num_results=self.module.params["count"],
+        pagination_stats = PaginationStats()
+
+        self.results[self.result_field_name] = list(
+            iter_paginated(
+                self.client,
+                self.endpoint_template.format(**self.module.params),
+                filter_dict,
+                num_results=self.module.params["count"],
+                page_concurrency=self.module.params["page_concurrency"],
+                page_size=self.module.params["page_size"],
+                stats=pagination_stats,
+            )
         )
+        self.results["pagination"] = pagination_stats.to_dict()
+
         return self.results
 
     @property
@@ -200,6 +212,24 @@ class ListModule(
                 ),
             }
 
+        options["page_concurrency"] = SpecField(
+            type=FieldType.integer,
+            description=[
+                f"The maximum number of pages of {self.result_display_name} "
+                "to fetch concurrently.",
+            ],
+            default=DEFAULT_PAGE_CONCURRENCY,
+        )
+        options["page_size"] = SpecField(
+            type=FieldType.integer,
+            description=[
+                f"The maximum number of {self.result_display_name} "
+                "to request per page.",
+                "If undefined, the largest page size accepted by the API "
+                "will be used.",
+            ],
+        )
+
         options.update(self.custom_options)
 
         # Add the parent fields to the spec
@@ -230,7 +260,13 @@ class ListModule(
                     type=FieldType.list,
                     elements=FieldType.dict,
                     sample=self.result_samples,
-                )
+                ),
+                "pagination": SpecReturnValue(
+                    description="Information about the pages requested "
+                    f"to list the {self.result_display_name}.",
+                    type=FieldType.dict,
+                    sample=pagination_samples,
+                ),
             },
         )
 
@@ -19,3 +19,8 @@ BETA_DISCLAIMER = (
     "WARNING! This module makes use of beta endpoints and requires the C(api_version) "
     "field be explicitly set to C(v4beta)."
 )
+
+pagination_samples = ["""{
+  "pages_fetched": 3,
+  "page_size": 500
+}"""]
@@ -0,0 +1,430 @@
+"""This module contains adaptive and shared account event pollers."""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    hash_token,
+    locked_json_state,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    ProgressPollStrategy,
+    find_by_values,
+    get_all_paginated,
+    poll_condition,
+)
+from linode_api4 import Event, LinodeClient
+from linode_api4.groups import PollingGroup
+from linode_api4.polling import EventError, EventPoller, TimeoutContext
+
+# The statuses of events that may progress without a new event being created
+PENDING_EVENT_STATUSES = ("scheduled", "started")
+
+# The statuses of events that will not progress any further
+FINISHED_EVENT_STATUSES = ("finished", "notification")
+
+# The maximum number of settled events kept in a spool
+EVENT_SPOOL_MAX_EVENTS = 1000
+
+# Spools that have not been refreshed for this many seconds only request
+# the most recent events rather than every event since their last refresh
+EVENT_SPOOL_MAX_IDLE_SECONDS = 60
+
+
+class EventSpool:
+    """
+    A spool of recent account events for a single API token.
+
+    The spool is stored in a file that is locked on every access, so all
+    processes using the same token (e.g. Ansible forks) wait on a single
+    copy of the events feed. Whichever process holds the lock when the spool
+    is older than its polling interval refreshes it from the API, so
+    concurrent waiters make one events request per interval between them.
+    """
+
+    def __init__(
+        self,
+        client: LinodeClient,
+        token: str,
+        state_dir: Optional[str] = None,
+    ):
+        self.client = client
+        self.path = os.path.join(
+            state_dir or tempfile.gettempdir(),
+            # Spools are never shared between APIs
+            "ansible-linode-events-%s.json"
+            % hash_token(f"{client.base_url} {token}"),
+        )
+
+    @staticmethod
+    def _merge(state: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+        """Merges the given events into the spool state."""
+
+        spooled = state.setdefault("events", {})
+
+        for event in events:
+            spooled[str(event["id"])] = event
+
+        settled = sorted(
+            (
+                v
+                for v in spooled.values()
+                if v.get("status") not in PENDING_EVENT_STATUSES
+            ),
+            key=lambda v: v["id"],
+        )
+
+        # Pending events are kept until they settle
+        for event in settled[:-EVENT_SPOOL_MAX_EVENTS]:
+            del spooled[str(event["id"])]
+
+    def _refresh(self, state: Dict[str, Any]) -> None:
+        """Requests the events created since the last refresh and any pending events."""
+
+        spooled = list(state.get("events", {}).values())
+        filters: Dict[str, Any] = {"+order_by": "created", "+order": "desc"}
+
+        # Events added by track() may be newer than events that have not
+        # been listed yet, so only listings advance the swept watermark
+        if (
+            state.get("swept") is not None
+            and time.time() - state.get("refreshed", 0)
+            < EVENT_SPOOL_MAX_IDLE_SECONDS
+        ):
+            filters["created"] = {"+gte": state["swept"]}
+            events = get_all_paginated(self.client, "/account/events", filters)
+        else:
+            events = self.client.get("/account/events", filters=filters)["data"]
+
+        if len(events) > 0:
+            state["swept"] = max(
+                state.get("swept") or "", *(v["created"] for v in events)
+            )
+
+        # Progress on pending events does not create new events,
+        # so they are requested by ID until they settle
+        listed = {v["id"] for v in events}
+        pending = [
+            v["id"]
+            for v in spooled
+            if v.get("status") in PENDING_EVENT_STATUSES
+            and v["id"] not in listed
+        ]
+
+        if len(pending) > 0:
+            events += find_by_values(
+                self.client, "/account/events", "id", pending
+            )
+
+        self._merge(state, events)
+
+    def track(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Adds the given events to the spool, so pending events are refreshed
+        until they settle.
+        """
+
+        with locked_json_state(self.path) as state:
+            self._merge(state, events)
+
+    def events(
+        self, max_age: float, since: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the spooled events, refreshing them if the spool is older
+        than the given number of seconds or was last refreshed before the
+        given time.
+        """
+
+        with locked_json_state(self.path) as state:
+            refreshed = state.get("refreshed", 0)
+
+            if time.time() - refreshed >= max_age or (
+                since is not None and refreshed < since
+            ):
+                self._refresh(state)
+                state["refreshed"] = time.time()
+
+            return list(state.get("events", {}).values())
+
+
+def _event_matches(
+    event: Dict[str, Any],
+    entity_type: str,
+    entity_id: Optional[int],
+    action: Optional[str] = None,
+) -> bool:
+    """Returns whether the given event is for the given entity and action."""
+
+    entity = event.get("entity") or {}
+
+    return (
+        entity.get("type") == entity_type
+        and entity.get("id") == entity_id
+        and (action is None or event.get("action") == action)
+    )
+
+
+class AdaptiveEventPoller(EventPoller):
+    """
+    An EventPoller that backs off between polls and, while waiting for an
+    event to finish, times its polls by the event's reported progress.
+    """
+
+    def _poll_events(
+        self, interval: float, since: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the events of this poller's entity and action, oldest first,
+        as of no earlier than the given time.
+        """
+
+        return self._client.get(
+            "/account/events", filters=self._build_filter()
+        )["data"]
+
+    def _poll_event(self, event_id: int, interval: float) -> Dict[str, Any]:
+        """Returns the current state of the given event."""
+
+        return self._client.get(f"/account/events/{event_id}")
+
+    def wait_for_next_event(
+        self, timeout: int = 240, interval: int = 5
+    ) -> Event:
+        result_event: Dict[str, Any] = {}
+
+        # Events created before the wait started must be polled for
+        started = time.time()
+
+        def poll_func() -> bool:
+            new_event = self._check_has_new_event(
+                self._poll_events(interval, started)
+            )
+
+            if new_event is None:
+                return False
+
+            nonlocal result_event
+            result_event = new_event
+            self._attempt_merge_event_into_cache(new_event)
+
+            return True
+
+        poll_condition(poll_func, interval, timeout)
+
+        return Event(self._client, result_event["id"], json=result_event)
+
+    def wait_for_next_event_finished(
+        self, timeout: int = 240, interval: int = 5
+    ) -> Event:
+        timeout_ctx = TimeoutContext(timeout_seconds=timeout)
+        event = self.wait_for_next_event(
+            timeout_ctx.seconds_remaining, interval
+        )
+
+        return self.wait_for_event_finished(
+            event, timeout_ctx.seconds_remaining, interval
+        )
+
+    def wait_for_event_finished(
+        self, event: Event, timeout: int = 240, interval: int = 5
+    ) -> Event:
+        """
+        Waits for the given event, previously returned by
+        wait_for_next_event, to finish.
+        """
+
+        strategy = ProgressPollStrategy(interval)
+        result_event = event._raw_json
+
+        def check_finished() -> bool:
+            if result_event.get("status") == "failed":
+                raise EventError(event.id, result_event.get("message"))
+
+            strategy.observe_progress(result_event.get("percent_complete"))
+
+            return result_event.get("status") in FINISHED_EVENT_STATUSES
+
+        # The event may have finished before it was found
+        if check_finished():
+            return event
+
+        def poll_func() -> bool:
+            nonlocal result_event
+            result_event = self._poll_event(event.id, interval)
+
+            return check_finished()
+
+        poll_condition(poll_func, interval, timeout, strategy=strategy)
+
+        return Event(self._client, event.id, json=result_event)
+
+
+class SharedEventPoller(AdaptiveEventPoller):
+    """
+    An AdaptiveEventPoller that waits for events through an EventSpool
+    rather than polling the events endpoint on its own.
+    """
+
+    def __init__(
+        self,
+        client: LinodeClient,
+        spool: EventSpool,
+        entity_type: str,
+        action: str,
+        entity_id: Optional[int] = None,
+    ):
+        super().__init__(client, entity_type, action)
+
+        self._spool = spool
+        self._entity_id = entity_id
+
+        # Events up to this ID are never considered new
+        self._last_event_id = 0
+
+        if entity_id is None:
+            return
+
+        # The newest matching events are the ones a new event could be
+        # mistaken for
+        events = client.get(
+            "/account/events",
+            filters={**self._build_filter(), "+order": "desc"},
+        )["data"]
+
+        self._previous_event_cache = {v["id"]: v for v in events}
+        self._last_event_id = max(self._previous_event_cache.keys(), default=0)
+
+        spool.track(events)
+
+    def _check_has_new_event(
+        self, events: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        return super()._check_has_new_event(
+            [v for v in events if v["id"] > self._last_event_id]
+        )
+
+    def _poll_events(
+        self, interval: float, since: float
+    ) -> List[Dict[str, Any]]:
+        return sorted(
+            (
+                v
+                for v in self._spool.events(interval, since=since)
+                if _event_matches(
+                    v, self._entity_type, self._entity_id, self._action
+                )
+            ),
+            key=lambda v: (v["created"], v["id"]),
+        )
+
+    def _poll_event(self, event_id: int, interval: float) -> Dict[str, Any]:
+        result = next(
+            (v for v in self._spool.events(interval) if v["id"] == event_id),
+            None,
+        )
+
+        # The event may have been dropped from the spool once settled
+        if result is None:
+            result = super()._poll_event(event_id, interval)
+
+        return result
+
+
+class AdaptivePollingGroup(PollingGroup):
+    """
+    A PollingGroup whose pollers back off between polls.
+    """
+
+    def event_poller_create(
+        self,
+        entity_type: str,
+        action: str,
+        entity_id: Optional[int] = None,
+    ) -> AdaptiveEventPoller:
+        return AdaptiveEventPoller(
+            self.client, entity_type, action, entity_id=entity_id
+        )
+
+    def _entity_events(
+        self, entity_type: str, entity_id: int
+    ) -> List[Dict[str, Any]]:
+        """Returns the newest events of the given entity."""
+
+        return self.client.get(
+            "/account/events",
+            filters={
+                "+order": "desc",
+                "+order_by": "created",
+                "entity.id": entity_id,
+                "entity.type": entity_type,
+            },
+        )["data"]
+
+    def wait_for_entity_free(
+        self,
+        entity_type: str,
+        entity_id: int,
+        timeout: int = 240,
+        interval: int = 5,
+    ) -> None:
+        def poll_func() -> bool:
+            return all(
+                v["status"] not in PENDING_EVENT_STATUSES
+                for v in self._entity_events(entity_type, entity_id)
+            )
+
+        poll_condition(poll_func, interval, timeout)
+
+
+class SharedPollingGroup(AdaptivePollingGroup):
+    """
+    An AdaptivePollingGroup whose pollers wait for events through an
+    EventSpool shared with all other processes using the same token.
+    """
+
+    def __init__(self, client: LinodeClient, spool: EventSpool):
+        super().__init__(client)
+
+        self.spool = spool
+
+    def event_poller_create(
+        self,
+        entity_type: str,
+        action: str,
+        entity_id: Optional[int] = None,
+    ) -> SharedEventPoller:
+        return SharedEventPoller(
+            self.client, self.spool, entity_type, action, entity_id=entity_id
+        )
+
+    def wait_for_entity_free(
+        self,
+        entity_type: str,
+        entity_id: int,
+        timeout: int = 240,
+        interval: int = 5,
+    ) -> None:
+        # The newest events of the entity are requested once so pending
+        # events from before the spool was started are tracked by it
+        events = self._entity_events(entity_type, entity_id)
+
+        if all(v["status"] not in PENDING_EVENT_STATUSES for v in events):
+            return
+
+        self.spool.track(events)
+
+        started = time.time()
+
+        def poll_func() -> bool:
+            return all(
+                v.get("status") not in PENDING_EVENT_STATUSES
+                for v in self.spool.events(interval, since=started)
+                if _event_matches(v, entity_type, entity_id)
+            )
+
+        poll_condition(poll_func, interval, timeout)
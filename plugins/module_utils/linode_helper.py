@@ -1,12 +1,22 @@
 """This module contains helper functions for various Linode modules."""
 
+import itertools
+import math
+import random
+import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -18,6 +28,13 @@ from typing import (
 
 import linode_api4
 import polling
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    suspend_request_memo,
+    suspend_response_cache,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    record_poll_sleep,
+)
 from linode_api4 import (
     ApiError,
     JSONObject,
@@ -401,46 +418,313 @@ def construct_api_filter(params: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+DEFAULT_PAGE_CONCURRENCY = 4
+
+DEFAULT_RESULT_CONCURRENCY = 4
+
+MIN_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+
+# Page sizes to fall back to when an endpoint rejects a larger page size
+PAGE_SIZE_FALLBACKS = (500, 100, 25)
+
+# The largest page size accepted by each endpoint, learned from API rejections
+_endpoint_max_page_sizes: Dict[str, int] = {}
+
+
+@dataclass
+class PaginationStats:
+    """
+    Contains information about the requests made to paginate an API endpoint.
+    """
+
+    pages_fetched: int = 0
+    page_size: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-compatible representation of these stats."""
+
+        return {
+            "pages_fetched": self.pages_fetched,
+            "page_size": self.page_size,
+        }
+
+
+def resolve_page_size(
+    num_results: Optional[int] = None, max_page_size: int = MAX_PAGE_SIZE
+) -> int:
+    """
+    Returns the page size that retrieves the given number of results in as few
+    requests as possible without exceeding the given maximum page size.
+    """
+
+    max_page_size = max(min(max_page_size, MAX_PAGE_SIZE), MIN_PAGE_SIZE)
+
+    if num_results is None:
+        return max_page_size
+
+    num_pages = max(math.ceil(num_results / max_page_size), 1)
+
+    # Spread the results evenly across the minimum number of pages
+    return max(
+        min(math.ceil(num_results / num_pages), max_page_size), MIN_PAGE_SIZE
+    )
+
+
+def _is_page_size_error(err: ApiError) -> bool:
+    """Returns whether the given API error was caused by the requested page size."""
+
+    if err.status != 400 or not isinstance(err.json, dict):
+        return False
+
+    return any(
+        isinstance(entry, dict) and entry.get("field") == "page_size"
+        for entry in err.json.get("errors") or []
+    )
+
+
+def _get_page(
+    client: LinodeClient,
+    endpoint: str,
+    filters: Optional[Dict[str, Any]],
+    page: int,
+    page_size: int,
+) -> Dict[str, Any]:
+    """Returns a single validated page response for the given API endpoint."""
+    response = client.get(
+        endpoint + "?page={}&page_size={}".format(page, page_size),
+        filters=filters,
+    )
+
+    if "data" not in response or "page" not in response:
+        raise Exception("Invalid list response")
+
+    return response
+
+
+def _get_first_page(
+    client: LinodeClient,
+    endpoint: str,
+    filters: Optional[Dict[str, Any]],
+    num_results: Optional[int],
+    max_page_size: int,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Returns the first page of the given API endpoint and the page size it was
+    retrieved with, falling back to smaller page sizes if the endpoint rejects
+    the preferred one.
+    """
+
+    max_page_size = min(
+        max_page_size, _endpoint_max_page_sizes.get(endpoint, MAX_PAGE_SIZE)
+    )
+
+    while True:
+        page_size = resolve_page_size(num_results, max_page_size)
+
+        try:
+            return (
+                _get_page(client, endpoint, filters, 1, page_size),
+                page_size,
+            )
+        except ApiError as err:
+            fallback = next(
+                (v for v in PAGE_SIZE_FALLBACKS if v < page_size), None
+            )
+
+            if fallback is None or not _is_page_size_error(err):
+                raise err
+
+            _endpoint_max_page_sizes[endpoint] = fallback
+            max_page_size = fallback
+
+
+def iter_paginated(
+    client: LinodeClient,
+    endpoint: str,
+    filters: Optional[Dict[str, Any]],
+    num_results: Optional[int] = None,
+    page_concurrency: int = 1,
+    page_size: Optional[int] = None,
+    stats: Optional[PaginationStats] = None,
+) -> Iterator[Any]:
+    """
+    Yields the JSON entries of the given paginated API endpoint page by page.
+
+    Pages are only requested as the consumer advances, so no more than
+    `page_concurrency` pages are held in memory at once and no further
+    requests are made after `num_results` entries have been yielded
+    or the generator has been closed.
+
+    If `page_size` is defined, it is used as the upper bound for the page size
+    selected by `resolve_page_size(...)`.
+    """
+
+    if num_results is not None and num_results < 1:
+        return
+
+    stats = stats if stats is not None else PaginationStats()
+    stats_lock = threading.Lock()
+
+    def __get_page_data(page: int) -> List[Any]:
+        result = _get_page(client, endpoint, filters, page, stats.page_size)
+
+        with stats_lock:
+            stats.pages_fetched += 1
+
+        return result["data"]
+
+    def __iter_pages() -> Iterator[List[Any]]:
+        first_page, stats.page_size = _get_first_page(
+            client,
+            endpoint,
+            filters,
+            num_results,
+            page_size or MAX_PAGE_SIZE,
+        )
+        stats.pages_fetched += 1
+
+        # We only want to read the number of pages once to avoid undefined
+        # behavior when the number of pages changes mid-iteration
+        num_pages = first_page.get("pages") or 1
+
+        if num_results is not None:
+            # Don't request pages that would be truncated anyway
+            num_pages = min(num_pages, math.ceil(num_results / stats.page_size))
+
+        remaining_pages = iter(range(2, num_pages + 1))
+
+        if page_concurrency <= 1:
+            yield first_page.pop("data")
+
+            for page in remaining_pages:
+                yield __get_page_data(page)
+
+            return
+
+        executor = ThreadPoolExecutor(max_workers=page_concurrency)
+
+        try:
+            # Keep a bounded window of in-flight pages ahead of the consumer
+            pending = deque(
+                executor.submit(__get_page_data, page)
+                for page in itertools.islice(remaining_pages, page_concurrency)
+            )
+
+            yield first_page.pop("data")
+
+            while len(pending) > 0:
+                page_data = pending.popleft().result()
+
+                next_page = next(remaining_pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(__get_page_data, next_page))
+
+                yield page_data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    num_yielded = 0
+
+    with closing(__iter_pages()) as pages:
+        for page_data in pages:
+            for entry in page_data:
+                if num_results is not None and num_yielded >= num_results:
+                    return
+
+                yield entry
+                num_yielded += 1
+
+
 def get_all_paginated(
     client: LinodeClient,
     endpoint: str,
-    filters: Dict[str, Any],
-    num_results=None,
+    filters: Optional[Dict[str, Any]],
+    num_results: Optional[int] = None,
+    page_concurrency: int = 1,
+    page_size: Optional[int] = None,
+    stats: Optional[PaginationStats] = None,
 ) -> List[Any]:
     """Returns a list of paginated JSON responses for the given API endpoint."""
-    result = []
-    current_page = 1
-    page_size = 100
-    num_pages: Optional[int] = None
+    return list(
+        iter_paginated(
+            client,
+            endpoint,
+            filters,
+            num_results=num_results,
+            page_concurrency=page_concurrency,
+            page_size=page_size,
+            stats=stats,
+        )
+    )
 
-    if num_results is not None and num_results < page_size:
-        # Clamp the page size
-        page_size = max(min(num_results, 100), 25)
 
-    while (num_pages is None or current_page <= num_pages) and (
-        num_results is None or len(result) < num_results
-    ):
-        response = client.get(
-            endpoint + "?page={}&page_size={}".format(current_page, page_size),
-            filters=filters,
-        )
+def iter_concurrent_results(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 1,
+) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    """
+    Yields a (result, exception) tuple for each of the given items in order,
+    calling `func` for up to `max_workers` items concurrently.
+
+    When calls are not concurrent, each call is only made as the consumer
+    advances, so closing the generator after an error skips the remaining calls.
+    """
+
+    def __call(item: Any) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return func(item), None
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            return None, exception
+
+    items = list(items)
+
+    if max_workers <= 1 or len(items) <= 1:
+        yield from map(__call, items)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
 
-        if "data" not in response or "page" not in response:
-            raise Exception("Invalid list response")
+    try:
+        yield from executor.map(__call, items)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# The maximum number of values matched by a single `+or` filter,
+# which keeps X-Filter headers well within the API's size limits
+MAX_FILTER_VALUES = 50
+
+
+def find_by_values(
+    client: LinodeClient,
+    endpoint: str,
+    field_name: str,
+    values: Iterable[Any],
+    chunk_size: int = MAX_FILTER_VALUES,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[Any]:
+    """
+    Returns the JSON entries of the given paginated API endpoint whose
+    `field_name` field matches any of the given values, making one
+    `+or` filtered list request per chunk of values.
 
-        # We only want to set num_pages once to avoid undefined behavior
-        # when the number of pages changes mid-aggregation
-        num_pages = num_pages or response["pages"]
+    If `filters` is given, entries must also match it.
+    """
 
-        result.extend(response["data"])
+    values = list(dict.fromkeys(values))
+    result = []
 
-        if num_results is not None and len(result) >= num_results:
-            break
+    for i in range(0, len(values), chunk_size):
+        chunk_filter = {
+            "+or": [{field_name: v} for v in values[i : i + chunk_size]]
+        }
 
-        current_page += 1
+        if filters is not None:
+            chunk_filter = {"+and": [filters, chunk_filter]}
 
-    if num_results is not None:
-        result = result[:num_results]
+        result.extend(get_all_paginated(client, endpoint, chunk_filter))
 
     return result
 
@@ -454,23 +738,175 @@ def format_generic_error(exc: Exception, verbosity: int = 0) -> str:
     return "\n".join(traceback.format_exception_only(exc))
 
 
+# The factor each poll step is multiplied by after an unsuccessful attempt
+POLL_BACKOFF_FACTOR = 1.5
+
+# The maximum amount of time to wait between two poll attempts
+POLL_MAX_STEP_SECONDS = 30.0
+
+# The maximum fraction of a poll step that is randomly added to it
+# so processes polling on the same schedule don't attempt in lock-step
+POLL_JITTER = 0.1
+
+
+class PollStrategy:
+    """
+    Determines how long to wait between the attempts of a poll.
+
+    Each strategy is stateful and should only be used for a single poll.
+    """
+
+    def next_step(self) -> float:
+        """Returns the number of seconds to wait before the next attempt."""
+
+        raise NotImplementedError
+
+    def observe_progress(self, percent_complete: Optional[float]) -> None:
+        """
+        Records the progress reported by the polled operation.
+        Strategies that do not predict completion ignore it.
+        """
+
+
+class BackoffPollStrategy(PollStrategy):
+    """
+    A poll strategy that waits `step` seconds before the second attempt
+    and multiplies the wait by `factor` after each further attempt,
+    up to `max_step` seconds.
+    """
+
+    def __init__(
+        self,
+        step: float,
+        factor: float = POLL_BACKOFF_FACTOR,
+        max_step: float = POLL_MAX_STEP_SECONDS,
+        jitter: float = POLL_JITTER,
+    ):
+        self.step = step
+        self.factor = factor
+        self.max_step = max(max_step, step)
+        self.jitter = jitter
+
+        self._next_step = float(step)
+
+    def _jittered(self, step: float) -> float:
+        return step + random.uniform(0, step * self.jitter)
+
+    def next_step(self) -> float:
+        step = self._next_step
+        self._next_step = min(self._next_step * self.factor, self.max_step)
+
+        return self._jittered(step)
+
+
+class ProgressPollStrategy(BackoffPollStrategy):
+    """
+    A poll strategy for operations that report a `percent_complete`.
+
+    Once the operation has made progress, the next attempt is timed for
+    when the operation is predicted to complete at its average observed
+    rate, bounded by `step` and `max_step`. Until then, it backs off
+    like a BackoffPollStrategy.
+    """
+
+    def __init__(self, step: float, **kwargs: Any):
+        super().__init__(step, **kwargs)
+
+        self._first_progress: Optional[Tuple[float, float]] = None
+        self._last_progress: Optional[Tuple[float, float]] = None
+
+    def observe_progress(self, percent_complete: Optional[float]) -> None:
+        if percent_complete is None:
+            return
+
+        progress = (time.monotonic(), float(percent_complete))
+
+        if self._first_progress is None:
+            self._first_progress = progress
+
+        self._last_progress = progress
+
+    def _predicted_remaining(self) -> Optional[float]:
+        """Returns the predicted number of seconds until the operation completes."""
+
+        if self._first_progress is None or self._last_progress is None:
+            return None
+
+        first_time, first_percent = self._first_progress
+        last_time, last_percent = self._last_progress
+
+        if last_time <= first_time or last_percent <= first_percent:
+            return None
+
+        rate = (last_percent - first_percent) / (last_time - first_time)
+
+        return max(100 - last_percent, 0) / rate
+
+    def next_step(self) -> float:
+        backoff_step = super().next_step()
+        remaining = self._predicted_remaining()
+
+        if remaining is None:
+            return backoff_step
+
+        return self._jittered(min(max(remaining, self.step), self.max_step))
+
+
 def poll_condition(
-    condition_func: Callable[[], bool], step: int, timeout: int
+    condition_func: Callable[[], bool],
+    step: int,
+    timeout: int,
+    strategy: Optional[PollStrategy] = None,
 ) -> None:
-    """Polls for the given condition using the given step and timeout values."""
-    # Initial attempt
-    if condition_func():
-        return
+    """
+    Polls for the given condition using the given step and timeout values.
 
-    polling.poll(
-        condition_func,
-        step=step,
-        timeout=timeout,
-    )
+    The wait between attempts starts at `step` seconds and is determined
+    by the given strategy, which defaults to a BackoffPollStrategy.
+    """
+
+    if strategy is None:
+        strategy = BackoffPollStrategy(step)
+
+    # Memoized and cached responses would hide the changes being polled for
+    with suspend_request_memo(), suspend_response_cache():
+        deadline = time.monotonic() + timeout
+
+        def __next_step(_: float) -> float:
+            # Waiting past the timeout would only delay the timeout error
+            return max(
+                min(strategy.next_step(), deadline - time.monotonic()), 0
+            )
+
+        condition_seconds = 0.0
+
+        def __timed_condition() -> bool:
+            nonlocal condition_seconds
+
+            condition_started = time.monotonic()
+
+            try:
+                return condition_func()
+            finally:
+                condition_seconds += time.monotonic() - condition_started
+
+        started = time.monotonic()
+
+        # The first attempt is made without waiting
+        try:
+            polling.poll(
+                __timed_condition,
+                step=__next_step(step),
+                step_function=__next_step,
+                timeout=timeout,
+            )
+        finally:
+            # Any time not spent evaluating the condition was spent sleeping
+            record_poll_sleep(time.monotonic() - started - condition_seconds)
 
 
 def safe_find(
-    func: Callable[[Tuple[Filter]], List[Any]],
+    func: Callable[[Tuple[Filter]], Iterable[Any]],
     *filters: Any,
     raise_not_found=False,
 ) -> Any:
@@ -480,11 +916,13 @@ def safe_find(
     raising an error.
     """
     try:
+        # Only the first entry is consumed so lazy results (e.g. generators)
+        # will not be requested past the first match.
         list_results = func(*filters)
-        return list_results[0]
-    except IndexError:
+        return next(iter(list_results))
+    except StopIteration:
         if raise_not_found:
-            raise ValueError("No matching resource found.") from IndexError
+            raise ValueError("No matching resource found.") from None
 
         return None
     except Exception as exception:
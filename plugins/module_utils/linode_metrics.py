@@ -0,0 +1,323 @@
+"""This module contains helpers for recording per-task Linode API metrics."""
+
+from __future__ import absolute_import, division, print_function
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+# The result key module metrics are returned under
+METRICS_RESULT_KEY = "_linode_metrics"
+
+# The upper bounds of each latency histogram bucket
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Requests to this endpoint are made repeatedly by event pollers
+EVENTS_ENDPOINT = "GET /account/events"
+
+# Path segments that identify a specific resource, e.g. numeric IDs and UUIDs
+_RESOURCE_ID_PATTERN = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+# Path segments that identify an API version, e.g. v4 or v4beta
+_API_VERSION_PATTERN = re.compile(r"^v\d+(beta)?$")
+
+# The metrics instance for the currently running module, if enabled
+_active_metrics: Optional["ApiMetrics"] = None  # pylint: disable=invalid-name
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """
+    Returns the method and templated path of the given request URL,
+    e.g. `GET /linode/instances/{id}/disks`.
+    """
+
+    segments = [v for v in urlparse(url).path.split("/") if v != ""]
+
+    if len(segments) > 0 and _API_VERSION_PATTERN.match(segments[0]):
+        segments = segments[1:]
+
+    path = "/".join(
+        "{id}" if _RESOURCE_ID_PATTERN.match(v) else v for v in segments
+    )
+
+    return f"{method} /{path}"
+
+
+def _bucket_key(seconds: float) -> str:
+    for bound in LATENCY_BUCKETS_SECONDS:
+        if seconds <= bound:
+            return str(bound)
+
+    return "+Inf"
+
+
+def _bucket_bound(key: str) -> float:
+    return float("inf") if key == "+Inf" else float(key)
+
+
+def merge_histograms(target: Dict[str, int], source: Dict[str, int]) -> None:
+    """Adds the bucket counts of the source latency histogram to the target."""
+
+    for key, count in source.items():
+        target[key] = target.get(key, 0) + count
+
+
+def histogram_percentile(
+    histogram: Dict[str, int],
+    percentile: float,
+    max_value: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Estimates the given percentile (0-100) of a latency histogram by
+    interpolating linearly within the bucket the percentile falls in.
+    The overflow bucket is bounded by `max_value` if it is given.
+    """
+
+    total = sum(histogram.values())
+    if total < 1:
+        return None
+
+    target = total * percentile / 100
+    cumulative = 0
+    lower = 0.0
+
+    for key in [str(v) for v in LATENCY_BUCKETS_SECONDS] + ["+Inf"]:
+        count = histogram.get(key, 0)
+        upper = _bucket_bound(key)
+
+        if upper == float("inf"):
+            upper = max(max_value if max_value is not None else lower, lower)
+
+        if count > 0 and cumulative + count >= target:
+            result = lower + (upper - lower) * (target - cumulative) / count
+
+            # No sample can exceed the observed maximum
+            return result if max_value is None else min(result, max_value)
+
+        cumulative += count
+        lower = upper
+
+    return lower
+
+
+class ApiMetrics:
+    """
+    Accumulates request counts, latencies, transfer sizes and wait times
+    for all API requests made by a single module run.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.poll_sleep_seconds = 0.0
+        self.event_poll_sleep_seconds = 0.0
+        self.rate_limit_wait_seconds = 0.0
+        self.memo_hits = 0
+
+        self._lock = threading.Lock()
+        self._last_events_finished: Optional[float] = None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ApiMetrics":
+        # API objects reference the client and are sometimes deep-copied;
+        # copies should keep recording to the metrics of the current module run.
+        return self
+
+    def record_request(
+        self,
+        endpoint: str,
+        status: int,
+        started: float,
+        finished: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        retry_statuses: Any = (),
+    ) -> None:
+        """Records a single API request, including any retries made for it."""
+
+        latency = finished - started
+        retry_statuses = list(retry_statuses)
+
+        with self._lock:
+            stats = self.endpoints.setdefault(
+                endpoint,
+                {
+                    "count": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "rate_limited": 0,
+                    "bytes_in": 0,
+                    "bytes_out": 0,
+                    "latency_seconds_total": 0.0,
+                    "latency_seconds_max": 0.0,
+                    "latency_histogram": {},
+                },
+            )
+
+            stats["count"] += 1
+            stats["errors"] += int(status == 0 or status >= 400)
+            stats["retries"] += len(retry_statuses)
+            stats["rate_limited"] += [status, *retry_statuses].count(429)
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["latency_seconds_total"] += latency
+            stats["latency_seconds_max"] = max(
+                stats["latency_seconds_max"], latency
+            )
+
+            bucket = _bucket_key(latency)
+            stats["latency_histogram"][bucket] = (
+                stats["latency_histogram"].get(bucket, 0) + 1
+            )
+
+            # Event pollers sleep between consecutive event list requests
+            if endpoint == EVENTS_ENDPOINT:
+                if self._last_events_finished is not None:
+                    self.event_poll_sleep_seconds += max(
+                        started - self._last_events_finished, 0
+                    )
+
+                self._last_events_finished = finished
+
+    def record_poll_sleep(self, seconds: float) -> None:
+        """Records time spent sleeping between condition polls."""
+
+        with self._lock:
+            self.poll_sleep_seconds += max(seconds, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a summary of the recorded metrics."""
+
+        with self._lock:
+            endpoints = {
+                k: {
+                    **v,
+                    "latency_histogram": dict(v["latency_histogram"]),
+                }
+                for k, v in sorted(self.endpoints.items())
+            }
+
+            def _total(key: str) -> Any:
+                return sum(v[key] for v in endpoints.values())
+
+            return {
+                "requests": _total("count"),
+                "errors": _total("errors"),
+                "retries": _total("retries"),
+                "rate_limited": _total("rate_limited"),
+                "bytes_in": _total("bytes_in"),
+                "bytes_out": _total("bytes_out"),
+                "api_seconds": _total("latency_seconds_total"),
+                "poll_sleep_seconds": self.poll_sleep_seconds,
+                "event_poll_sleep_seconds": self.event_poll_sleep_seconds,
+                "rate_limit_wait_seconds": self.rate_limit_wait_seconds,
+                "memo_hits": self.memo_hits,
+                "duration_seconds": time.monotonic() - self.started,
+                "endpoints": endpoints,
+            }
+
+
+def set_active_metrics(metrics: Optional[ApiMetrics]) -> None:
+    """Sets the metrics instance that module-wide helpers record to."""
+
+    global _active_metrics  # pylint: disable=global-statement
+    _active_metrics = metrics
+
+
+def record_poll_sleep(seconds: float) -> None:
+    """Records time spent sleeping between condition polls, if metrics are enabled."""
+
+    if _active_metrics is not None:
+        _active_metrics.record_poll_sleep(seconds)
+
+
+def _retry_statuses(response: Response) -> Any:
+    """Returns the status of each failed attempt urllib3 retried for the given response."""
+
+    retries = getattr(response.raw, "retries", None)
+
+    return [
+        v.status
+        for v in getattr(retries, "history", ()) or ()
+        if v.status is not None
+    ]
+
+
+class MetricsAdapter(BaseAdapter):
+    """
+    A transport adapter that records metrics for every request sent through
+    the wrapped adapter.
+    """
+
+    def __init__(self, metrics: ApiMetrics, adapter: BaseAdapter) -> None:
+        super().__init__()
+
+        self.metrics = metrics
+        self.adapter = adapter
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        endpoint = endpoint_template(request.method, request.url)
+        started = time.monotonic()
+
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        try:
+            response = self.adapter.send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+        except Exception:
+            # Requests that never received a response are recorded with status 0
+            self.metrics.record_request(
+                endpoint, 0, started, time.monotonic(), bytes_out=len(body)
+            )
+            raise
+
+        bytes_in = 0
+        if not stream:
+            bytes_in = len(response.content or b"")
+
+        self.metrics.record_request(
+            endpoint,
+            response.status_code,
+            started,
+            time.monotonic(),
+            bytes_in=bytes_in,
+            bytes_out=len(body),
+            retry_statuses=_retry_statuses(response),
+        )
+
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_metrics(session: Any, metrics: ApiMetrics) -> None:
+    """Wraps the transport adapters of the given session with a MetricsAdapter."""
+
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix, MetricsAdapter(metrics, session.get_adapter(prefix))
+        )
@@ -0,0 +1,273 @@
+"""This module contains an account-wide API rate limiter that is shared between processes."""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    hash_token,
+    locked_json_state,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    endpoint_template,
+)
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The maximum amount of time to back off between two retries
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
+# The amount of time to block all requests after a 429 response
+# without a Retry-After header
+RATE_LIMIT_PENALTY_SECONDS = 4.0
+
+# The maximum fraction of a computed wait that is randomly added to it
+# so waiting processes don't resume in lock-step
+RATE_LIMIT_JITTER = 0.25
+
+
+def _header_float(headers: Mapping[str, Any], key: str) -> Optional[float]:
+    """Returns the given header as a float, or None if it is missing or invalid."""
+
+    try:
+        return float(headers.get(key))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A token bucket rate limiter for a single API token.
+
+    The bucket state is stored in a file that is locked on every access,
+    so all processes using the same token (e.g. Ansible forks) share a
+    single request budget. The API reports rate limits for each endpoint,
+    so a bucket is kept for each method and templated path, sized and
+    refilled according to the rate limit headers of that endpoint's
+    responses. All processes are blocked from every endpoint for the
+    duration of any Retry-After header.
+    """
+
+    def __init__(self, token: str, state_dir: Optional[str] = None):
+        self.path = os.path.join(
+            state_dir or tempfile.gettempdir(),
+            f"ansible-linode-ratelimit-{hash_token(token)}.json",
+        )
+
+        # The total time this process has spent waiting for the limiter
+        self.waited = 0.0
+
+    @staticmethod
+    def _refill(bucket: Dict[str, Any], now: float) -> None:
+        rate = bucket.get("rate")
+        if rate is None:
+            return
+
+        bucket["tokens"] = min(
+            bucket["capacity"],
+            bucket.get("tokens", bucket["capacity"])
+            + (now - bucket.get("updated", now)) * rate,
+        )
+        bucket["updated"] = now
+
+    def acquire(self, endpoint: str = "") -> float:
+        """
+        Blocks until a request to the given endpoint, e.g.
+        `GET /linode/instances`, can be made and returns the time spent
+        waiting.
+        """
+
+        waited = 0.0
+
+        while True:
+            with locked_json_state(self.path) as state:
+                now = time.time()
+                bucket = state.setdefault("endpoints", {}).get(endpoint, {})
+                self._refill(bucket, now)
+
+                wait = max(
+                    state.get("blocked_until", 0) - now,
+                    bucket.get("blocked_until", 0) - now,
+                    0,
+                )
+
+                if wait <= 0:
+                    if bucket.get("rate") is None:
+                        # The API has not reported a rate limit yet
+                        return waited
+
+                    if bucket["tokens"] >= 1:
+                        bucket["tokens"] -= 1
+                        return waited
+
+                    wait = (1 - bucket["tokens"]) / bucket["rate"]
+
+            wait += random.uniform(0, wait * RATE_LIMIT_JITTER)
+
+            time.sleep(wait)
+            waited += wait
+            self.waited += wait
+
+    def observe(
+        self, status: int, headers: Mapping[str, Any], endpoint: str = ""
+    ) -> None:
+        """Updates the shared bucket of the given endpoint from an API response."""
+
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        retry_after = _header_float(headers, "Retry-After")
+
+        if status != 429 and None in (limit, remaining, reset):
+            return
+
+        with locked_json_state(self.path) as state:
+            now = time.time()
+            bucket = state.setdefault("endpoints", {}).setdefault(endpoint, {})
+            self._refill(bucket, now)
+
+            if None not in (limit, remaining, reset):
+                # The longest observed time until reset approximates the
+                # length of the API's rate limit window.
+                bucket["window"] = max(bucket.get("window", 1), reset - now, 1)
+                bucket["capacity"] = max(limit, 1)
+                bucket["rate"] = bucket["capacity"] / bucket["window"]
+
+                # The API's view of the remaining budget is authoritative
+                bucket["tokens"] = min(
+                    bucket.get("tokens", remaining), remaining
+                )
+                bucket["updated"] = now
+
+                if remaining < 1:
+                    bucket["blocked_until"] = max(
+                        bucket.get("blocked_until", 0), reset
+                    )
+
+            if status == 429:
+                # Retry-After applies to every endpoint
+                state["blocked_until"] = max(
+                    state.get("blocked_until", 0),
+                    now + (retry_after or RATE_LIMIT_PENALTY_SECONDS),
+                )
+
+                if bucket.get("rate") is not None:
+                    bucket["tokens"] = 0
+
+
+class JitteredRetry(Retry):
+    """
+    A retry configuration that uses exponential backoff with full jitter
+    and coordinates retries through an optional RateLimiter.
+    """
+
+    limiter: Optional[RateLimiter] = None
+
+    def new(self, **kw: Any) -> "JitteredRetry":
+        result = super().new(**kw)
+        result.limiter = self.limiter
+        return result
+
+    def get_backoff_time(self) -> float:
+        ceiling = min(
+            RETRY_BACKOFF_MAX_SECONDS,
+            self.backoff_factor * (2 ** max(len(self.history) - 1, 0)),
+        )
+
+        return random.uniform(0, ceiling)
+
+    def sleep(self, response: Any = None) -> None:
+        if self.limiter is None:
+            super().sleep(response)
+            return
+
+        endpoint = ""
+        if len(self.history) > 0:
+            endpoint = endpoint_template(
+                self.history[-1].method, self.history[-1].url
+            )
+
+        if response is not None:
+            self.limiter.observe(response.status, response.headers, endpoint)
+
+        # Retry-After headers are honored by the limiter for all processes
+        time.sleep(self.get_backoff_time())
+        self.limiter.acquire(endpoint)
+
+
+class RateLimitAdapter(BaseAdapter):
+    """
+    A transport adapter that acquires a RateLimiter token before each request
+    and feeds the rate limit headers of each response back into it.
+    """
+
+    def __init__(self, limiter: RateLimiter, adapter: BaseAdapter):
+        super().__init__()
+
+        self.limiter = limiter
+        self.adapter = adapter
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        endpoint = endpoint_template(request.method or "", request.url or "")
+        self.limiter.acquire(endpoint)
+
+        response = self.adapter.send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+
+        self.limiter.observe(response.status_code, response.headers, endpoint)
+
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+def mount_retry_adapter(
+    session: Any,
+    max_retries: int,
+    retry_statuses: Any,
+    backoff_seconds: float,
+    limiter: Optional[RateLimiter] = None,
+) -> None:
+    """
+    Replaces the transport adapters of the given session with adapters that
+    retry using jittered exponential backoff, optionally coordinated by
+    the given RateLimiter.
+    """
+
+    retry = JitteredRetry(
+        total=max_retries,
+        status_forcelist=retry_statuses,
+        respect_retry_after_header=True,
+        backoff_factor=backoff_seconds,
+        raise_on_status=False,
+        allowed_methods={"DELETE", "GET", "POST", "PUT"},
+    )
+    retry.limiter = limiter
+
+    for prefix in ("https://", "http://"):
+        adapter: BaseAdapter = HTTPAdapter(max_retries=retry)
+
+        if limiter is not None:
+            adapter = RateLimitAdapter(limiter, adapter)
+
+        session.mount(prefix, adapter)
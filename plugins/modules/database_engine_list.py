@@ -16,8 +16,11 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_common import
 from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
+    pagination_samples,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    DEFAULT_PAGE_CONCURRENCY,
+    PaginationStats,
     construct_api_filter,
     get_all_paginated,
 )
@@ -75,6 +78,21 @@ spec = {
             "If undefined, all results will be returned.",
         ],
     ),
+    "page_concurrency": SpecField(
+        type=FieldType.integer,
+        description=[
+            "The maximum number of pages of database engine types to fetch concurrently."
+        ],
+        default=DEFAULT_PAGE_CONCURRENCY,
+    ),
+    "page_size": SpecField(
+        type=FieldType.integer,
+        description=[
+            "The maximum number of database engine types to request per page.",
+            "If undefined, the largest page size accepted by the API "
+            "will be used.",
+        ],
+    ),
 }
 
 SPECDOC_META = SpecDocMeta(
@@ -90,7 +108,13 @@ SPECDOC_META = SpecDocMeta(
             type=FieldType.list,
             elements=FieldType.dict,
             sample=docs.result_engines_samples,
-        )
+        ),
+        "pagination": SpecReturnValue(
+            description="Information about the pages requested "
+            "to list the database engine types.",
+            type=FieldType.dict,
+            sample=pagination_samples,
+        ),
     },
 )
 
@@ -116,12 +140,19 @@ class Module(LinodeModuleBase):
 
         filter_dict = construct_api_filter(self.module.params)
 
+        pagination_stats = PaginationStats()
+
         self.results["database_engines"] = get_all_paginated(
             self.client,
             "/databases/engines/",
             filter_dict,
             num_results=self.module.params["count"],
+            page_concurrency=self.module.params["page_concurrency"],
+            page_size=self.module.params["page_size"],
+            stats=pagination_stats,
         )
+        self.results["pagination"] = pagination_stats.to_dict()
+
         return self.results
 
 
@@ -19,6 +19,10 @@ from ansible_collections.linode.cloud.plugins.module_utils.doc_fragments import
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
     LinodeModuleBase,
 )
+from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info import (
+    is_result_selected,
+    result_selection_options,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_database_shared import (
     call_protected_provisioning,
 )
@@ -49,6 +53,7 @@ spec = {
         conflicts_with=["id"],
         description=["The label of the MySQL Database."],
     ),
+    **result_selection_options("MySQL Database", ["credentials", "ssl_cert"]),
 }
 
 SPECDOC_META = SpecDocMeta(
@@ -104,7 +109,7 @@ class Module(LinodeModuleBase):
         super().__init__(
             module_arg_spec=self.module_arg_spec,
             required_one_of=[("id", "label")],
-            mutually_exclusive=[("id", "label")],
+            mutually_exclusive=[("id", "label"), ("include", "exclude")],
         )
 
     def _get_database_by_label(self, label: str) -> Optional[MySQLDatabase]:
@@ -131,12 +136,16 @@ class Module(LinodeModuleBase):
         database._api_get()
 
         self.results["database"] = database._raw_json
-        self.results["credentials"] = call_protected_provisioning(
-            lambda: mapping_to_dict(database.credentials)
-        )
-        self.results["ssl_cert"] = call_protected_provisioning(
-            lambda: mapping_to_dict(database.ssl)
-        )
+
+        if is_result_selected("credentials", self.module.params):
+            self.results["credentials"] = call_protected_provisioning(
+                lambda: mapping_to_dict(database.credentials)
+            )
+
+        if is_result_selected("ssl_cert", self.module.params):
+            self.results["ssl_cert"] = call_protected_provisioning(
+                lambda: mapping_to_dict(database.ssl)
+            )
 
     def exec_module(self, **kwargs: Any) -> Optional[dict]:
         """Entrypoint for database info module"""
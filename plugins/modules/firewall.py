@@ -11,6 +11,9 @@ import time
 from typing import Any, List, Optional
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.firewall as docs
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    suspend_request_memo,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
     LinodeModuleBase,
 )
@@ -226,9 +229,11 @@ class LinodeFirewall(LinodeModuleBase):
 
         while attempt < retries:
             try:
-                return self.client.networking.firewalls(
-                    Firewall.label == label
-                )[0]
+                # Retries must not reuse the memoized empty listing
+                with suspend_request_memo():
+                    return self.client.networking.firewalls(
+                        Firewall.label == label
+                    )[0]
             except IndexError:
                 attempt += 1
                 if attempt < retries:
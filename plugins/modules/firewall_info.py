@@ -13,6 +13,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info im
     InfoModuleResult,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    find_by_values,
     paginated_list_to_json,
     safe_find,
 )
@@ -48,6 +49,9 @@ module = InfoModule(
                 Firewall,
                 params.get("id"),
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/networking/firewalls", "id", values
+            ),
         ),
         InfoModuleAttr(
             display_name="label",
@@ -58,6 +62,9 @@ module = InfoModule(
                 Firewall.label == params.get("label"),
                 raise_not_found=True,
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/networking/firewalls", "label", values
+            ),
         ),
     ],
     examples=docs.specdoc_examples,
@@ -21,6 +21,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
     filter_null_values,
     handle_updates,
+    poll_condition,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -176,12 +177,8 @@ class Module(LinodeModuleBase):
             image._api_get()
             return image.status in status
 
-        # Initial attempt
-        if poll_func():
-            return
-
         try:
-            polling.poll(
+            poll_condition(
                 poll_func,
                 step=10,
                 timeout=self._timeout_ctx.seconds_remaining,
@@ -200,12 +197,8 @@ class Module(LinodeModuleBase):
 
             return True
 
-        # Initial attempt
-        if poll_func():
-            return
-
         try:
-            polling.poll(
+            poll_condition(
                 poll_func,
                 step=10,
                 timeout=self._timeout_ctx.seconds_remaining,
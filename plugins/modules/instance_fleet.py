@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""This module allows users to converge many Linode instances in a single task."""
+
+from __future__ import absolute_import, division, print_function
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.instance_fleet as docs
+import polling
+from ansible.module_utils.common.validation import check_mutually_exclusive
+from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
+    LinodeModuleBase,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
+    global_authors,
+    global_requirements,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    filter_null_values,
+    find_by_values,
+    format_generic_error,
+    iter_concurrent_results,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.modules.instance.linode_instance import (
+    MUTUALLY_EXCLUSIVE,
+    LinodeInstance,
+    linode_instance_spec,
+)
+from ansible_specdoc.objects import (
+    FieldType,
+    SpecDocMeta,
+    SpecField,
+    SpecReturnValue,
+)
+from linode_api4.polling import TimeoutContext
+
+try:
+    from linode_api4 import ApiError, Instance
+except ImportError:
+    # handled in module_utils.linode_common
+    pass
+
+DEFAULT_INSTANCE_CONCURRENCY = 4
+
+linode_instance_fleet_member_spec = {
+    **linode_instance_spec,
+    "label": SpecField(
+        type=FieldType.string,
+        required=True,
+        description=["The unique label of this instance."],
+    ),
+    "state": SpecField(
+        type=FieldType.string,
+        description=["The desired state of this instance."],
+        choices=["present", "absent"],
+        default="present",
+    ),
+}
+
+linode_instance_fleet_spec = {
+    "instances": SpecField(
+        type=FieldType.list,
+        element_type=FieldType.dict,
+        suboptions=linode_instance_fleet_member_spec,
+        required=True,
+        description=[
+            "The instances to converge.",
+            "Each instance accepts the options of the "
+            "linode.cloud.instance module.",
+        ],
+    ),
+    "instance_concurrency": SpecField(
+        type=FieldType.integer,
+        description=[
+            "The maximum number of instances to create, update or delete "
+            "concurrently.",
+        ],
+        default=DEFAULT_INSTANCE_CONCURRENCY,
+    ),
+}
+
+SPECDOC_META = SpecDocMeta(
+    description=[
+        "Create, update and delete many Linode Instances in a single task.",
+        "Existing instances are found with a single bulk listing, and "
+        "instances are converged concurrently using the same logic as the "
+        "linode.cloud.instance module.",
+        "Unless share_event_polling is disabled, all instances wait for "
+        "their events through a single shared poll of the events feed.",
+    ],
+    requirements=global_requirements,
+    author=global_authors,
+    options=linode_instance_fleet_spec,
+    examples=docs.specdoc_examples,
+    return_values={
+        "instances": SpecReturnValue(
+            description=[
+                "The result of each instance in the order they were given.",
+                "Each result contains the values returned by the "
+                "linode.cloud.instance module along with its label, and "
+                "the error message of failed instances.",
+            ],
+            type=FieldType.list,
+            sample=docs.result_instances_samples,
+        ),
+    },
+)
+
+DOCUMENTATION = r"""
+"""
+EXAMPLES = r"""
+"""
+RETURN = r"""
+"""
+
+
+class FleetMemberError(Exception):
+    """Raised when a single instance of a fleet fails to converge."""
+
+
+class FleetMemberModule:
+    """
+    The subset of AnsibleModule used by LinodeInstance, scoped to a
+    single instance of a fleet.
+    """
+
+    def __init__(self, fleet: LinodeModuleBase, params: Dict[str, Any]):
+        self._fleet = fleet
+        self.params = params
+
+    def warn(self, msg: str) -> None:
+        """Adds a warning for this instance to the fleet's result."""
+
+        self._fleet.warn(f"{self.params['label']}: {msg}")
+
+    def fail_json(self, msg: str, **kwargs: Any) -> None:
+        """Fails this instance without failing the other instances."""
+
+        raise FleetMemberError(msg)
+
+
+class FleetMember(LinodeInstance):
+    """
+    A LinodeInstance that converges a single instance of a fleet
+    using the fleet's client.
+    """
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(
+        self,
+        fleet: LinodeModuleBase,
+        params: Dict[str, Any],
+        instance: Optional[Instance],
+    ) -> None:
+        # Members are run by the fleet rather than as modules of their own
+        self.module = FleetMemberModule(fleet, params)
+
+        self._client = fleet.client
+        self._timeout_ctx = TimeoutContext(
+            timeout_seconds=params["wait_timeout"]
+        )
+        self._listed_instance = instance
+
+        self._init_state()
+
+    def _get_instance_by_label(self, label: str) -> Optional[Instance]:
+        # Existing instances are found in the fleet's bulk listing
+        return self._listed_instance
+
+
+class LinodeInstanceFleet(LinodeModuleBase):
+    """Module for converging many Linode Instances"""
+
+    def __init__(self) -> None:
+        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.results: Dict[str, Any] = {
+            "changed": False,
+            "actions": [],
+            "instances": [],
+        }
+
+        super().__init__(module_arg_spec=self.module_arg_spec)
+
+    def _validate_instances(self, instances: List[Dict[str, Any]]) -> None:
+        labels = set()
+
+        for params in instances:
+            label = params["label"]
+
+            if label in labels:
+                self.fail(msg=f"instance {label} is specified more than once")
+
+            labels.add(label)
+
+            try:
+                check_mutually_exclusive(
+                    MUTUALLY_EXCLUSIVE, filter_null_values(params)
+                )
+            except TypeError as err:
+                self.fail(msg=f"invalid options for instance {label}: {err}")
+
+    def _get_listed_instances(self, labels: List[str]) -> Dict[str, Instance]:
+        """Returns the existing instances with the given labels by label."""
+
+        return {
+            v["label"]: Instance(self.client, v["id"], json=v)
+            for v in find_by_values(
+                self.client, "/linode/instances", "label", labels
+            )
+        }
+
+    def _converge_instance(
+        self, member: Tuple[Dict[str, Any], Optional[Instance]]
+    ) -> Dict[str, Any]:
+        """Converges a single instance and returns its result."""
+
+        params, instance = member
+        fleet_member = FleetMember(self, params, instance)
+
+        try:
+            fleet_member.exec_module(**params)
+        except FleetMemberError as err:
+            fleet_member.results.update(failed=True, msg=str(err))
+        except ApiError as err:
+            fleet_member.results.update(
+                failed=True, msg=f"Error from Linode API: {str(err)}"
+            )
+        except polling.TimeoutException:
+            fleet_member.results.update(
+                failed=True,
+                msg="failed to wait for condition: timeout period expired",
+            )
+        except Exception as err:
+            fleet_member.results.update(
+                failed=True,
+                msg=format_generic_error(err, self.module._verbosity),
+            )
+
+        return {"label": params["label"], **fleet_member.results}
+
+    def exec_module(self, **kwargs: Any) -> Optional[dict]:
+        """Entrypoint for Instance Fleet module"""
+
+        instances = kwargs["instances"]
+
+        self._validate_instances(instances)
+
+        listed_instances = self._get_listed_instances(
+            [v["label"] for v in instances]
+        )
+
+        for params, (result, err) in zip(
+            instances,
+            iter_concurrent_results(
+                self._converge_instance,
+                [(v, listed_instances.get(v["label"])) for v in instances],
+                max_workers=kwargs["instance_concurrency"] or 1,
+            ),
+        ):
+            if err is not None:
+                result = {
+                    "label": params["label"],
+                    "changed": False,
+                    "actions": [],
+                    "failed": True,
+                    "msg": format_generic_error(err, self.module._verbosity),
+                }
+
+            if result["changed"]:
+                self.results["changed"] = True
+
+            self.results["actions"] += [
+                f"{params['label']}: {v}" for v in result["actions"]
+            ]
+            self.results["instances"].append(result)
+
+        failed = [
+            v["label"] for v in self.results["instances"] if v.get("failed")
+        ]
+        if len(failed) > 0:
+            self.fail(
+                msg=f"failed to converge instances: {', '.join(failed)}",
+                **self.results,
+            )
+
+        return self.results
+
+
+def main() -> None:
+    """Constructs and calls the Linode Instance Fleet module"""
+
+    LinodeInstanceFleet()
+
+
+if __name__ == "__main__":
+    main()
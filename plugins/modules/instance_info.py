@@ -13,6 +13,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info im
     InfoModuleResult,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    find_by_values,
     paginated_list_to_json,
     safe_find,
 )
@@ -81,6 +82,9 @@ module = InfoModule(
             get=lambda client, params: client.load(
                 Instance, params.get("id")
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/linode/instances", "id", values
+            ),
         ),
         InfoModuleAttr(
             name="label",
@@ -91,6 +95,9 @@ module = InfoModule(
                 Instance.label == params.get("label"),
                 raise_not_found=True,
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/linode/instances", "label", values
+            ),
         ),
     ],
 )
@@ -401,7 +401,7 @@ class LinodeLKECluster(LinodeModuleBase):
             return True
 
         try:
-            polling.poll(
+            poll_condition(
                 _check_cluster_nodes_ready,
                 step=4,
                 timeout=timeout,
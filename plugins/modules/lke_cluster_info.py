@@ -5,6 +5,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+from contextlib import closing
 from typing import Any, Dict, List, Optional
 
 from ansible_collections.linode.cloud.plugins.module_utils.doc_fragments import (
@@ -16,12 +17,18 @@ from ansible_collections.linode.cloud.plugins.module_utils.doc_fragments import
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
     LinodeModuleBase,
 )
+from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info import (
+    is_result_selected,
+    result_selection_options,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    DEFAULT_RESULT_CONCURRENCY,
     filter_null_values,
+    iter_concurrent_results,
     jsonify_node_pool,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_lke_shared import (
@@ -54,6 +61,17 @@ linode_lke_cluster_info_spec = {
             "Optional if `id` is defined.",
         ],
     ),
+    "result_concurrency": SpecField(
+        type=FieldType.integer,
+        description=[
+            "The maximum number of results related to the LKE cluster "
+            "to fetch concurrently.",
+        ],
+        default=DEFAULT_RESULT_CONCURRENCY,
+    ),
+    **result_selection_options(
+        "LKE cluster", ["node_pools", "kubeconfig", "dashboard_url"]
+    ),
 }
 
 SPECDOC_META = SpecDocMeta(
@@ -118,6 +136,7 @@ class LinodeLKEClusterInfo(LinodeModuleBase):
         super().__init__(
             module_arg_spec=self.module_arg_spec,
             required_one_of=self.required_one_of,
+            mutually_exclusive=[("include", "exclude")],
         )
 
     def _get_cluster_by_name(self, name: str) -> Optional[LKECluster]:
@@ -149,29 +168,10 @@ class LinodeLKEClusterInfo(LinodeModuleBase):
 
         return self.fail(msg="one of `label` or `id` must be specified")
 
-    def _populate_results(self, cluster: LKECluster) -> None:
-        cluster._api_get()
-
-        cluster_json = cluster._raw_json
-
-        # We need to inject the control plane ACL configuration into the cluster's JSON
-        # because it is not returned from the cluster GET endopint
-        cluster_json["control_plane"]["acl"] = safe_get_cluster_acl(cluster)
-
-        # Inject the APL URLs if APL is enabled
-        if cluster.apl_enabled:
-            cluster_json["apl_console_url"] = cluster.apl_console_url
-            cluster_json["apl_health_check_url"] = cluster.apl_health_check_url
-
-        self.results["cluster"] = cluster_json
-
-        self.results["node_pools"] = [
-            jsonify_node_pool(pool) for pool in cluster.pools
-        ]
-
-        # Retrieve kubeconfig
+    @staticmethod
+    def _get_kubeconfig(cluster: LKECluster) -> str:
         try:
-            self.results["kubeconfig"] = cluster.kubeconfig
+            return cluster.kubeconfig
         except ApiError as err:
             ignored_error_messages = {
                 503: "Kubeconfig not yet available...",
@@ -181,18 +181,67 @@ class LinodeLKEClusterInfo(LinodeModuleBase):
             if err.status not in ignored_error_messages:
                 raise err
 
-            self.results["kubeconfig"] = ignored_error_messages[err.status]
+            return ignored_error_messages[err.status]
 
-        # Retrieve dashboard URL
+    def _get_dashboard_url(self, cluster: LKECluster) -> str:
         try:
-            self.results["dashboard_url"] = self.client.get(
+            return self.client.get(
                 "/lke/clusters/{}/dashboard".format(cluster.id)
             )["url"]
         except ApiError as err:
             if err.status != 503:
                 raise err
 
-            self.results["dashboard_url"] = "Dashboard URL not yet available..."
+            return "Dashboard URL not yet available..."
+
+    def _populate_results(self, cluster: LKECluster) -> None:
+        cluster._api_get()
+
+        cluster_json = cluster._raw_json
+
+        # The remaining requests only depend on the cluster,
+        # so they can be made concurrently
+        getters = {
+            "acl": lambda: safe_get_cluster_acl(cluster),
+            "node_pools": lambda: [
+                jsonify_node_pool(pool) for pool in cluster.pools
+            ],
+            "kubeconfig": lambda: self._get_kubeconfig(cluster),
+            "dashboard_url": lambda: self._get_dashboard_url(cluster),
+        }
+
+        getters = {
+            k: v
+            for k, v in getters.items()
+            if k == "acl" or is_result_selected(k, self.module.params)
+        }
+
+        results = iter_concurrent_results(
+            lambda get: get(),
+            getters.values(),
+            max_workers=self.module.params.get("result_concurrency") or 1,
+        )
+
+        values = {}
+
+        with closing(results):
+            for key, (value, exception) in zip(getters, results):
+                if exception is not None:
+                    raise exception
+
+                values[key] = value
+
+        # We need to inject the control plane ACL configuration into the cluster's JSON
+        # because it is not returned from the cluster GET endopint
+        cluster_json["control_plane"]["acl"] = values.pop("acl")
+
+        # Inject the APL URLs if APL is enabled
+        if cluster.apl_enabled:
+            cluster_json["apl_console_url"] = cluster.apl_console_url
+            cluster_json["apl_health_check_url"] = cluster.apl_health_check_url
+
+        self.results["cluster"] = cluster_json
+        self.results.update(values)
 
     def exec_module(self, **kwargs: Any) -> Optional[dict]:
         """Entrypoint for LKE cluster info module"""
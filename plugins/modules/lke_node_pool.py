@@ -19,6 +19,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import
     filter_null_values,
     handle_updates,
     jsonify_node_pool,
+    poll_condition,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -295,7 +296,7 @@ class LinodeLKENodePool(LinodeModuleBase):
             return True
 
         try:
-            polling.poll(
+            poll_condition(
                 _check_pool_nodes_ready,
                 step=4,
                 timeout=timeout,
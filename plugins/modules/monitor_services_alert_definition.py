@@ -19,6 +19,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
     filter_null_values,
     handle_updates,
+    poll_condition,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -315,12 +316,8 @@ class LinodeMonitorServicesAlertDefinition(LinodeModuleBase):
             alert_definition._api_get()
             return alert_definition.status not in ["in progress"]
 
-        # Initial attempt
-        if poll_func():
-            return
-
         try:
-            polling.poll(
+            poll_condition(
                 poll_func,
                 step=10,
                 timeout=self._timeout_ctx.seconds_remaining,
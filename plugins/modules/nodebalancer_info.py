@@ -19,6 +19,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info im
     InfoModuleResult,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    find_by_values,
     safe_find,
 )
 from ansible_specdoc.objects import FieldType
@@ -116,6 +117,9 @@ module = InfoModule(
                 NodeBalancer,
                 params.get("id"),
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/nodebalancers", "id", values
+            ),
         ),
         InfoModuleAttr(
             display_name="label",
@@ -126,6 +130,9 @@ module = InfoModule(
                 NodeBalancer.label == params.get("label"),
                 raise_not_found=True,
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/nodebalancers", "label", values
+            ),
         ),
     ],
     examples=docs.specdoc_examples,
@@ -16,6 +16,9 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
 )
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    poll_condition,
+)
 from ansible_specdoc.objects import (
     FieldType,
     SpecDocMeta,
@@ -184,12 +187,8 @@ class LinodeVolume(LinodeModuleBase):
             volume._api_get()
             return volume.status in status
 
-        # Initial attempt
-        if poll_func():
-            return
-
         try:
-            polling.poll(
+            poll_condition(
                 poll_func,
                 step=5,
                 timeout=timeout,
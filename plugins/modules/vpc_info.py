@@ -13,6 +13,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info im
     InfoModuleResult,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    find_by_values,
     safe_find,
 )
 from ansible_specdoc.objects import FieldType
@@ -35,6 +36,9 @@ module = InfoModule(
                 VPC,
                 params.get("id"),
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/vpcs", "id", values
+            ),
         ),
         InfoModuleAttr(
             display_name="label",
@@ -45,6 +49,9 @@ module = InfoModule(
                 VPC.label == params.get("label"),
                 raise_not_found=True,
             )._raw_json,
+            batch_get=lambda client, values, params: find_by_values(
+                client, "/vpcs", "label", values
+            ),
         ),
     ],
     examples=docs.specdoc_examples,
@@ -32,7 +32,7 @@ def _subnet_by_label(
     label = params.get("label")
     vpc = client.load(VPC, params.get("vpc_id"))
     return safe_find(
-        lambda: [v for v in vpc.subnets if v.label == label],
+        lambda: (v for v in vpc.subnets if v.label == label),
         raise_not_found=True,
     )._raw_json
 
@@ -0,0 +1,364 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""This module allows users to wait for many Linode entities in a single task."""
+
+from __future__ import absolute_import, division, print_function
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.wait_for as docs
+import polling
+from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
+    LinodeModuleBase,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
+    global_authors,
+    global_requirements,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    find_by_values,
+    get_all_paginated,
+    iter_concurrent_results,
+    poll_condition,
+)
+from ansible_specdoc.objects import (
+    FieldType,
+    SpecDocMeta,
+    SpecField,
+    SpecReturnValue,
+)
+
+try:
+    from linode_api4 import ApiError, LinodeClient
+except ImportError:
+    # handled in module_utils.linode_common
+    pass
+
+# The initial number of seconds between polls, which backs off
+# while entities remain pending
+WAIT_FOR_POLL_STEP = 4
+
+# The maximum number of resource types and LKE clusters listed concurrently
+WAIT_FOR_CONCURRENCY = 4
+
+# The status of the entity keyed by entity ID, along with its listed JSON
+EntityStatuses = Dict[int, Tuple[str, Dict[str, Any]]]
+
+
+class WaitForEntityType:
+    """
+    A type of entity whose statuses are listed in bulk from a single
+    paginated endpoint.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        default_status: str,
+        failed_statuses: Tuple[str, ...] = (),
+    ):
+        self.endpoint = endpoint
+        self.default_status = default_status
+
+        # Statuses that entities will not recover from
+        self.failed_statuses = failed_statuses
+
+    def list_statuses(
+        self, client: LinodeClient, entity_ids: List[int]
+    ) -> EntityStatuses:
+        """Returns the status of each of the given entities that exists."""
+
+        return {
+            v["id"]: (v["status"], v)
+            for v in find_by_values(client, self.endpoint, "id", entity_ids)
+        }
+
+
+class LKEClusterWaitForEntityType(WaitForEntityType):
+    """
+    The nodes of LKE clusters, which are ready when every node of every
+    pool in the cluster is ready.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("/lke/clusters/{}/pools", "ready")
+
+    def _get_status(
+        self, client: LinodeClient, cluster_id: int
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        try:
+            pools = get_all_paginated(
+                client, self.endpoint.format(cluster_id), None
+            )
+        except ApiError as err:
+            if err.status == 404:
+                return None
+            raise
+
+        nodes = [node for pool in pools for node in pool["nodes"]]
+
+        # Pools are briefly listed without nodes while they provision
+        ready = len(nodes) > 0 and all(v["status"] == "ready" for v in nodes)
+
+        return (
+            "ready" if ready else "not_ready",
+            {"id": cluster_id, "pools": pools},
+        )
+
+    def list_statuses(
+        self, client: LinodeClient, entity_ids: List[int]
+    ) -> EntityStatuses:
+        # Node pools can only be listed one cluster at a time
+        result = {}
+
+        for cluster_id, (status, err) in zip(
+            entity_ids,
+            iter_concurrent_results(
+                lambda v: self._get_status(client, v),
+                entity_ids,
+                max_workers=WAIT_FOR_CONCURRENCY,
+            ),
+        ):
+            if err is not None:
+                raise err
+
+            if status is not None:
+                result[cluster_id] = status
+
+        return result
+
+
+ENTITY_TYPES = {
+    "instance": WaitForEntityType("/linode/instances", "running"),
+    "volume": WaitForEntityType("/volumes", "active"),
+    "database": WaitForEntityType(
+        "/databases/instances", "active", failed_statuses=("failed",)
+    ),
+    "lke_cluster": LKEClusterWaitForEntityType(),
+}
+
+wait_for_entity_spec = {
+    "type": SpecField(
+        type=FieldType.string,
+        required=True,
+        choices=list(ENTITY_TYPES.keys()),
+        description=[
+            "The type of this entity.",
+            "The nodes of lke_cluster entities are waited for "
+            "rather than the cluster itself.",
+        ],
+    ),
+    "id": SpecField(
+        type=FieldType.integer,
+        required=True,
+        description=["The ID of this entity."],
+    ),
+    "status": SpecField(
+        type=FieldType.string,
+        description=[
+            "The status to wait for this entity to have.",
+            "Defaults to running for instances, active for volumes and "
+            "databases, and ready for LKE clusters.",
+            "LKE clusters are ready when all of their nodes are ready, "
+            "and not_ready otherwise.",
+        ],
+    ),
+}
+
+spec = {
+    "entities": SpecField(
+        type=FieldType.list,
+        element_type=FieldType.dict,
+        suboptions=wait_for_entity_spec,
+        required=True,
+        description=["The entities to wait for."],
+    ),
+    "wait_timeout": SpecField(
+        type=FieldType.integer,
+        default=600,
+        description=[
+            "The amount of time, in seconds, to wait for all entities to "
+            "have their status."
+        ],
+    ),
+}
+
+SPECDOC_META = SpecDocMeta(
+    description=[
+        "Wait for many Linode entities of different types to have "
+        "the given statuses.",
+        "Each poll lists the statuses of all pending entities of a type "
+        "with a single bulk request, except for LKE clusters whose node "
+        "pools are listed once per cluster.",
+    ],
+    requirements=global_requirements,
+    author=global_authors,
+    options=spec,
+    examples=docs.specdoc_examples,
+    return_values={
+        "entities": SpecReturnValue(
+            description=[
+                "The last polled status of each entity in the order they "
+                "were given.",
+                "The entity field contains the listed entity, or the node "
+                "pools of LKE clusters.",
+            ],
+            type=FieldType.list,
+            sample=docs.result_entities_samples,
+        ),
+        "pending": SpecReturnValue(
+            description=[
+                "The entities that did not have their status when the "
+                "module finished."
+            ],
+            type=FieldType.list,
+            sample=docs.result_pending_samples,
+        ),
+    },
+)
+
+DOCUMENTATION = r"""
+"""
+EXAMPLES = r"""
+"""
+RETURN = r"""
+"""
+
+
+def _describe(entity: Dict[str, Any]) -> str:
+    return f"{entity['type']} {entity['id']} ({entity['status']})"
+
+
+class Module(LinodeModuleBase):
+    """Module for waiting for many Linode entities"""
+
+    def __init__(self) -> None:
+        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.results: Dict[str, Any] = {
+            "changed": False,
+            "actions": [],
+            "entities": [],
+            "pending": [],
+        }
+
+        super().__init__(module_arg_spec=self.module_arg_spec)
+
+    def _list_statuses(
+        self, pending: Dict[str, List[int]]
+    ) -> Dict[str, EntityStatuses]:
+        """
+        Returns the statuses of the given pending entity IDs keyed by
+        entity type, listing each type concurrently.
+        """
+
+        result = {}
+
+        for entity_type, (statuses, err) in zip(
+            pending,
+            iter_concurrent_results(
+                lambda v: ENTITY_TYPES[v].list_statuses(
+                    self.client, pending[v]
+                ),
+                pending,
+                max_workers=WAIT_FOR_CONCURRENCY,
+            ),
+        ):
+            if err is not None:
+                raise err
+
+            result[entity_type] = statuses
+
+        return result
+
+    def _poll(self, entities: List[Dict[str, Any]]) -> bool:
+        """
+        Polls the statuses of the pending entities and returns whether
+        every entity has its status.
+        """
+
+        pending: Dict[str, List[int]] = {}
+
+        for entity in entities:
+            if not entity["ready"]:
+                pending.setdefault(entity["type"], []).append(entity["id"])
+
+        statuses = self._list_statuses(pending)
+
+        for entity in entities:
+            if entity["ready"]:
+                continue
+
+            listed = statuses[entity["type"]].get(entity["id"])
+            if listed is None:
+                self.fail(
+                    msg=f"{entity['type']} {entity['id']} does not exist",
+                    **self._with_pending(entities),
+                )
+
+            entity["status"], entity["entity"] = listed
+            entity["ready"] = entity["status"] == entity["target_status"]
+
+            if entity["status"] in ENTITY_TYPES[entity["type"]].failed_statuses:
+                self.fail(
+                    msg=f"{_describe(entity)} failed",
+                    **self._with_pending(entities),
+                )
+
+        return all(v["ready"] for v in entities)
+
+    def _with_pending(self, entities: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Returns the results with the given entities and those pending."""
+
+        self.results["entities"] = [
+            {k: v for k, v in entity.items() if k != "target_status"}
+            for entity in entities
+        ]
+        self.results["pending"] = [
+            {k: v for k, v in entity.items() if k != "entity"}
+            for entity in self.results["entities"]
+            if not entity["ready"]
+        ]
+
+        return self.results
+
+    def exec_module(self, **kwargs: Any) -> Optional[dict]:
+        """Entrypoint for wait_for module"""
+
+        entities = [
+            {
+                "type": v["type"],
+                "id": v["id"],
+                "target_status": v["status"]
+                or ENTITY_TYPES[v["type"]].default_status,
+                "status": None,
+                "ready": False,
+                "entity": None,
+            }
+            for v in kwargs["entities"]
+        ]
+
+        try:
+            poll_condition(
+                lambda: self._poll(entities),
+                step=WAIT_FOR_POLL_STEP,
+                timeout=self._timeout_ctx.seconds_remaining,
+            )
+        except polling.TimeoutException:
+            self._with_pending(entities)
+            self.fail(
+                msg="timed out waiting for entities: "
+                + ", ".join(_describe(v) for v in self.results["pending"]),
+                **self.results,
+            )
+
+        return self._with_pending(entities)
+
+
+def main() -> None:
+    """Constructs and calls the wait_for module"""
+    Module()
+
+
+if __name__ == "__main__":
+    main()
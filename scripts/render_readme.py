@@ -109,6 +109,16 @@ def list_inventory():
     )
 
 
+def list_callback():
+    return sorted(
+        [
+            ".".join(f.split(".")[:-1])
+            for f in os.listdir("plugins/callback")
+            if ".py" in f
+        ]
+    )
+
+
 def main() -> None:
     add_ansible_collection_path()
 
@@ -122,6 +132,7 @@ def main() -> None:
             "info_modules": list_info_modules(),
             "list_modules": list_list_modules(),
             "inventory": list_inventory(),
+            "callback": list_callback(),
         }
     )
 
@@ -0,0 +1,259 @@
+import contextlib
+import difflib
+import importlib
+import io
+import json
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+from ansible.module_utils import basic
+from ansible.plugins import loader as plugin_loader
+
+if hasattr(plugin_loader, "init_plugin_loader"):
+    # The inventory plugin is loaded through the collection loader, which
+    # must be installed before anything is imported from ansible_collections.
+    # ansible-core < 2.15 installs it on import.
+    plugin_loader.init_plugin_loader(
+        [
+            v
+            for v in sys.path
+            if os.path.isdir(os.path.join(v, "ansible_collections", "linode"))
+        ]
+    )
+
+from linode_api4 import LinodeClient
+
+from ansible_collections.linode.cloud.plugins.inventory import (
+    instance as instance_inventory,
+)
+from ansible_collections.linode.cloud.tests.benchmark.mock_api import (
+    MockLinodeAPI,
+)
+
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    # ansible-core < 2.19
+    @contextlib.contextmanager
+    def patch_module_args(args=None):
+        previous = basic._ANSIBLE_ARGS
+        basic._ANSIBLE_ARGS = json.dumps(
+            {"ANSIBLE_MODULE_ARGS": args or {}}
+        ).encode("utf-8")
+
+        try:
+            yield
+        finally:
+            basic._ANSIBLE_ARGS = previous
+
+
+MODULES_PACKAGE = "ansible_collections.linode.cloud.plugins.modules"
+
+GOLDEN_PATH = Path(__file__).parent / "golden"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("linode benchmark")
+    group.addoption(
+        "--mock-latency",
+        type=float,
+        default=0.0,
+        help="Seconds of latency the mock API adds to every request.",
+    )
+    group.addoption(
+        "--mock-rate-limit-every",
+        type=int,
+        default=0,
+        help="Respond to every Nth mock API request with a 429.",
+    )
+    group.addoption(
+        "--update-golden",
+        action="store_true",
+        default=False,
+        help="Rewrite the golden request logs from the current behavior.",
+    )
+
+
+class ModuleRunner:
+    """Runs Linode modules in-process against a mock API."""
+
+    def __init__(self, api: MockLinodeAPI):
+        self.api = api
+
+    def __call__(self, name: str, **params: Any) -> Dict[str, Any]:
+        """Runs the given module with the given parameters and returns its result."""
+
+        module = importlib.import_module(f"{MODULES_PACKAGE}.{name}")
+
+        args = {
+            "api_token": "benchmark",
+            "api_url": self.api.url,
+            "api_version": "v4",
+            # The shared rate limiter and event spool state would leak
+            # between benchmarks
+            "rate_limit": False,
+            "share_event_polling": False,
+            **params,
+        }
+
+        stdout = io.StringIO()
+
+        with patch_module_args(args), contextlib.redirect_stdout(stdout):
+            try:
+                if hasattr(module, "main"):
+                    module.main()
+                else:
+                    # Info and list modules are module-level singletons
+                    module.module._client = None
+                    module.module.run()
+            except SystemExit:
+                pass
+
+        result = json.loads(stdout.getvalue())
+
+        if result.get("failed"):
+            raise AssertionError(f"module {name} failed: {result['msg']}")
+
+        return result
+
+
+@pytest.fixture
+def mock_api(request):
+    with MockLinodeAPI(
+        latency=request.config.getoption("--mock-latency"),
+        rate_limit_every=request.config.getoption("--mock-rate-limit-every"),
+    ) as api:
+        yield api
+
+
+@pytest.fixture
+def run_module(mock_api):
+    return ModuleRunner(mock_api)
+
+
+# The number of API requests made by the last round of each benchmark
+_request_counts: Dict[str, int] = {}
+
+
+@pytest.fixture
+def inventory_plugin(mock_api, monkeypatch):
+    """Returns the instance inventory plugin with its client pointed at the mock API."""
+
+    def _client(token: str, **kwargs: Any) -> LinodeClient:
+        return LinodeClient(
+            token, base_url=mock_api.account_for_token(token).base_url, **kwargs
+        )
+
+    monkeypatch.setattr(instance_inventory, "LinodeClient", _client)
+
+    return plugin_loader.inventory_loader.get("linode.cloud.instance")
+
+
+def _format_request_diff(expected: List[str], actual: List[str]) -> str:
+    lines = [
+        f"expected {len(expected)} requests, got {len(actual)}",
+    ]
+
+    expected_counts, actual_counts = Counter(expected), Counter(actual)
+    for endpoint in sorted(set(expected_counts) | set(actual_counts)):
+        if expected_counts[endpoint] != actual_counts[endpoint]:
+            lines.append(
+                f"  {endpoint}: {expected_counts[endpoint]} -> "
+                f"{actual_counts[endpoint]}"
+            )
+
+    lines.extend(
+        difflib.unified_diff(
+            expected, actual, "golden", "actual", lineterm="", n=2
+        )
+    )
+
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def assert_golden_requests(request, mock_api):
+    """
+    Returns a function that compares the requests received by the mock API
+    against the golden request log of the current test.
+
+    Requests made concurrently arrive in no particular order; these are
+    compared regardless of order if `ordered` is false.
+    """
+
+    def _assert(ordered: bool = True) -> None:
+        path = GOLDEN_PATH / f"{request.node.name}.json"
+        actual = list(mock_api.request_log)
+
+        if not ordered:
+            actual.sort()
+
+        if request.config.getoption("--update-golden"):
+            GOLDEN_PATH.mkdir(exist_ok=True)
+            path.write_text(
+                json.dumps({"count": len(actual), "requests": actual}, indent=2)
+                + "\n"
+            )
+            return
+
+        if not path.exists():
+            pytest.fail(
+                f"no golden request log at {path}; "
+                "run with --update-golden to record one"
+            )
+
+        expected = json.loads(path.read_text())["requests"]
+
+        if actual != expected:
+            pytest.fail(
+                "API requests differ from the golden request log; if this "
+                "is intended, run with --update-golden and commit the "
+                "result.\n" + _format_request_diff(expected, actual),
+                pytrace=False,
+            )
+
+    return _assert
+
+
+@pytest.fixture
+def run_benchmark(request, mock_api):
+    """
+    Returns a function that benchmarks the given function and records the
+    number of API requests made by a single round in the benchmark's extra info.
+    """
+
+    pytest.importorskip("pytest_benchmark")
+    benchmark = request.getfixturevalue("benchmark")
+
+    def _run(func: Callable[[], Any], rounds: int = 5, setup=None) -> Any:
+        def _round() -> Any:
+            mock_api.reset_counts()
+            return func()
+
+        result = benchmark.pedantic(
+            _round, setup=setup, rounds=rounds, iterations=1, warmup_rounds=0
+        )
+
+        benchmark.extra_info["requests"] = mock_api.request_count
+        benchmark.extra_info["requests_by_endpoint"] = dict(
+            sorted(mock_api.requests.items())
+        )
+        _request_counts[request.node.nodeid] = mock_api.request_count
+
+        return result
+
+    return _run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if len(_request_counts) < 1:
+        return
+
+    terminalreporter.section("linode api requests per round")
+
+    for nodeid, count in sorted(_request_counts.items()):
+        terminalreporter.write_line(f"{count:>8}  {nodeid}")
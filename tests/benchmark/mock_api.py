@@ -0,0 +1,1206 @@
+"""
+An in-process stand-in for the Linode API used to benchmark the collection.
+
+The mock implements the generic REST semantics of the API (paginated and
+filterable collections, item CRUD, actions and events) on top of an
+in-memory store, along with the handful of special-case endpoints used by
+the benchmarked modules. Latency and rate limiting (429) responses can be
+injected to simulate a loaded API.
+"""
+
+import copy
+import ipaddress
+import itertools
+import json
+import math
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+MIN_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+DEFAULT_PAGE_SIZE = 100
+
+RATE_LIMIT_LIMIT = 800
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+REGIONS = ("us-east", "us-west", "us-central", "eu-west", "ap-south")
+TYPES = ("g6-nanode-1", "g6-standard-1", "g6-standard-2", "g6-dedicated-4")
+
+# Path segments that trigger an action on the parent resource rather than
+# creating an entry in a sub-collection.
+ACTIONS = {
+    "attach",
+    "boot",
+    "clone",
+    "detach",
+    "migrate",
+    "password",
+    "reboot",
+    "rebuild",
+    "recycle",
+    "regenerate",
+    "resize",
+    "shutdown",
+    "upgrade",
+}
+
+# The event entity type for each top-level collection
+ENTITY_TYPES = {
+    "linode/instances": "linode",
+    "lke/clusters": "lkecluster",
+    "nodebalancers": "nodebalancer",
+    "volumes": "volume",
+    "domains": "domain",
+    "networking/firewalls": "firewall",
+    "vpcs": "vpc",
+}
+
+# Event actions that are not named after the action endpoint
+EVENT_ACTIONS = {"linode_migrate": "linode_migrate_datacenter"}
+
+# Sub-resources whose events are reported with their own entity type
+SUB_RESOURCE_ENTITY_TYPES = {"disks": "disks"}
+
+_RESOURCE_ID_PATTERN = re.compile(r"^\d+$")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _ip(value: int) -> str:
+    return f"10.{(value >> 16) & 0xFF}.{(value >> 8) & 0xFF}.{value & 0xFF}"
+
+
+def _ipv6(value: int, prefix: str) -> str:
+    # The value is used as the interface identifier of the address
+    return str(ipaddress.IPv6Address(prefix) + value)
+
+
+def _get_field(obj: Any, key: str) -> Any:
+    for part in key.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(part)
+
+    return obj
+
+
+def _match_value(value: Any, condition: Any) -> bool:
+    if not isinstance(condition, dict):
+        if isinstance(value, list):
+            return condition in value
+
+        return value == condition
+
+    for operator, operand in condition.items():
+        if operator == "+contains":
+            if operand not in (value or ""):
+                return False
+        elif operator == "+neq":
+            if value == operand:
+                return False
+        elif operator in ("+gt", "+gte", "+lt", "+lte"):
+            if value is None:
+                return False
+
+            if not {
+                "+gt": value > operand,
+                "+gte": value >= operand,
+                "+lt": value < operand,
+                "+lte": value <= operand,
+            }[operator]:
+                return False
+        elif operator == "+or":
+            if not any(_match_value(value, v) for v in operand):
+                return False
+        elif operator == "+and":
+            if not all(_match_value(value, v) for v in operand):
+                return False
+
+    return True
+
+
+def matches_filter(obj: Dict[str, Any], api_filter: Dict[str, Any]) -> bool:
+    """Returns whether the given object matches the given X-Filter document."""
+
+    for key, condition in api_filter.items():
+        if key in ("+order_by", "+order"):
+            continue
+
+        if key == "+and":
+            if not all(matches_filter(obj, v) for v in condition):
+                return False
+        elif key == "+or":
+            if not any(matches_filter(obj, v) for v in condition):
+                return False
+        elif not _match_value(_get_field(obj, key), condition):
+            return False
+
+    return True
+
+
+class MockResponse:
+    """A response produced by the mock API."""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.status = status
+        self.body = {} if body is None else body
+        self.headers = headers or {}
+
+
+def _error(status: int, reason: str, field: Optional[str] = None):
+    error = {"reason": reason}
+    if field is not None:
+        error["field"] = field
+
+    return MockResponse(status, {"errors": [error]})
+
+
+class MockLinodeAPI:
+    """
+    An in-memory Linode API served over HTTP on a random local port.
+
+    Usage::
+
+        with MockLinodeAPI(latency=0.01) as api:
+            api.seed(instances=500)
+            client = LinodeClient("token", base_url=api.base_url)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: int = 0,
+        euuid: Optional[str] = None,
+        first_id: int = 1000,
+        event_delay: float = 0.0,
+    ):
+        # The number of seconds to wait before responding to each request
+        self.latency = latency
+
+        # The number of seconds before emitted events are listed, as the
+        # API may take a moment to list the event of an accepted job
+        self.event_delay = event_delay
+
+        # Respond with a 429 to every Nth request if greater than zero
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+
+        # The unique identifier of the mocked account
+        self.euuid = euuid or str(uuid.uuid4()).upper()
+
+        # The mocked child accounts of this account, and the other mocked
+        # accounts that tokens grant access to
+        self.child_accounts: List["MockLinodeAPI"] = []
+        self.tokens: Dict[str, "MockLinodeAPI"] = {}
+
+        # The IDs of the proxy tokens created for this account that have
+        # not been revoked
+        self.proxy_token_ids: Set[int] = set()
+
+        self.store: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.events: List[Dict[str, Any]] = []
+        self._event_times: Dict[int, float] = {}
+        self.requests: Counter = Counter()
+
+        # The templated endpoint of every request in the order they were received
+        self.request_log: List[str] = []
+
+        # Resource IDs are unique across accounts, so mocked accounts used
+        # together should be given distinct ranges of IDs
+        self._ids = itertools.count(first_id)
+        self._lock = threading.RLock()
+        self._request_number = 0
+
+        # Errors to respond to requests matching each method and path
+        # pattern with, after skipping the given number of matching requests
+        self._injected_errors: List[List[Any]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._special_routes: List[
+            Tuple[str, re.Pattern, Callable[..., MockResponse]]
+        ] = [
+            ("GET", re.compile(r"^linode/instances/(\d+)/ips$"), self._ips),
+            (
+                "GET",
+                re.compile(r"^lke/clusters/(\d+)/kubeconfig$"),
+                self._kubeconfig,
+            ),
+            (
+                "GET",
+                re.compile(r"^lke/clusters/(\d+)/dashboard$"),
+                self._dashboard,
+            ),
+            (
+                "GET",
+                re.compile(r"^lke/clusters/(\d+)/api-endpoints$"),
+                self._api_endpoints,
+            ),
+            (
+                "GET",
+                re.compile(r"^lke/clusters/(\d+)/control_plane_acl$"),
+                self._control_plane_acl,
+            ),
+            ("GET", re.compile(r"^profile$"), self._profile),
+            ("GET", re.compile(r"^account$"), self._account),
+            (
+                "POST",
+                re.compile(r"^account/child-accounts/([^/]+)/token$"),
+                self._child_account_token,
+            ),
+            (
+                "DELETE",
+                re.compile(r"^profile/tokens/(\d+)$"),
+                self._revoke_token,
+            ),
+        ]
+
+    # Server lifecycle
+
+    @property
+    def base_url(self) -> str:
+        """The API base URL including the API version."""
+
+        return f"{self.url}v4"
+
+    @property
+    def url(self) -> str:
+        """The root URL of the server, as accepted by the `api_url` option."""
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "MockLinodeAPI":
+        """Starts serving requests in a background thread."""
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Dispatches HTTP requests to the mock API."""
+
+            protocol_version = "HTTP/1.1"
+
+            # Headers and bodies are written separately, which otherwise
+            # stalls small keep-alive responses on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length > 0 else b""
+
+                response = api.handle(
+                    self.command,
+                    self.path,
+                    dict(self.headers.items()),
+                    json.loads(raw_body) if raw_body else None,
+                )
+
+                payload = json.dumps(response.body).encode("utf-8")
+
+                self.send_response(response.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+            do_PUT = _dispatch
+            do_DELETE = _dispatch
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops the server."""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockLinodeAPI":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    # Accounts
+
+    def account_json(self) -> Dict[str, Any]:
+        """Returns the JSON of the mocked account."""
+
+        return {
+            "euuid": self.euuid,
+            "company": f"company-{self.euuid[:8].lower()}",
+            "email": "benchmark@example.com",
+            "capabilities": [],
+        }
+
+    def account_for_token(self, token: str) -> "MockLinodeAPI":
+        """Returns the mocked account the given token grants access to."""
+
+        return self.tokens.get(token, self)
+
+    # Accounting
+
+    @property
+    def request_count(self) -> int:
+        """The total number of requests handled by the mock."""
+
+        return sum(self.requests.values())
+
+    def reset_counts(self) -> None:
+        """Resets the recorded request counts and log."""
+
+        with self._lock:
+            self.requests.clear()
+            self.request_log.clear()
+
+    def fail_next(
+        self,
+        method: str,
+        path_pattern: str,
+        status: int,
+        reason: str,
+        skip: int = 0,
+    ) -> None:
+        """
+        Responds with an error to a single request with the given method
+        whose path, without the API version, fully matches the given pattern.
+
+        The first `skip` matching requests are handled normally.
+        """
+
+        with self._lock:
+            self._injected_errors.append(
+                [method, re.compile(path_pattern), _error(status, reason), skip]
+            )
+
+    def _pop_injected_error(
+        self, method: str, path: str
+    ) -> Optional[MockResponse]:
+        with self._lock:
+            for i, injected in enumerate(self._injected_errors):
+                error_method, pattern, response, skip = injected
+
+                if error_method != method or not pattern.fullmatch(path):
+                    continue
+
+                if skip > 0:
+                    injected[3] -= 1
+                    continue
+
+                del self._injected_errors[i]
+                return response
+
+        return None
+
+    # Seeding
+
+    def next_id(self) -> int:
+        """Returns a new unique resource ID."""
+
+        return next(self._ids)
+
+    def seed(
+        self,
+        instances: int = 0,
+        volumes: int = 0,
+        lke_clusters: int = 0,
+        nodebalancers: int = 0,
+        domains: int = 0,
+        configs_per_instance: int = 1,
+        disks_per_instance: int = 2,
+    ) -> None:
+        """Populates the store with a synthetic account of the given size."""
+
+        with self._lock:
+            for i in range(instances):
+                instance = self.create(
+                    "linode/instances",
+                    {
+                        "label": f"instance-{i}",
+                        "region": REGIONS[i % len(REGIONS)],
+                        "type": TYPES[i % len(TYPES)],
+                        "tags": [f"tag-{i % 10}", "benchmark"],
+                        "group": f"group-{i % 5}",
+                    },
+                    emit_event=False,
+                )
+
+                for j in range(disks_per_instance):
+                    self.create(
+                        f"linode/instances/{instance['id']}/disks",
+                        {"label": f"disk-{j}"},
+                        emit_event=False,
+                    )
+
+                for j in range(configs_per_instance):
+                    self.create(
+                        f"linode/instances/{instance['id']}/configs",
+                        {"label": f"config-{j}"},
+                        emit_event=False,
+                    )
+
+            for i in range(volumes):
+                self.create(
+                    "volumes",
+                    {"label": f"volume-{i}", "region": REGIONS[i % 5]},
+                    emit_event=False,
+                )
+
+            for i in range(lke_clusters):
+                self.create(
+                    "lke/clusters",
+                    {
+                        "label": f"cluster-{i}",
+                        "region": REGIONS[i % 5],
+                        "node_pools": [{"type": TYPES[0], "count": 3}],
+                    },
+                    emit_event=False,
+                )
+
+            for i in range(nodebalancers):
+                self.create(
+                    "nodebalancers",
+                    {"label": f"nodebalancer-{i}", "region": REGIONS[i % 5]},
+                    emit_event=False,
+                )
+
+            for i in range(domains):
+                self.create(
+                    "domains",
+                    {"domain": f"domain-{i}.example.com", "type": "master"},
+                    emit_event=False,
+                )
+
+    # Resource defaults
+
+    def _defaults(self, collection: str, obj_id: int) -> Dict[str, Any]:
+        now = _now()
+        base = {"id": obj_id, "created": now, "updated": now}
+
+        if collection == "linode/instances":
+            return {
+                **base,
+                "label": f"linode{obj_id}",
+                "group": "",
+                "status": "running",
+                "type": TYPES[0],
+                "region": REGIONS[0],
+                "image": "linode/ubuntu22.04",
+                "ipv4": [_ip(obj_id)],
+                "ipv6": f"{_ipv6(obj_id, '2600:3c00::')}/128",
+                "hypervisor": "kvm",
+                "watchdog_enabled": True,
+                "tags": [],
+                "specs": {
+                    "disk": 25600,
+                    "memory": 1024,
+                    "vcpus": 1,
+                    "gpus": 0,
+                    "transfer": 1000,
+                },
+                "alerts": {
+                    "cpu": 90,
+                    "io": 10000,
+                    "network_in": 10,
+                    "network_out": 10,
+                    "transfer_quota": 80,
+                },
+                "backups": {
+                    "enabled": False,
+                    "available": False,
+                    "schedule": {"day": None, "window": None},
+                    "last_successful": None,
+                },
+                "host_uuid": f"{obj_id:032x}",
+                "disk_encryption": "disabled",
+                "lke_cluster_id": None,
+                "placement_group": None,
+                "capabilities": [],
+                "interface_generation": "legacy_config",
+                "maintenance_policy": "linode/migrate",
+            }
+
+        if collection.endswith("/disks"):
+            return {
+                **base,
+                "label": f"disk{obj_id}",
+                "status": "ready",
+                "size": 10240,
+                "filesystem": "ext4",
+                "disk_encryption": "disabled",
+            }
+
+        if collection.endswith("/configs") and collection.startswith("linode/"):
+            return {
+                **base,
+                "label": f"config{obj_id}",
+                "comments": "",
+                "kernel": "linode/grub2",
+                "memory_limit": 0,
+                "root_device": "/dev/sda",
+                "run_level": "default",
+                "virt_mode": "paravirt",
+                "devices": {},
+                "helpers": {
+                    "devtmpfs_automount": True,
+                    "distro": True,
+                    "modules_dep": True,
+                    "network": True,
+                    "updatedb_disabled": True,
+                },
+                "interfaces": [],
+            }
+
+        if collection == "volumes":
+            return {
+                **base,
+                "label": f"volume{obj_id}",
+                "status": "active",
+                "size": 20,
+                "region": REGIONS[0],
+                "linode_id": None,
+                "linode_label": None,
+                "filesystem_path": f"/dev/disk/by-id/scsi-0Linode_Volume_{obj_id}",
+                "tags": [],
+                "hardware_type": "nvme",
+                "encryption": "disabled",
+            }
+
+        if collection == "lke/clusters":
+            return {
+                **base,
+                "label": f"cluster{obj_id}",
+                "region": REGIONS[0],
+                "k8s_version": "1.31",
+                "status": "ready",
+                "tags": [],
+                "control_plane": {"high_availability": False},
+                "apl_enabled": False,
+                "tier": "standard",
+            }
+
+        if collection.endswith("/pools") and collection.startswith("lke/"):
+            return {
+                **base,
+                "type": TYPES[0],
+                "count": 1,
+                "nodes": [],
+                "disks": [],
+                "tags": [],
+                "labels": {},
+                "taints": [],
+                "autoscaler": {"enabled": False, "min": 1, "max": 1},
+                "disk_encryption": "disabled",
+            }
+
+        if collection == "nodebalancers":
+            return {
+                **base,
+                "label": f"nodebalancer{obj_id}",
+                "region": REGIONS[0],
+                "hostname": f"nb-{obj_id}.newark.nodebalancer.linode.com",
+                "ipv4": _ip(obj_id + 1),
+                "ipv6": None,
+                "client_conn_throttle": 0,
+                "tags": [],
+                "transfer": {"in": 0, "out": 0, "total": 0},
+            }
+
+        if collection.endswith("/configs") and collection.startswith(
+            "nodebalancers/"
+        ):
+            return {
+                **base,
+                "nodebalancer_id": int(collection.split("/")[1]),
+                "port": 80,
+                "protocol": "http",
+                "algorithm": "roundrobin",
+                "stickiness": "none",
+                "check": "none",
+                "check_interval": 0,
+                "check_timeout": 30,
+                "check_attempts": 3,
+                "check_path": "",
+                "check_body": "",
+                "check_passive": True,
+                "cipher_suite": "recommended",
+                "ssl_commonname": "",
+                "ssl_fingerprint": "",
+                "ssl_cert": None,
+                "ssl_key": None,
+                "proxy_protocol": "none",
+                "nodes_status": {"up": 0, "down": 0},
+            }
+
+        if collection.endswith("/nodes") and collection.startswith(
+            "nodebalancers/"
+        ):
+            segments = collection.split("/")
+            return {
+                **base,
+                "nodebalancer_id": int(segments[1]),
+                "config_id": int(segments[3]),
+                "label": f"node{obj_id}",
+                "address": f"{_ip(obj_id)}:80",
+                "weight": 50,
+                "mode": "accept",
+                "status": "UP",
+            }
+
+        if collection == "domains":
+            return {
+                **base,
+                "domain": f"domain{obj_id}.example.com",
+                "type": "master",
+                "status": "active",
+                "soa_email": "admin@example.com",
+                "description": "",
+                "group": "",
+                "tags": [],
+                "ttl_sec": 0,
+                "refresh_sec": 0,
+                "retry_sec": 0,
+                "expire_sec": 0,
+                "master_ips": [],
+                "axfr_ips": [],
+            }
+
+        if collection == "networking/firewalls":
+            return {
+                **base,
+                "label": f"firewall{obj_id}",
+                "status": "enabled",
+                "tags": [],
+                "rules": {
+                    "inbound": [],
+                    "inbound_policy": "ACCEPT",
+                    "outbound": [],
+                    "outbound_policy": "ACCEPT",
+                },
+                "entities": [],
+            }
+
+        return base
+
+    # Store operations
+
+    def create(
+        self,
+        collection: str,
+        body: Optional[Dict[str, Any]] = None,
+        emit_event: bool = True,
+    ) -> Dict[str, Any]:
+        """Creates a resource in the given collection and returns it."""
+
+        body = copy.deepcopy(body or {})
+
+        with self._lock:
+            obj_id = self.next_id()
+            obj = self._defaults(collection, obj_id)
+
+            # Nested pools are created as a sub-collection of the cluster
+            node_pools = (
+                body.pop("node_pools", [])
+                if collection == "lke/clusters"
+                else []
+            )
+
+            for key, value in body.items():
+                if key in obj or not isinstance(value, (dict, list)):
+                    obj[key] = value
+
+            self.store.setdefault(collection, {})[obj_id] = obj
+
+            for pool in node_pools:
+                self._create_pool(obj_id, pool)
+
+            if collection.startswith("lke/clusters/") and collection.endswith(
+                "/pools"
+            ):
+                self._populate_pool_nodes(obj)
+
+            if emit_event:
+                self._emit_event(collection, obj_id, "create")
+
+            return obj
+
+    def find(self, collection: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Returns the first resource in the given collection with the given field values."""
+
+        with self._lock:
+            for obj in self.store.get(collection, {}).values():
+                if all(obj.get(k) == v for k, v in fields.items()):
+                    return obj
+
+        return None
+
+    def _create_pool(self, cluster_id: int, body: Dict[str, Any]) -> None:
+        self.create(f"lke/clusters/{cluster_id}/pools", body, emit_event=False)
+
+    def _populate_pool_nodes(self, pool: Dict[str, Any]) -> None:
+        pool["nodes"] = [
+            {
+                "id": f"{pool['id']}-{i:08x}",
+                "instance_id": self.next_id(),
+                "status": "ready",
+            }
+            for i in range(pool.get("count", 1))
+        ]
+
+    def _emit_event(
+        self, collection_or_path: str, entity_id: int, verb: str
+    ) -> None:
+        segments = collection_or_path.split("/")
+
+        # Events are reported against the top-level resource
+        top_level = None
+        for key, entity_type in ENTITY_TYPES.items():
+            if collection_or_path == key or collection_or_path.startswith(
+                key + "/"
+            ):
+                top_level = (key, entity_type)
+                break
+
+        if top_level is None:
+            return
+
+        key, entity_type = top_level
+        key_length = len(key.split("/"))
+
+        action_prefix = entity_type
+        if len(segments) > key_length + 1:
+            # Sub-resource events, e.g. disk_create for linode/instances/1/disks
+            sub_resource = segments[key_length + 1]
+
+            entity_id = int(segments[key_length])
+            entity_type = SUB_RESOURCE_ENTITY_TYPES.get(
+                sub_resource, entity_type
+            )
+            action_prefix = sub_resource.rstrip("s")
+
+            if entity_type == "linode" and action_prefix == "config":
+                action_prefix = "linode_config"
+
+        action = f"{action_prefix}_{verb}"
+
+        event_id = self.next_id()
+        self._event_times[event_id] = time.monotonic()
+
+        self.events.insert(
+            0,
+            {
+                "id": event_id,
+                "action": EVENT_ACTIONS.get(action, action),
+                "created": _now(),
+                "status": "finished",
+                "percent_complete": 100,
+                "time_remaining": 0,
+                "seen": False,
+                "read": False,
+                "rate": None,
+                "username": "benchmark",
+                "message": None,
+                "duration": 0,
+                "entity": {
+                    "id": entity_id,
+                    "type": entity_type,
+                    "label": "",
+                    "url": f"/v4/{key}/{entity_id}",
+                },
+                "secondary_entity": None,
+            },
+        )
+
+    # Request handling
+
+    def _should_rate_limit(self) -> bool:
+        with self._lock:
+            self._request_number += 1
+
+            return (
+                self.rate_limit_every > 0
+                and self._request_number % self.rate_limit_every == 0
+            )
+
+    def handle(
+        self,
+        method: str,
+        raw_path: str,
+        headers: Dict[str, str],
+        body: Optional[Dict[str, Any]],
+    ) -> MockResponse:
+        """Handles a single API request."""
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        parsed = urlparse(raw_path)
+        segments = [v for v in parsed.path.split("/") if v != ""]
+
+        if len(segments) > 0 and re.match(r"^v\d+(beta)?$", segments[0]):
+            segments = segments[1:]
+
+        path = "/".join(segments)
+
+        endpoint = f"{method} /" + "/".join(
+            "{id}" if _RESOURCE_ID_PATTERN.match(v) else v for v in segments
+        )
+
+        with self._lock:
+            self.requests[endpoint] += 1
+            self.request_log.append(endpoint)
+
+        reset = str(int(time.time()) + RATE_LIMIT_WINDOW_SECONDS)
+
+        if self._should_rate_limit():
+            return MockResponse(
+                429,
+                {"errors": [{"reason": "Too Many Requests"}]},
+                {
+                    "Retry-After": str(self.retry_after),
+                    "X-RateLimit-Limit": str(RATE_LIMIT_LIMIT),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(
+                        int(time.time()) + self.retry_after
+                    ),
+                },
+            )
+
+        response = self._pop_injected_error(method, path) or self._route(
+            method, path, parse_qs(parsed.query), headers, body
+        )
+
+        response.headers.setdefault("X-RateLimit-Limit", str(RATE_LIMIT_LIMIT))
+        response.headers.setdefault(
+            "X-RateLimit-Remaining", str(RATE_LIMIT_LIMIT)
+        )
+        response.headers.setdefault("X-RateLimit-Reset", reset)
+
+        return response
+
+    def _route(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        headers: Dict[str, str],
+        body: Optional[Dict[str, Any]],
+    ) -> MockResponse:
+        for route_method, pattern, handler in self._special_routes:
+            match = pattern.match(path)
+            if route_method == method and match is not None:
+                return handler(*match.groups())
+
+        if path == "account/events":
+            return self._paginate(self._listed_events(), query, headers)
+
+        if path == "account/child-accounts":
+            return self._paginate(
+                [v.account_json() for v in self.child_accounts], query, headers
+            )
+
+        if path == "networking/ips":
+            return self._paginate(self._all_ips(), query, headers)
+
+        segments = path.split("/")
+
+        with self._lock:
+            if method == "GET":
+                if _RESOURCE_ID_PATTERN.match(segments[-1]):
+                    return self._get_item(segments)
+
+                return self._paginate(
+                    list(self.store.get(path, {}).values()), query, headers
+                )
+
+            if method == "POST":
+                if segments[-1] in ACTIONS:
+                    return self._action(segments, body)
+
+                return MockResponse(200, self.create(path, body))
+
+            if method == "PUT":
+                obj = self._find(segments)
+                if obj is None:
+                    return _error(404, "Not found")
+
+                obj.update(body or {})
+                obj["updated"] = _now()
+                self._emit_event(path, obj["id"], "update")
+                return MockResponse(200, obj)
+
+            if method == "DELETE":
+                collection = "/".join(segments[:-1])
+                obj = self._find(segments)
+                if obj is None:
+                    return _error(404, "Not found")
+
+                del self.store[collection][obj["id"]]
+
+                for key in [k for k in self.store if k.startswith(path + "/")]:
+                    del self.store[key]
+
+                self._emit_event(path, obj["id"], "delete")
+                return MockResponse(200, {})
+
+        return _error(405, "Method not allowed")
+
+    def _listed_events(self) -> List[Dict[str, Any]]:
+        listed_before = time.monotonic() - self.event_delay
+
+        return [
+            v
+            for v in self.events
+            if self._event_times.get(v["id"], 0) <= listed_before
+        ]
+
+    def _find(self, segments: List[str]) -> Optional[Dict[str, Any]]:
+        if not _RESOURCE_ID_PATTERN.match(segments[-1]):
+            return None
+
+        return self.store.get("/".join(segments[:-1]), {}).get(
+            int(segments[-1])
+        )
+
+    def _get_item(self, segments: List[str]) -> MockResponse:
+        if "/".join(segments[:-1]) == "account/events":
+            for event in self._listed_events():
+                if event["id"] == int(segments[-1]):
+                    return MockResponse(200, event)
+
+            return _error(404, "Not found")
+
+        obj = self._find(segments)
+        if obj is None:
+            return _error(404, "Not found")
+
+        return MockResponse(200, obj)
+
+    def _action(
+        self, segments: List[str], body: Optional[Dict[str, Any]]
+    ) -> MockResponse:
+        resource_path = "/".join(segments[:-1])
+        obj = self._find(segments[:-1])
+
+        if obj is None:
+            return _error(404, "Not found")
+
+        if segments[-1] == "resize" and body is not None and "type" in body:
+            obj["type"] = body["type"]
+
+        if segments[-1] == "resize" and body is not None and "size" in body:
+            obj["size"] = body["size"]
+
+        if segments[-1] == "shutdown":
+            obj["status"] = "offline"
+        elif segments[-1] in ("boot", "reboot"):
+            obj["status"] = "running"
+
+        self._emit_event(resource_path, obj["id"], segments[-1])
+
+        return MockResponse(200, {})
+
+    def _paginate(
+        self,
+        entries: List[Dict[str, Any]],
+        query: Dict[str, List[str]],
+        headers: Dict[str, str],
+    ) -> MockResponse:
+        page = int(query.get("page", ["1"])[0])
+        page_size = int(query.get("page_size", [str(DEFAULT_PAGE_SIZE)])[0])
+
+        if page_size < MIN_PAGE_SIZE or page_size > MAX_PAGE_SIZE:
+            return _error(
+                400,
+                f"Must be between {MIN_PAGE_SIZE} and {MAX_PAGE_SIZE}",
+                field="page_size",
+            )
+
+        raw_filter = headers.get("X-Filter")
+        if raw_filter is not None:
+            api_filter = json.loads(raw_filter)
+            entries = [v for v in entries if matches_filter(v, api_filter)]
+
+            order_by = api_filter.get("+order_by")
+            if order_by is not None:
+                entries = sorted(
+                    entries,
+                    key=lambda v: _get_field(v, order_by) or 0,
+                    reverse=api_filter.get("+order") == "desc",
+                )
+
+        pages = max(math.ceil(len(entries) / page_size), 1)
+        start = (page - 1) * page_size
+
+        return MockResponse(
+            200,
+            {
+                "data": entries[start : start + page_size],
+                "page": page,
+                "pages": pages,
+                "results": len(entries),
+            },
+        )
+
+    # Special-case endpoints
+
+    def _ips(self, instance_id: str) -> MockResponse:
+        instance = self.store.get("linode/instances", {}).get(int(instance_id))
+        if instance is None:
+            return _error(404, "Not found")
+
+        address = {
+            "address": instance["ipv4"][0],
+            "gateway": "10.0.0.1",
+            "subnet_mask": "255.255.255.0",
+            "prefix": 24,
+            "type": "ipv4",
+            "public": True,
+            "rdns": f"{instance['ipv4'][0]}.ip.linodeusercontent.com",
+            "linode_id": instance["id"],
+            "region": instance["region"],
+            "vpc_nat_1_1": None,
+            "reserved": False,
+        }
+
+        # Like the API, the link-local address shares the interface
+        # identifier of the SLAAC address
+        slaac = {
+            "address": (instance["ipv6"] or "").split("/")[0],
+            "gateway": "fe80::1",
+            "subnet_mask": "ffff:ffff:ffff:ffff::",
+            "prefix": 64,
+            "type": "ipv6",
+            "public": True,
+            "rdns": None,
+            "linode_id": instance["id"],
+            "region": instance["region"],
+        }
+
+        return MockResponse(
+            200,
+            {
+                "ipv4": {
+                    "public": [address],
+                    "private": [],
+                    "shared": [],
+                    "reserved": [],
+                    "vpc": [],
+                },
+                "ipv6": {
+                    "link_local": {
+                        **slaac,
+                        "address": _ipv6(instance["id"], "fe80::"),
+                        "rdns": None,
+                        "public": False,
+                    },
+                    "slaac": slaac,
+                    "global": [],
+                },
+            },
+        )
+
+    def _all_ips(self) -> List[Dict[str, Any]]:
+        addresses = []
+
+        # Like the API, private and link-local addresses are not listed
+        for instance in self.store.get("linode/instances", {}).values():
+            ips = self._ips(instance["id"]).body
+            addresses.extend(ips["ipv4"]["public"])
+
+            if instance.get("ipv6") is not None:
+                addresses.append(ips["ipv6"]["slaac"])
+
+        return addresses
+
+    def _kubeconfig(self, cluster_id: str) -> MockResponse:
+        return MockResponse(200, {"kubeconfig": "YXBpVmVyc2lvbjogdjEK"})
+
+    def _dashboard(self, cluster_id: str) -> MockResponse:
+        return MockResponse(
+            200, {"url": f"https://{cluster_id}.dashboard.example.com"}
+        )
+
+    def _api_endpoints(self, cluster_id: str) -> MockResponse:
+        return self._paginate(
+            [{"endpoint": f"https://{cluster_id}.k8s.example.com:443"}],
+            {},
+            {},
+        )
+
+    def _control_plane_acl(self, cluster_id: str) -> MockResponse:
+        return MockResponse(
+            200,
+            {
+                "acl": {
+                    "enabled": False,
+                    "addresses": {"ipv4": [], "ipv6": []},
+                }
+            },
+        )
+
+    def _profile(self) -> MockResponse:
+        return MockResponse(200, {"username": "benchmark", "uid": 1})
+
+    def _account(self) -> MockResponse:
+        return MockResponse(200, self.account_json())
+
+    def _child_account_token(self, euuid: str) -> MockResponse:
+        child = next((v for v in self.child_accounts if v.euuid == euuid), None)
+        if child is None:
+            return _error(404, "Not found")
+
+        token = f"proxy-{euuid}"
+        token_id = self.next_id()
+        self.tokens[token] = child
+        child.proxy_token_ids.add(token_id)
+
+        return MockResponse(
+            200,
+            {
+                "id": token_id,
+                "label": token,
+                "token": token,
+                "scopes": "*",
+                "created": _now(),
+                "expiry": None,
+            },
+        )
+
+    def _revoke_token(self, token_id: str) -> MockResponse:
+        if int(token_id) not in self.proxy_token_ids:
+            return _error(404, "Not found")
+
+        self.proxy_token_ids.remove(int(token_id))
+        return MockResponse(200, {})
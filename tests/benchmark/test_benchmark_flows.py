@@ -0,0 +1,263 @@
+"""Benchmarks for end-to-end module flows that create and update resources."""
+
+import itertools
+
+import pytest
+
+_labels = itertools.count()
+
+
+def _unique_label(prefix):
+    # Every round creates a new resource so rounds are comparable
+    return f"{prefix}-{next(_labels)}"
+
+
+def test_instance_create(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=100)
+
+    result = run_benchmark(
+        lambda: run_module(
+            "instance",
+            label=_unique_label("bench-instance"),
+            region="us-east",
+            type="g6-standard-1",
+            image="linode/ubuntu22.04",
+            root_pass="Benchmark-Passw0rd!",
+            state="present",
+            wait=True,
+        )
+    )
+
+    assert result["changed"]
+    assert result["instance"]["status"] == "running"
+
+
+def test_instance_create_disks(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=100)
+
+    result = run_benchmark(
+        lambda: run_module(
+            "instance",
+            label=_unique_label("bench-instance"),
+            region="us-east",
+            type="g6-standard-1",
+            state="present",
+            booted=False,
+            disks=[
+                {"label": f"disk-{i}", "size": 1024, "filesystem": "ext4"}
+                for i in range(8)
+            ],
+            configs=[
+                {
+                    "label": "boot-config",
+                    "root_device": "/dev/sda",
+                    "devices": {"sda": {"disk_label": "disk-0"}},
+                }
+            ],
+        )
+    )
+
+    assert len(result["disks"]) == 8
+
+
+@pytest.mark.parametrize("module", ["instance_fleet", "instance"])
+def test_instance_fleet_create(mock_api, run_module, run_benchmark, module):
+    mock_api.seed(instances=100)
+
+    def _create():
+        instances = [
+            {
+                "label": _unique_label("bench-fleet"),
+                "region": "us-east",
+                "type": "g6-standard-1",
+                "image": "linode/ubuntu22.04",
+                "root_pass": "Benchmark-Passw0rd!",
+                "wait": True,
+            }
+            for _ in range(20)
+        ]
+
+        if module == "instance_fleet":
+            return run_module(
+                "instance_fleet", instances=instances, instance_concurrency=8
+            )["instances"]
+
+        # The equivalent of looping the instance module over each instance
+        return [run_module("instance", state="present", **v) for v in instances]
+
+    results = run_benchmark(_create)
+
+    assert all(v["changed"] for v in results)
+
+
+@pytest.mark.parametrize("module", ["wait_for", "instance_info"])
+def test_wait_for_instances(mock_api, run_module, run_benchmark, module):
+    mock_api.seed(instances=100)
+
+    instance_ids = list(mock_api.store["linode/instances"])[:20]
+
+    def _wait():
+        if module == "wait_for":
+            return run_module(
+                "wait_for",
+                entities=[{"type": "instance", "id": v} for v in instance_ids],
+            )["entities"]
+
+        # The equivalent of a single attempt of an until loop over each instance
+        return [run_module("instance_info", id=v) for v in instance_ids]
+
+    results = run_benchmark(_wait)
+
+    assert len(results) == 20
+
+
+def test_instance_update(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=100)
+
+    types = itertools.cycle(["g6-standard-2", "g6-standard-1"])
+
+    result = run_benchmark(
+        lambda: run_module(
+            "instance",
+            label="instance-4",
+            region="us-east",
+            type=next(types),
+            state="present",
+        )
+    )
+
+    assert result["changed"]
+
+
+def test_instance_delete(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=100)
+
+    labels = []
+
+    def _setup():
+        label = _unique_label("bench-instance")
+        mock_api.create(
+            "linode/instances",
+            {"label": label, "region": "us-east", "type": "g6-standard-1"},
+            emit_event=False,
+        )
+        labels.append(label)
+
+    result = run_benchmark(
+        lambda: run_module("instance", label=labels[-1], state="absent"),
+        setup=_setup,
+    )
+
+    assert result["changed"]
+
+
+def test_lke_cluster_create(mock_api, run_module, run_benchmark):
+    mock_api.seed(lke_clusters=5)
+
+    result = run_benchmark(
+        lambda: run_module(
+            "lke_cluster",
+            label=_unique_label("bench-cluster"),
+            region="us-east",
+            k8s_version="1.31",
+            node_pools=[
+                {"type": "g6-standard-1", "count": 3},
+                {"type": "g6-standard-2", "count": 2},
+            ],
+            state="present",
+        )
+    )
+
+    assert result["changed"]
+    assert len(result["node_pools"]) == 2
+
+
+def test_lke_cluster_update(mock_api, run_module, run_benchmark):
+    mock_api.seed(lke_clusters=5)
+
+    counts = itertools.cycle([4, 3])
+
+    result = run_benchmark(
+        lambda: run_module(
+            "lke_cluster",
+            label="cluster-2",
+            region=mock_api.find("lke/clusters", label="cluster-2")["region"],
+            k8s_version="1.31",
+            node_pools=[{"type": "g6-standard-1", "count": next(counts)}],
+            state="present",
+        )
+    )
+
+    assert result["changed"]
+
+
+def test_nodebalancer_create(mock_api, run_module, run_benchmark):
+    mock_api.seed(nodebalancers=5)
+
+    result = run_benchmark(
+        lambda: run_module(
+            "nodebalancer",
+            label=_unique_label("bench-nb"),
+            region="us-east",
+            state="present",
+            configs=[
+                {
+                    "port": port,
+                    "protocol": "http",
+                    "algorithm": "roundrobin",
+                    "nodes": [
+                        {
+                            "label": f"node-{i}",
+                            "address": f"192.168.1.{i}:{port}",
+                            "weight": 50,
+                            "mode": "accept",
+                        }
+                        for i in range(1, 4)
+                    ],
+                }
+                for port in (80, 8080)
+            ],
+        ),
+        # The module waits for configs to settle between polls
+        rounds=2,
+    )
+
+    assert result["changed"]
+    assert len(result["configs"]) == 2
+    assert len(result["nodes"]) == 6
+
+
+def test_nodebalancer_unchanged(mock_api, run_module, run_benchmark):
+    mock_api.seed(nodebalancers=5)
+
+    params = {
+        "label": "nodebalancer-1",
+        "region": mock_api.find("nodebalancers", label="nodebalancer-1")[
+            "region"
+        ],
+        "state": "present",
+        "configs": [
+            {
+                "port": 80,
+                "protocol": "http",
+                "algorithm": "roundrobin",
+                "nodes": [
+                    {
+                        "label": "node-1",
+                        "address": "192.168.1.1:80",
+                        "weight": 50,
+                        "mode": "accept",
+                    }
+                ],
+            }
+        ],
+    }
+
+    # The first run creates the config so the benchmarked runs are no-ops
+    run_module("nodebalancer", **params)
+
+    result = run_benchmark(
+        lambda: run_module("nodebalancer", **params), rounds=2
+    )
+
+    assert not result["changed"]
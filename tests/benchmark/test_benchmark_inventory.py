@@ -0,0 +1,135 @@
+"""Benchmarks for the Linode instance inventory plugin."""
+
+import contextlib
+
+import pytest
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+
+from ansible_collections.linode.cloud.tests.benchmark.mock_api import (
+    MockLinodeAPI,
+)
+
+
+def _parse(plugin, config_path):
+    inventory = InventoryData()
+    plugin.parse(inventory, DataLoader(), str(config_path), cache=False)
+    return inventory
+
+
+@pytest.mark.parametrize("instances", [100, 500])
+def test_inventory(
+    tmp_path, mock_api, inventory_plugin, run_benchmark, instances
+):
+    mock_api.seed(instances=instances)
+
+    config_path = tmp_path / "benchmark.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: benchmark\n"
+        "keyed_groups:\n"
+        "  - key: region\n"
+        "    prefix: region\n"
+    )
+
+    inventory = run_benchmark(lambda: _parse(inventory_plugin, config_path))
+
+    assert len(inventory.hosts) == instances
+    assert "region_us_east" in inventory.groups
+
+
+def test_inventory_filtered(
+    tmp_path, mock_api, inventory_plugin, run_benchmark
+):
+    mock_api.seed(instances=500)
+
+    config_path = tmp_path / "benchmark.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: benchmark\n"
+        "regions:\n"
+        "  - us-east\n"
+        "tags:\n"
+        "  - tag-5\n"
+    )
+
+    inventory = run_benchmark(lambda: _parse(inventory_plugin, config_path))
+
+    assert len(inventory.hosts) > 0
+    assert all(v.vars["region"] == "us-east" for v in inventory.hosts.values())
+
+
+def test_inventory_child_accounts(
+    request, tmp_path, mock_api, inventory_plugin, run_benchmark
+):
+    mock_api.seed(instances=100)
+
+    with contextlib.ExitStack() as stack:
+        mock_api.child_accounts = [
+            stack.enter_context(
+                MockLinodeAPI(
+                    latency=request.config.getoption("--mock-latency"),
+                    euuid=f"{i:08X}-CHILD",
+                    first_id=(i + 1) * 100000,
+                )
+            )
+            for i in range(8)
+        ]
+
+        for account in mock_api.child_accounts:
+            account.seed(instances=100)
+
+        config_path = tmp_path / "benchmark.linode.yml"
+        config_path.write_text(
+            "plugin: linode.cloud.instance\n"
+            "api_token: benchmark\n"
+            "child_accounts: true\n"
+            "max_workers: 8\n"
+            "keyed_groups:\n"
+            "  - key: account\n"
+            "    prefix: account\n"
+        )
+
+        inventory = run_benchmark(lambda: _parse(inventory_plugin, config_path))
+
+    assert len(inventory.hosts) == 900
+
+
+@pytest.mark.parametrize("grouping", ["group_by", "keyed_groups"])
+def test_inventory_grouped(
+    tmp_path, mock_api, inventory_plugin, run_benchmark, grouping
+):
+    mock_api.seed(instances=500)
+
+    fields = {"region": "region", "type": "type", "tags": "tag"}
+
+    if grouping == "group_by":
+        options = "group_by:\n" + "".join(f"  - {k}\n" for k in fields)
+    else:
+        options = "keyed_groups:\n" + "".join(
+            f"  - key: {k}\n    prefix: {v}\n" for k, v in fields.items()
+        )
+
+    config_path = tmp_path / "benchmark.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\napi_token: benchmark\n" + options
+    )
+
+    inventory = run_benchmark(lambda: _parse(inventory_plugin, config_path))
+
+    # Both options build the same groups
+    expected = {}
+
+    for host in sorted(inventory.hosts.values(), key=lambda v: v.name):
+        for field, prefix in fields.items():
+            values = host.vars[field]
+
+            for value in values if isinstance(values, list) else [values]:
+                name = f"{prefix}_{value}".replace("-", "_")
+                expected.setdefault(name, []).append(host.name)
+
+    assert {
+        name: sorted(host.name for host in group.hosts)
+        for name, group in inventory.groups.items()
+        if name.startswith(("region_", "type_", "tag_"))
+    } == expected
@@ -0,0 +1,76 @@
+"""Benchmarks for the Linode list and info modules."""
+
+import pytest
+
+
+@pytest.mark.parametrize("instances", [100, 1000])
+def test_instance_list(mock_api, run_module, run_benchmark, instances):
+    mock_api.seed(instances=instances)
+
+    result = run_benchmark(lambda: run_module("instance_list"))
+
+    assert len(result["instances"]) == instances
+
+
+def test_instance_list_filtered(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=1000)
+
+    result = run_benchmark(
+        lambda: run_module(
+            "instance_list",
+            filters=[{"name": "region", "values": ["us-east"]}],
+        )
+    )
+
+    assert len(result["instances"]) > 0
+    assert all(v["region"] == "us-east" for v in result["instances"])
+
+
+def test_volume_list(mock_api, run_module, run_benchmark):
+    mock_api.seed(volumes=500)
+
+    result = run_benchmark(lambda: run_module("volume_list"))
+
+    assert len(result["volumes"]) == 500
+
+
+def test_instance_info(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=500)
+
+    result = run_benchmark(
+        lambda: run_module("instance_info", label="instance-250")
+    )
+
+    assert result["instance"]["label"] == "instance-250"
+    assert len(result["disks"]) == 2
+
+
+def test_instance_info_batch(mock_api, run_module, run_benchmark):
+    mock_api.seed(instances=500)
+
+    labels = [f"instance-{i}" for i in range(0, 500, 5)]
+
+    result = run_benchmark(lambda: run_module("instance_info", labels=labels))
+
+    assert list(result["results_by_label"]) == labels
+    assert len(result["results_by_label"]["instance-250"]["disks"]) == 2
+
+
+def test_lke_cluster_info(mock_api, run_module, run_benchmark):
+    mock_api.seed(lke_clusters=10)
+
+    result = run_benchmark(
+        lambda: run_module("lke_cluster_info", label="cluster-5")
+    )
+
+    assert result["cluster"]["label"] == "cluster-5"
+
+
+def test_nodebalancer_info(mock_api, run_module, run_benchmark):
+    mock_api.seed(nodebalancers=10)
+
+    result = run_benchmark(
+        lambda: run_module("nodebalancer_info", label="nodebalancer-5")
+    )
+
+    assert result["node_balancer"]["label"] == "nodebalancer-5"
@@ -0,0 +1,711 @@
+"""
+Regression tests for the API requests made by modules in canonical scenarios.
+
+Each test compares the requests received by the mock API against a golden
+request log under `golden/`, so changes that add requests (e.g. a new lazy
+property access) fail until the golden log is deliberately updated with
+`--update-golden`.
+"""
+
+import contextlib
+import importlib
+import tempfile
+import threading
+
+import pytest
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible_collections.linode.cloud.tests.benchmark.mock_api import (
+    MockLinodeAPI,
+)
+
+INSTANCE_DISKS_CONFIG = {
+    "label": "golden-instance",
+    "region": "us-east",
+    "type": "g6-standard-1",
+    "state": "present",
+    "booted": True,
+    "wait": True,
+    "disks": [
+        {
+            "label": "boot",
+            "size": 10000,
+            "image": "linode/ubuntu22.04",
+            "root_pass": "Golden-Passw0rd!",
+        },
+        {"label": "swap", "size": 512, "filesystem": "swap"},
+    ],
+    "configs": [
+        {
+            "label": "boot-config",
+            "root_device": "/dev/sda",
+            "devices": {
+                "sda": {"disk_label": "boot"},
+                "sdb": {"disk_label": "swap"},
+            },
+        }
+    ],
+}
+
+NODEBALANCER_CONFIG = {
+    "port": 80,
+    "protocol": "http",
+    "algorithm": "roundrobin",
+    "nodes": [
+        {
+            "label": f"node-{i}",
+            "address": f"192.168.1.{i}:80",
+            "weight": 50,
+            "mode": "accept",
+        }
+        for i in range(1, 3)
+    ],
+}
+
+
+def test_instance_create_disks_config(
+    mock_api, run_module, assert_golden_requests
+):
+    mock_api.seed(instances=10)
+
+    run_module("instance", **INSTANCE_DISKS_CONFIG)
+
+    assert_golden_requests()
+
+
+def test_instance_create_disks_busy(
+    mock_api, run_module, assert_golden_requests
+):
+    mock_api.seed(instances=10)
+
+    # The second disk is rejected while the first disk is being created
+    mock_api.fail_next(
+        "POST", r"linode/instances/\d+/disks", 400, "Linode busy.", skip=1
+    )
+
+    result = run_module("instance", **INSTANCE_DISKS_CONFIG)
+
+    assert [v["label"] for v in result["disks"]] == ["boot", "swap"]
+
+    assert_golden_requests()
+
+
+def test_instance_update_disks_order(
+    mock_api, run_module, assert_golden_requests
+):
+    mock_api.seed(instances=10)
+
+    run_module("instance", **INSTANCE_DISKS_CONFIG)
+    mock_api.reset_counts()
+
+    boot, swap = INSTANCE_DISKS_CONFIG["disks"]
+
+    result = run_module(
+        "instance",
+        **{
+            **INSTANCE_DISKS_CONFIG,
+            "disks": [
+                {"label": "data", "size": 2000, "filesystem": "ext4"},
+                {**boot, "size": 12000},
+                swap,
+                {"label": "scratch", "size": 1000, "filesystem": "ext4"},
+            ],
+        },
+    )
+
+    assert {v["label"]: v["size"] for v in result["disks"]} == {
+        "boot": 12000,
+        "swap": 512,
+        "data": 2000,
+        "scratch": 1000,
+    }
+
+    # Disk jobs are submitted in the order the disks were given
+    assert [v for v in mock_api.request_log if v.startswith("POST")] == [
+        "POST /linode/instances/{id}/disks",
+        "POST /linode/instances/{id}/disks/{id}/resize",
+        "POST /linode/instances/{id}/disks",
+    ]
+
+    assert_golden_requests()
+
+
+def test_instance_create_disks_event_delay(mock_api, run_module, monkeypatch):
+    mock_api.seed(instances=10)
+
+    # The event of the first disk is not listed until after the second
+    # disk would have been submitted
+    mock_api.event_delay = 0.5
+
+    events = importlib.import_module(
+        "ansible_collections.linode.cloud.plugins.module_utils.linode_events"
+    )
+    wait_for_next_event = events.AdaptiveEventPoller.wait_for_next_event
+    found = []
+
+    def _wait_for_next_event(poller, *args, **kwargs):
+        event = wait_for_next_event(poller, *args, **kwargs)
+        found.append((event.action, event.id))
+        return event
+
+    monkeypatch.setattr(
+        events.AdaptiveEventPoller, "wait_for_next_event", _wait_for_next_event
+    )
+
+    run_module("instance", **INSTANCE_DISKS_CONFIG)
+
+    # Each disk job waits for its own event
+    disk_events = [v for v in found if v[0] == "disk_create"]
+    assert len(disk_events) == 2
+    assert len(set(disk_events)) == 2
+
+
+def test_instance_create_shared_events(
+    tmp_path, monkeypatch, mock_api, run_module, assert_golden_requests
+):
+    # The event spool is kept in the temporary directory
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    mock_api.seed(instances=10)
+
+    run_module("instance", share_event_polling=True, **INSTANCE_DISKS_CONFIG)
+
+    assert list(tmp_path.glob("ansible-linode-events-*.json"))
+
+    assert_golden_requests()
+
+
+def test_instance_fleet(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=10)
+
+    result = run_module(
+        "instance_fleet",
+        instances=[
+            # Unchanged
+            {"label": "instance-0"},
+            # Updated
+            {"label": "instance-1", "tags": ["fleet"]},
+            # Created
+            *(
+                {
+                    "label": f"fleet-{i}",
+                    "region": "us-east",
+                    "type": "g6-standard-1",
+                    "image": "linode/ubuntu22.04",
+                    "root_pass": "Golden-Passw0rd!",
+                }
+                for i in range(3)
+            ),
+            # Deleted
+            {"label": "instance-2", "state": "absent"},
+            # Already absent
+            {"label": "fleet-absent", "state": "absent"},
+        ],
+        # Concurrent instances would make the reuse of memoized
+        # responses depend on timing
+        instance_concurrency=1,
+    )
+
+    assert [v["changed"] for v in result["instances"]] == [
+        False,
+        True,
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+    assert result["instances"][1]["instance"]["tags"] == ["fleet"]
+
+    assert_golden_requests()
+
+
+def test_instance_delete(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=10)
+
+    run_module("instance", label="instance-3", state="absent")
+
+    assert_golden_requests()
+
+
+def test_instance_info(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=10)
+
+    run_module("instance_info", label="instance-3")
+
+    assert_golden_requests(ordered=False)
+
+
+def test_instance_info_exclude(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=10)
+
+    run_module("instance_info", label="instance-3", exclude=["networking"])
+
+    assert_golden_requests(ordered=False)
+
+
+def test_instance_info_batch(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=100)
+
+    run_module(
+        "instance_info",
+        labels=[f"instance-{i}" for i in range(60)],
+        include=["disks"],
+    )
+
+    assert_golden_requests(ordered=False)
+
+
+def test_nodebalancer_info(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(nodebalancers=5)
+
+    run_module("nodebalancer_info", label="nodebalancer-3")
+
+    assert_golden_requests(ordered=False)
+
+
+def test_lke_cluster_info(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(lke_clusters=5)
+
+    run_module("lke_cluster_info", label="cluster-3")
+
+    assert_golden_requests(ordered=False)
+
+
+def test_lke_cluster_info_include(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(lke_clusters=5)
+
+    run_module("lke_cluster_info", label="cluster-3", include=["node_pools"])
+
+    assert_golden_requests(ordered=False)
+
+
+def test_instance_list(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(instances=1000)
+
+    run_module("instance_list")
+
+    assert_golden_requests()
+
+
+def test_domain_list(mock_api, run_module, assert_golden_requests):
+    mock_api.seed(domains=1000)
+
+    run_module("domain_list")
+
+    assert_golden_requests()
+
+
+def _wait_for_entities(mock_api):
+    mock_api.seed(instances=3, volumes=3, lke_clusters=2)
+
+    database = mock_api.create(
+        "databases/instances",
+        {"label": "database-0", "status": "active"},
+        emit_event=False,
+    )
+
+    return [
+        *(
+            {"type": "instance", "id": v}
+            for v in mock_api.store["linode/instances"]
+        ),
+        *({"type": "volume", "id": v} for v in mock_api.store["volumes"]),
+        *(
+            {"type": "lke_cluster", "id": v}
+            for v in mock_api.store["lke/clusters"]
+        ),
+        {"type": "database", "id": database["id"]},
+    ]
+
+
+def test_wait_for(mock_api, run_module, assert_golden_requests):
+    entities = _wait_for_entities(mock_api)
+
+    result = run_module("wait_for", entities=entities)
+
+    assert [(v["type"], v["id"]) for v in result["entities"]] == [
+        (v["type"], v["id"]) for v in entities
+    ]
+    assert all(v["ready"] for v in result["entities"])
+    assert result["pending"] == []
+
+    # Resource types are listed concurrently
+    assert_golden_requests(ordered=False)
+
+
+def test_wait_for_pending(mock_api, run_module, monkeypatch):
+    entities = _wait_for_entities(mock_api)
+
+    monkeypatch.setattr(
+        importlib.import_module(
+            "ansible_collections.linode.cloud.plugins.modules.wait_for"
+        ),
+        "WAIT_FOR_POLL_STEP",
+        0.1,
+    )
+
+    instance = mock_api.store["linode/instances"][entities[0]["id"]]
+    instance["status"] = "provisioning"
+
+    timer = threading.Timer(0.5, instance.update, kwargs={"status": "running"})
+    timer.start()
+
+    try:
+        result = run_module("wait_for", entities=entities, wait_timeout=10)
+    finally:
+        timer.cancel()
+
+    assert result["pending"] == []
+
+    # Only pending resource types are listed again
+    assert mock_api.requests["GET /linode/instances"] > 1
+    assert mock_api.requests["GET /volumes"] == 1
+    assert mock_api.requests["GET /lke/clusters/{id}/pools"] == 2
+
+
+def test_wait_for_timeout(mock_api, run_module):
+    entities = _wait_for_entities(mock_api)
+
+    mock_api.store["volumes"][entities[3]["id"]]["status"] = "creating"
+
+    with pytest.raises(AssertionError) as err:
+        run_module("wait_for", entities=entities, wait_timeout=1)
+
+    assert str(err.value).endswith(
+        "timed out waiting for entities: "
+        f"volume {entities[3]['id']} (creating)"
+    )
+
+
+def test_lke_cluster_create(mock_api, run_module, assert_golden_requests):
+    run_module(
+        "lke_cluster",
+        label="golden-cluster",
+        region="us-east",
+        k8s_version="1.31",
+        node_pools=[
+            {"type": "g6-standard-1", "count": 3},
+            {"type": "g6-standard-2", "count": 2},
+        ],
+        state="present",
+    )
+
+    assert_golden_requests()
+
+
+def test_nodebalancer_update_configs(
+    mock_api, run_module, assert_golden_requests
+):
+    mock_api.seed(nodebalancers=1)
+
+    params = {
+        "label": "nodebalancer-0",
+        "region": "us-east",
+        "state": "present",
+    }
+
+    run_module("nodebalancer", configs=[NODEBALANCER_CONFIG], **params)
+    mock_api.reset_counts()
+
+    run_module(
+        "nodebalancer",
+        configs=[
+            {
+                **NODEBALANCER_CONFIG,
+                "algorithm": "leastconn",
+                "nodes": [
+                    *NODEBALANCER_CONFIG["nodes"],
+                    {
+                        "label": "node-3",
+                        "address": "192.168.1.3:80",
+                        "weight": 50,
+                        "mode": "accept",
+                    },
+                ],
+            },
+            {**NODEBALANCER_CONFIG, "port": 8080, "nodes": []},
+        ],
+        **params,
+    )
+
+    assert_golden_requests()
+
+
+def test_inventory(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=100)
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text("plugin: linode.cloud.instance\napi_token: golden\n")
+
+    inventory_plugin.parse(
+        InventoryData(), DataLoader(), str(config_path), cache=False
+    )
+
+    assert_golden_requests()
+
+
+def test_inventory_networking_info_per_instance(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=100)
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text("plugin: linode.cloud.instance\napi_token: golden\n")
+
+    bulk_inventory = InventoryData()
+    inventory_plugin.parse(
+        bulk_inventory, DataLoader(), str(config_path), cache=False
+    )
+    mock_api.reset_counts()
+
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: golden\n"
+        "bulk_networking_info: false\n"
+    )
+
+    inventory = InventoryData()
+    inventory_plugin.parse(
+        inventory, DataLoader(), str(config_path), cache=False
+    )
+
+    # The bulk listings build the same networking info as the
+    # per-instance requests
+    for name, host in inventory.hosts.items():
+        assert (
+            host.vars["networking_info"]
+            == bulk_inventory.get_host(name).vars["networking_info"]
+        )
+
+    # Instances are requested up to max_workers at a time
+    assert_golden_requests(ordered=False)
+
+
+def test_inventory_filtered(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=100)
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: golden\n"
+        "types:\n"
+        "  - g6-standard-1\n"
+        "tags:\n"
+        "  - tag-1\n"
+        "  - tag-3\n"
+        "filters:\n"
+        "  - name: group\n"
+        "    values:\n"
+        "      - group-0\n"
+        "      - group-1\n"
+    )
+
+    inventory = InventoryData()
+    inventory_plugin.parse(
+        inventory, DataLoader(), str(config_path), cache=False
+    )
+
+    assert set(inventory.hosts) == {
+        f"instance-{i}"
+        for i in range(100)
+        if i % 4 == 1 and i % 10 in (1, 3) and i % 5 in (0, 1)
+    }
+
+    assert_golden_requests()
+
+
+def test_inventory_cached(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=100)
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: golden\n"
+        "cache: true\n"
+        "cache_plugin: ansible.builtin.jsonfile\n"
+        f"cache_connection: {tmp_path / 'cache'}\n"
+    )
+
+    # The first run populates the cache, as if run with --flush-cache;
+    # the inventory manager writes the cache once the plugin has parsed
+    inventory_plugin.parse(
+        InventoryData(), DataLoader(), str(config_path), cache=False
+    )
+    inventory_plugin.update_cache_if_changed()
+    mock_api.reset_counts()
+
+    inventory = InventoryData()
+    inventory_plugin.parse(inventory, DataLoader(), str(config_path))
+
+    assert len(inventory.hosts) == 100
+    assert "networking_info" in inventory.get_host("instance-3").vars
+
+    assert_golden_requests()
+
+
+def test_inventory_enriched(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=20)
+
+    instance_ids = sorted(mock_api.store["linode/instances"])
+    firewall = mock_api.create(
+        "networking/firewalls",
+        {
+            "label": "golden-firewall",
+            "entities": [{"id": v, "type": "linode"} for v in instance_ids[:5]],
+        },
+        emit_event=False,
+    )
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: golden\n"
+        "enrich:\n"
+        "  - configs\n"
+        "  - disks\n"
+        "  - firewalls\n"
+    )
+
+    inventory = InventoryData()
+    inventory_plugin.parse(
+        inventory, DataLoader(), str(config_path), cache=False
+    )
+
+    hostvars = inventory.get_host("instance-3").vars
+    assert hostvars["firewall_ids"] == [firewall["id"]]
+    assert [v["label"] for v in hostvars["disks"]] == ["disk-0", "disk-1"]
+    assert [v["label"] for v in hostvars["configs"]] == ["config-0"]
+    assert inventory.get_host("instance-10").vars["firewall_ids"] == []
+
+    assert_golden_requests(ordered=False)
+
+
+def test_inventory_incremental(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=100)
+
+    instance_ids = sorted(mock_api.store["linode/instances"])
+
+    config_path = tmp_path / "golden.linode.yml"
+    config_path.write_text(
+        "plugin: linode.cloud.instance\n"
+        "api_token: golden\n"
+        "cache: true\n"
+        "cache_plugin: ansible.builtin.jsonfile\n"
+        f"cache_connection: {tmp_path / 'cache'}\n"
+        "incremental: true\n"
+    )
+
+    # Changes made before the inventory is cached are not refreshed
+    mock_api.handle(
+        "POST", f"/v4/linode/instances/{instance_ids[0]}/reboot", {}, {}
+    )
+
+    inventory_plugin.parse(
+        InventoryData(), DataLoader(), str(config_path), cache=False
+    )
+    inventory_plugin.update_cache_if_changed()
+
+    mock_api.handle(
+        "PUT",
+        f"/v4/linode/instances/{instance_ids[3]}",
+        {},
+        {"tags": ["updated"]},
+    )
+    mock_api.handle("DELETE", f"/v4/linode/instances/{instance_ids[5]}", {}, {})
+    mock_api.handle(
+        "POST", "/v4/linode/instances", {}, {"label": "instance-new"}
+    )
+    mock_api.reset_counts()
+
+    inventory = InventoryData()
+    inventory_plugin.parse(inventory, DataLoader(), str(config_path))
+
+    assert len(inventory.hosts) == 100
+    assert "instance-5" not in inventory.hosts
+    assert inventory.get_host("instance-3").vars["tags"] == ["updated"]
+    assert "networking_info" in inventory.get_host("instance-new").vars
+
+    assert_golden_requests()
+
+
+def test_inventory_multi_account(
+    tmp_path, mock_api, inventory_plugin, assert_golden_requests
+):
+    mock_api.seed(instances=10)
+
+    with contextlib.ExitStack() as stack:
+        child_accounts = [
+            stack.enter_context(
+                MockLinodeAPI(euuid=f"{i:08X}-CHILD", first_id=(i + 1) * 100000)
+            )
+            for i in range(3)
+        ]
+        other = stack.enter_context(
+            MockLinodeAPI(euuid="00000000-OTHER", first_id=900000)
+        )
+
+        for account in [*child_accounts, other]:
+            account.seed(instances=10)
+
+        mock_api.child_accounts = child_accounts
+        mock_api.tokens["other"] = other
+
+        config_path = tmp_path / "golden.linode.yml"
+        config_path.write_text(
+            "plugin: linode.cloud.instance\n"
+            "api_token: golden\n"
+            "api_tokens:\n"
+            "  - other\n"
+            "child_accounts: true\n"
+        )
+
+        inventory = InventoryData()
+        inventory_plugin.parse(
+            inventory, DataLoader(), str(config_path), cache=False
+        )
+
+        # Every account has instances labeled instance-0 to instance-9
+        assert len(inventory.hosts) == 50
+        assert (
+            inventory.get_host("instance-3_00000000-OTHER").vars["account"]
+            == "00000000-OTHER"
+        )
+
+        # The accounts of child accounts are known from their listing,
+        # and their proxy tokens are revoked once used
+        assert [v.request_count for v in child_accounts] == [5, 5, 5]
+        assert not any(v.proxy_token_ids for v in child_accounts)
+        assert other.request_count == 5
+
+    assert_golden_requests(ordered=False)
+
+
+def test_inventory_token_scope(tmp_path, mock_api, inventory_plugin):
+    with MockLinodeAPI(euuid="00000000-OTHER", first_id=900000) as other:
+        mock_api.tokens["other"] = other
+        other.fail_next("GET", r"account", 403, "Unauthorized")
+
+        config_path = tmp_path / "golden.linode.yml"
+        config_path.write_text(
+            "plugin: linode.cloud.instance\n"
+            "api_token: golden\n"
+            "api_tokens:\n"
+            "  - other\n"
+        )
+
+        with pytest.raises(AnsibleError, match="account:read_only"):
+            inventory_plugin.parse(
+                InventoryData(), DataLoader(), str(config_path), cache=False
+            )
@@ -21,5 +21,11 @@ ANSIBLE_INVENTORY=keyedgroups.instance.yml ansible-playbook playbooks/test_inven
 ansible-playbook playbooks/create_inventory.yml --extra-vars "template=templatetoken.instance.yml" "$@"
 ANSIBLE_INVENTORY=templatetoken.instance.yml ansible-playbook playbooks/test_inventory_templatetoken.yml "$@"
 
+# Test an inventory cached on disk
+ansible-playbook playbooks/create_inventory.yml --extra-vars "template=cache.instance.yml" "$@"
+ANSIBLE_INVENTORY=cache.instance.yml ansible-playbook playbooks/test_inventory_cache.yml "$@"
+# The second run reads the inventory from the cache
+ANSIBLE_INVENTORY=cache.instance.yml ansible-playbook playbooks/test_inventory_cache.yml "$@"
+
 # Clean up
 ansible-playbook playbooks/teardown.yml "$@"
\ No newline at end of file
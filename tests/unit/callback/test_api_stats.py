@@ -0,0 +1,170 @@
+import os
+import sys
+
+import pytest
+from ansible.plugins import loader as plugin_loader
+
+if hasattr(plugin_loader, "init_plugin_loader"):
+    # The callback is loaded through the collection loader, which must be
+    # installed before anything is imported from ansible_collections.
+    # ansible-core < 2.15 installs it on import.
+    plugin_loader.init_plugin_loader(
+        [
+            v
+            for v in sys.path
+            if os.path.isdir(os.path.join(v, "ansible_collections", "linode"))
+        ]
+    )
+
+from ansible_collections.linode.cloud.plugins.callback.api_stats import (
+    ApiStats,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    METRICS_RESULT_KEY,
+)
+
+
+def _metrics(requests=1, latency=0.2, endpoint="GET /linode/instances"):
+    return {
+        "requests": requests,
+        "errors": 0,
+        "retries": 1,
+        "rate_limited": 0,
+        "api_seconds": latency * requests,
+        "poll_sleep_seconds": 1.0,
+        "event_poll_sleep_seconds": 0.5,
+        "duration_seconds": 3.0,
+        "endpoints": {
+            endpoint: {
+                "count": requests,
+                "errors": 0,
+                "retries": 1,
+                "rate_limited": 0,
+                "latency_seconds_total": latency * requests,
+                "latency_seconds_max": latency,
+                "latency_histogram": {"0.25": requests},
+            },
+        },
+    }
+
+
+class MockHost:
+    def get_name(self):
+        return "localhost"
+
+
+class MockTask:
+    def __init__(self, action, uuid="task-1"):
+        self.action = action
+        self.resolved_action = f"linode.cloud.{action}"
+        self._uuid = uuid
+
+
+class MockResult:
+    def __init__(self, task, result):
+        self._task = task
+        self._host = MockHost()
+        self._result = result
+
+
+class TestApiStats:
+
+    @pytest.fixture(scope="function")
+    def callback(self, monkeypatch):
+        monkeypatch.delenv("LINODE_ANSIBLE_METRICS", raising=False)
+
+        return plugin_loader.callback_loader.get("linode.cloud.api_stats")
+
+    def test_aggregate_tasks(self):
+        stats = ApiStats()
+
+        stats.add("linode.cloud.instance", _metrics(requests=2), 4.0)
+        stats.add("linode.cloud.instance", _metrics(requests=3))
+        stats.add(
+            "linode.cloud.volume",
+            _metrics(requests=1, latency=2.0, endpoint="GET /volumes"),
+        )
+
+        report = stats.to_dict(top_endpoints=1)
+
+        assert report["tasks"] == 3
+        assert report["requests"] == 6
+        assert report["retries"] == 3
+        assert report["poll_seconds"] == pytest.approx(4.5)
+
+        # Untimed tasks fall back to the module's own duration
+        assert report["task_seconds"] == pytest.approx(10.0)
+        assert report["overhead_seconds"] == pytest.approx(10.0 - 3.0 - 4.5)
+
+        assert report["modules"]["linode.cloud.instance"] == {
+            "tasks": 2,
+            "requests": 5,
+            "api_seconds": pytest.approx(1.0),
+            "poll_seconds": pytest.approx(3.0),
+        }
+
+        instances = report["endpoints"]["GET /linode/instances"]
+        assert instances["count"] == 5
+        assert instances["latency_histogram"] == {"0.25": 5}
+
+        assert list(report["slowest_endpoints"]) == ["GET /volumes"]
+
+    def test_latency_percentiles(self):
+        stats = ApiStats()
+
+        assert stats.latency_percentiles() == {
+            "p50": None,
+            "p95": None,
+            "p99": None,
+        }
+
+        stats.add("linode.cloud.instance", _metrics(requests=4))
+
+        percentiles = stats.latency_percentiles()
+
+        # Samples are interpolated within their bucket and bounded by the
+        # slowest observed request
+        assert percentiles["p50"] == pytest.approx(0.175)
+        assert percentiles["p99"] == pytest.approx(0.2)
+
+        endpoint = stats.slowest_endpoints(10)["GET /linode/instances"]
+        assert endpoint["latency_seconds_mean"] == pytest.approx(0.2)
+        assert endpoint["latency_seconds_p95"] == pytest.approx(0.2)
+
+    def test_runner_on_ok(self, callback):
+        task = MockTask("instance")
+
+        callback.v2_runner_on_start(MockHost(), task)
+        callback.v2_runner_on_ok(
+            MockResult(task, {"changed": True, METRICS_RESULT_KEY: _metrics()})
+        )
+
+        # Loop items each return their own metrics
+        loop_task = MockTask("volume", uuid="task-2")
+        callback.v2_runner_on_ok(
+            MockResult(
+                loop_task,
+                {
+                    "results": [
+                        {METRICS_RESULT_KEY: _metrics()},
+                        {METRICS_RESULT_KEY: _metrics()},
+                        {"skipped": True},
+                    ]
+                },
+            )
+        )
+
+        # Results of other modules are ignored
+        callback.v2_runner_on_ok(MockResult(MockTask("debug"), {"msg": ""}))
+
+        assert callback.stats.tasks == 3
+        assert callback.stats.modules["linode.cloud.instance"]["tasks"] == 1
+        assert callback.stats.modules["linode.cloud.volume"]["tasks"] == 2
+        assert callback._task_started == {}
+
+    def test_set_options_enable_metrics(self, callback):
+        callback.set_options(direct={"enable_metrics": False})
+        assert "LINODE_ANSIBLE_METRICS" not in os.environ
+
+        callback.set_options()
+        assert os.environ["LINODE_ANSIBLE_METRICS"] == "1"
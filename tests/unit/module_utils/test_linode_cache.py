@@ -0,0 +1,332 @@
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import Request, Response
+from requests.adapters import BaseAdapter
+
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    CachingAdapter,
+    MemoizingAdapter,
+    RequestMemo,
+    ResponseCache,
+    is_uncached_path,
+    locked_json_state,
+    paths_related,
+    set_active_response_cache,
+    suspend_request_memo,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    poll_condition,
+)
+
+
+class MockAdapter(BaseAdapter):
+    """
+    A transport adapter that records requests and returns canned responses.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.status = 200
+        self.body = {"id": 123}
+        self.headers = {"ETag": '"abc"'}
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+
+        response = Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.raw = io.BytesIO(response._content)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _request(method="GET", url="https://api.linode.com/v4/regions", token="a"):
+    return Request(
+        method, url, headers={"Authorization": f"Bearer {token}"}
+    ).prepare()
+
+
+class TestLinodeCache:
+
+    @pytest.fixture(scope="function")
+    def inner(self):
+        return MockAdapter()
+
+    @pytest.fixture(scope="function")
+    def cache(self, tmp_path):
+        return ResponseCache(str(tmp_path), ttl=60)
+
+    def test_fresh_hit(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+
+        assert adapter.send(_request()).json() == {"id": 123}
+        assert adapter.send(_request()).json() == {"id": 123}
+
+        assert len(inner.requests) == 1
+
+    def test_token_isolation(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+
+        adapter.send(_request(token="a"))
+        adapter.send(_request(token="b"))
+
+        assert len(inner.requests) == 2
+
+    def test_revalidate_stale(self, cache, inner):
+        cache.ttl = 0
+        adapter = CachingAdapter(cache, inner)
+
+        adapter.send(_request())
+
+        inner.status = 304
+        inner.body = {}
+        response = adapter.send(_request())
+
+        assert len(inner.requests) == 2
+        assert inner.requests[1].headers["If-None-Match"] == '"abc"'
+        assert response.status_code == 200
+        assert response.json() == {"id": 123}
+
+    def test_write_invalidates(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+        url = "https://api.linode.com/v4/linode/instances/123"
+
+        adapter.send(_request(url=url))
+        adapter.send(_request(method="POST", url=url + "/boot"))
+        adapter.send(_request(url=url))
+
+        assert [r.method for r in inner.requests] == ["GET", "POST", "GET"]
+
+    def test_events_not_cached(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+        url = "https://api.linode.com/v4/account/events"
+
+        adapter.send(_request(url=url))
+        adapter.send(_request(url=url))
+        adapter.send(_request(url=url + "/123"))
+        adapter.send(_request(url=url + "/123"))
+
+        assert len(inner.requests) == 4
+
+    def test_secrets_not_cached(self, cache, inner, tmp_path):
+        adapter = CachingAdapter(cache, inner)
+
+        for path in (
+            "databases/mysql/instances/123/credentials",
+            "lke/clusters/123/kubeconfig",
+            "profile/tokens",
+        ):
+            adapter.send(_request(url=f"https://api.linode.com/v4/{path}"))
+
+        assert not [v for v in os.listdir(tmp_path) if v.endswith(".json")]
+
+    def test_suspend_revalidates(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+
+        adapter.send(_request())
+
+        inner.body = {"id": 456}
+
+        with cache.suspend():
+            assert cache.suspended
+            assert adapter.send(_request()).json() == {"id": 456}
+
+        # The revalidated response replaces the cached entry
+        assert adapter.send(_request()).json() == {"id": 456}
+        assert len(inner.requests) == 2
+
+    def test_poll_condition_suspends(self, cache, inner):
+        adapter = CachingAdapter(cache, inner)
+        set_active_response_cache(cache)
+
+        try:
+            adapter.send(_request())
+
+            statuses = iter(["provisioning", "running"])
+
+            def _condition():
+                inner.body = {"status": next(statuses)}
+                return adapter.send(_request()).json()["status"] == "running"
+
+            poll_condition(_condition, step=0, timeout=1)
+        finally:
+            set_active_response_cache(None)
+
+        assert len(inner.requests) == 3
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_size=1024)
+
+        for i in range(10):
+            cache.put(f"key-{i}", {"url": "/", "body": "x" * 200})
+
+        entries = [v for v in os.listdir(tmp_path) if v.endswith(".json")]
+        assert 0 < len(entries) < 10
+        assert "key-9.json" in entries
+
+    def test_paths_related(self):
+        assert paths_related("/v4/linode/instances", "/v4/linode/instances/1")
+        assert paths_related("/v4/linode/instances/1/", "/v4/linode/instances/1")
+        assert not paths_related(
+            "/v4/linode/instances/1", "/v4/linode/instances/12"
+        )
+        assert not paths_related("/v4/volumes/1", "/v4/linode/instances/1")
+
+    def test_locked_json_state(self, tmp_path):
+        path = str(tmp_path / "state.json")
+
+        with open(path, "w", encoding="utf-8") as state_file:
+            state_file.write("{invalid")
+
+        # Unreadable state is replaced rather than raised
+        with locked_json_state(path) as state:
+            assert state == {}
+            state["count"] = 1
+
+        with locked_json_state(path) as state:
+            assert state == {"count": 1}
+
+    def test_is_uncached_path(self):
+        assert is_uncached_path("/v4/account/events")
+        assert is_uncached_path("/v4/account/events/123/")
+        assert not is_uncached_path("/v4/account/eventsfoo")
+        assert not is_uncached_path("/v4/account")
+        assert is_uncached_path(
+            "/v4/databases/postgresql/instances/1/credentials"
+        )
+        assert is_uncached_path("/v4/lke/clusters/1/kubeconfig")
+        assert not is_uncached_path("/v4/lke/clusters/1")
+
+    def test_memo_hit(self, inner):
+        memo = RequestMemo()
+        adapter = MemoizingAdapter(memo, inner)
+
+        assert adapter.send(_request()).json() == {"id": 123}
+        assert adapter.send(_request()).json() == {"id": 123}
+
+        assert len(inner.requests) == 1
+        assert memo.hits == 1
+
+    def test_memo_concurrent_requests_coalesced(self, inner):
+        memo = RequestMemo()
+        adapter = MemoizingAdapter(memo, inner)
+        started = threading.Event()
+        release = threading.Event()
+
+        send = inner.send
+
+        def _slow_send(request, **kwargs):
+            started.set()
+            release.wait(5)
+            return send(request, **kwargs)
+
+        inner.send = _slow_send
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first = executor.submit(adapter.send, _request())
+            started.wait(5)
+
+            others = [executor.submit(adapter.send, _request()) for _ in range(2)]
+            release.set()
+
+            results = [v.result().json() for v in [first, *others]]
+
+        assert results == [{"id": 123}] * 3
+        assert len(inner.requests) == 1
+        assert memo.hits == 2
+
+    def test_memo_failed_request_released(self, inner):
+        memo = RequestMemo()
+        adapter = MemoizingAdapter(memo, inner)
+
+        inner.status = 500
+        adapter.send(_request())
+
+        # Failed responses are not stored but must not block later requests
+        inner.status = 200
+        adapter.send(_request())
+
+        assert len(inner.requests) == 2
+
+    def test_memo_write_invalidates(self, inner):
+        adapter = MemoizingAdapter(RequestMemo(), inner)
+        url = "https://api.linode.com/v4/linode/instances/123"
+        other_url = "https://api.linode.com/v4/volumes/456"
+
+        adapter.send(_request(url=url))
+        adapter.send(_request(url=other_url))
+
+        # Updates only affect the resource being updated
+        adapter.send(_request(method="PUT", url=url))
+        adapter.send(_request(url=url))
+        adapter.send(_request(url=other_url))
+
+        assert [r.url for r in inner.requests] == [url, other_url, url, url]
+
+        # Actions may affect any resource
+        adapter.send(_request(method="POST", url=url + "/boot"))
+        adapter.send(_request(url=other_url))
+
+        assert inner.requests[-1].url == other_url
+
+    def test_memo_suspend(self, inner):
+        memo = RequestMemo()
+        adapter = MemoizingAdapter(memo, inner)
+
+        adapter.send(_request())
+
+        with memo.suspend():
+            adapter.send(_request())
+            adapter.send(_request())
+
+        adapter.send(_request())
+
+        assert len(inner.requests) == 4
+
+    def test_memo_whole_run(self, inner, monkeypatch):
+        adapter = MemoizingAdapter(RequestMemo(), inner)
+
+        adapter.send(_request())
+
+        # Entries do not expire, however long the module runs
+        clock = time.monotonic() + 3600
+        monkeypatch.setattr(time, "monotonic", lambda: clock)
+
+        adapter.send(_request())
+
+        assert len(inner.requests) == 1
+
+    def test_memo_created_while_suspended(self, inner):
+        # Modules may first use their client inside a polling loop
+        with suspend_request_memo():
+            adapter = MemoizingAdapter(RequestMemo(), inner)
+
+            adapter.send(_request())
+            adapter.send(_request())
+
+        adapter.send(_request())
+        adapter.send(_request())
+
+        assert len(inner.requests) == 3
+
+    def test_memo_events_not_memoized(self, inner):
+        adapter = MemoizingAdapter(RequestMemo(), inner)
+        url = "https://api.linode.com/v4/account/events/123"
+
+        adapter.send(_request(url=url))
+        adapter.send(_request(url=url))
+
+        assert len(inner.requests) == 2
@@ -1,6 +1,20 @@
 from types import SimpleNamespace
+import copy
 import os
 
+from ansible_collections.linode.cloud.plugins.module_utils.linode_cache import (
+    CachingAdapter,
+    MemoizingAdapter,
+    set_active_request_memo,
+    set_active_response_cache,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    ApiMetrics,
+    MetricsAdapter,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_rate_limit import (
+    RateLimitAdapter,
+)
 from ansible_collections.linode.cloud.tests.unit.base import TestModuleBase
 
 
@@ -22,3 +36,105 @@ class TestLinodeModuleBase:
 
         client = mock_module.client
         assert client.ca_path == "foobar"
+
+    def test_module_cache_dir(self, tmp_path):
+        mock_module = TestModuleBase()
+        mock_module.module = SimpleNamespace(
+            params={
+                "api_token": "testing",
+                "api_version": "v4",
+                "api_url": "https://api.linode.com/",
+                "ua_prefix": None,
+                "ca_path": None,
+                "cache_dir": str(tmp_path),
+                "cache_ttl": 30,
+                "cache_max_size": 1,
+                "memoize_requests": False,
+            }
+        )
+
+        adapter = mock_module.client.session.get_adapter(
+            "https://api.linode.com/v4/regions"
+        )
+        assert isinstance(adapter, CachingAdapter)
+        assert adapter.cache.ttl == 30
+        assert adapter.cache.max_size == 1024 * 1024
+
+        # Cache hits should not consume rate limit budget
+        assert isinstance(adapter.adapter, RateLimitAdapter)
+
+    def test_module_metrics(self):
+        mock_module = TestModuleBase()
+        mock_module.module = SimpleNamespace(
+            params={
+                "api_token": "testing",
+                "api_version": "v4",
+                "api_url": "https://api.linode.com/",
+                "ua_prefix": None,
+                "ca_path": None,
+                "rate_limit": False,
+                "memoize_requests": False,
+            }
+        )
+        mock_module._metrics = ApiMetrics()
+
+        adapter = mock_module.client.session.get_adapter(
+            "https://api.linode.com/v4/regions"
+        )
+        assert isinstance(adapter, MetricsAdapter)
+
+        result = mock_module._with_metrics({"changed": False})
+        assert result["changed"] is False
+        assert result["_linode_metrics"]["requests"] == 0
+
+    def test_module_memoize_requests(self):
+        mock_module = TestModuleBase()
+        mock_module.module = SimpleNamespace(
+            params={
+                "api_token": "testing",
+                "api_version": "v4",
+                "api_url": "https://api.linode.com/",
+                "ua_prefix": None,
+                "ca_path": None,
+            }
+        )
+
+        adapter = mock_module.client.session.get_adapter(
+            "https://api.linode.com/v4/regions"
+        )
+        set_active_request_memo(None)
+
+        assert isinstance(adapter, MemoizingAdapter)
+        assert adapter.memo is mock_module._request_memo
+
+    def test_module_client_deepcopy(self, tmp_path):
+        mock_module = TestModuleBase()
+        mock_module.module = SimpleNamespace(
+            params={
+                "api_token": "testing",
+                "api_version": "v4",
+                "api_url": "https://api.linode.com/",
+                "ua_prefix": None,
+                "ca_path": None,
+                "cache_dir": str(tmp_path),
+            }
+        )
+        mock_module._metrics = ApiMetrics()
+
+        # API objects hold a reference to the client and may be deep-copied
+        client = mock_module.client
+        client_copy = copy.deepcopy(client)
+        set_active_request_memo(None)
+        set_active_response_cache(None)
+
+        adapter = client_copy.session.get_adapter(
+            "https://api.linode.com/v4/regions"
+        )
+        assert adapter.memo is mock_module._request_memo
+        assert adapter.adapter.metrics is mock_module._metrics
+        assert (
+            adapter.adapter.adapter.cache
+            is client.session.get_adapter(
+                "https://api.linode.com/v4/regions"
+            ).adapter.adapter.cache
+        )
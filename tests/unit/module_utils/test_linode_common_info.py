@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common_info import (
@@ -115,3 +117,154 @@ class TestLinodeInfoModule:
         assert not attr2_field.required
         assert attr2_field.conflicts_with == ["attr"]
         assert attr2_field.description == "The Attr 2 of the Foo to resolve."
+
+    def test_generate_spec_result_concurrency(self, mock_module):
+        assert "result_concurrency" not in mock_module.spec.options
+
+        mock_module.secondary_results.append(
+            InfoModuleResult(
+                field_name="baz",
+                field_type=FieldType.dict,
+                display_name="Baz",
+                get=lambda *args: "wow",
+            )
+        )
+
+        field = mock_module.spec.options.get("result_concurrency")
+        assert field.type == FieldType.integer
+        assert field.default == 4
+
+    def test_exec_module_concurrent(self, mock_module):
+        # Every secondary result must be in flight at once for the barrier to pass
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _get(value):
+            def _inner(client, primary, params):
+                barrier.wait()
+                return f"{primary['id']}-{value}"
+
+            return _inner
+
+        mock_module._client = "client"
+        mock_module.secondary_results = [
+            InfoModuleResult(
+                field_name=field,
+                field_type=FieldType.string,
+                display_name=field,
+                get=_get(field),
+            )
+            for field in ("a", "b", "c")
+        ]
+        mock_module.primary_result.get = lambda *args: {"id": 1}
+
+        results = mock_module.exec_module(result_concurrency=3)
+
+        assert results["foo"] == {"id": 1}
+        assert [results[v] for v in ("a", "b", "c")] == ["1-a", "1-b", "1-c"]
+
+    def test_exec_module_first_error(self, mock_module, monkeypatch):
+        def _fail(*args):
+            raise ValueError("failed")
+
+        def _fail_message(msg, **kwargs):
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(mock_module, "fail", _fail_message)
+
+        mock_module._client = "client"
+        mock_module.secondary_results = [
+            InfoModuleResult(
+                field_name=field,
+                field_type=FieldType.string,
+                display_name=field.upper(),
+                get=get,
+            )
+            for field, get in (
+                ("a", lambda *args: "a"),
+                ("b", _fail),
+                ("c", _fail),
+            )
+        ]
+        mock_module.primary_result.get = lambda *args: {"id": 1}
+
+        with pytest.raises(RuntimeError, match="Failed to get B for Foo"):
+            mock_module.exec_module(result_concurrency=3)
+
+    def test_generate_spec_result_selection(self, mock_module):
+        for name in ("include", "exclude"):
+            field = mock_module.spec.options.get(name)
+            assert field.type == FieldType.list
+            assert field.element_type == FieldType.string
+            assert field.choices == ["bar"]
+
+    def test_exec_module_result_selection(self, mock_module):
+        fetched = []
+
+        def _get(value):
+            def _inner(client, primary, params):
+                fetched.append(value)
+                return value
+
+            return _inner
+
+        mock_module._client = "client"
+        mock_module.secondary_results = [
+            InfoModuleResult(
+                field_name=field,
+                field_type=FieldType.string,
+                display_name=field.upper(),
+                get=_get(field),
+            )
+            for field in ("a", "b", "c")
+        ]
+        mock_module.primary_result.get = lambda *args: {"id": 1}
+        mock_module.results = {"foo": None, "a": None, "b": None, "c": None}
+
+        result = mock_module.exec_module(include=["a", "c"])
+        assert fetched == ["a", "c"]
+        assert result["b"] is None
+        assert result["c"] == "c"
+
+        fetched.clear()
+        mock_module.results = {"foo": None, "a": None, "b": None, "c": None}
+
+        result = mock_module.exec_module(exclude=["a"])
+        assert fetched == ["b", "c"]
+        assert result["a"] is None
+
+    def test_generate_spec_batch(self, mock_module):
+        mock_module.attributes[0].batch_get = lambda *args: []
+
+        spec = mock_module.spec
+
+        field = spec.options.get("attrs")
+        assert field.type == FieldType.list
+        assert field.element_type == FieldType.string
+        assert field.conflicts_with == ["attr"]
+        assert not spec.options.get("attr").required
+        assert "result_concurrency" in spec.options
+        assert "results_by_attr" in spec.return_values
+
+    def test_exec_module_batch(self, mock_module, monkeypatch):
+        def _fail_message(msg, **kwargs):
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(mock_module, "fail", _fail_message)
+
+        mock_module._client = "client"
+        mock_module.attributes[0].batch_get = lambda client, values, params: [
+            {"id": i, "attr": v} for i, v in enumerate(values) if v != "missing"
+        ]
+        mock_module.secondary_results[0].get = (
+            lambda client, primary, params: f"{primary['attr']}-bar"
+        )
+
+        result = mock_module.exec_module(attrs=["a", "b", "a"], result_concurrency=2)
+
+        assert result["results_by_attr"] == {
+            "a": {"foo": {"id": 0, "attr": "a"}, "bar": "a-bar"},
+            "b": {"foo": {"id": 1, "attr": "b"}, "bar": "b-bar"},
+        }
+
+        with pytest.raises(RuntimeError, match="with Attr missing: No matching"):
+            mock_module.exec_module(attrs=["a", "missing"])
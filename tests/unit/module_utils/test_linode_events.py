@@ -0,0 +1,271 @@
+import polling
+import pytest
+
+from ansible_collections.linode.cloud.plugins.module_utils import (
+    linode_events,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_events import (
+    AdaptivePollingGroup,
+    EventSpool,
+    SharedPollingGroup,
+)
+
+
+def _event(event_id, status="finished", entity_id=1, action="linode_boot"):
+    return {
+        "id": event_id,
+        "action": action,
+        "status": status,
+        "created": f"2024-01-01T00:00:{event_id:02d}",
+        "message": None,
+        "entity": {"id": entity_id, "type": "linode"},
+    }
+
+
+def _matches(event, api_filter):
+    for key, condition in api_filter.items():
+        if key.startswith("+order"):
+            continue
+
+        if key == "+or":
+            if not any(_matches(event, v) for v in condition):
+                return False
+            continue
+
+        value = event
+        for part in key.split("."):
+            value = value.get(part)
+
+        if isinstance(condition, dict):
+            if value < condition["+gte"]:
+                return False
+        elif value != condition:
+            return False
+
+    return True
+
+
+class MockEventsClient:
+    """
+    A minimal stand-in for LinodeClient that serves the events feed.
+    """
+
+    base_url = "https://api.linode.com/v4"
+
+    def __init__(self, events=None):
+        self.events = events or []
+        self.requests = []
+
+    def get(self, endpoint, filters=None):
+        self.requests.append((endpoint.split("?")[0], filters))
+
+        if endpoint.startswith("/account/events/"):
+            event_id = int(endpoint.split("/")[-1])
+            event = next(v for v in self.events if v["id"] == event_id)
+
+            # In-progress events advance each time they are requested
+            if event["status"] == "started":
+                event["percent_complete"] += 50
+                if event["percent_complete"] >= 100:
+                    event["status"] = "finished"
+
+            return dict(event)
+
+        data = [v for v in self.events if _matches(v, filters or {})]
+
+        return {"data": data, "page": 1, "pages": 1, "results": len(data)}
+
+
+class MockClock:
+    """
+    A fake clock that only advances when told to.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class TestLinodeEvents:
+
+    @pytest.fixture(scope="function")
+    def clock(self, monkeypatch):
+        clock = MockClock()
+        monkeypatch.setattr(linode_events.time, "time", clock.time)
+        return clock
+
+    def test_spool_shared(self, tmp_path, clock):
+        client = MockEventsClient([_event(1)])
+
+        # Two spools for the same token simulate two forks
+        spool_a = EventSpool(client, "token", state_dir=str(tmp_path))
+        spool_b = EventSpool(client, "token", state_dir=str(tmp_path))
+
+        assert [v["id"] for v in spool_a.events(5)] == [1]
+        assert [v["id"] for v in spool_b.events(5)] == [1]
+        assert len(client.requests) == 1
+
+        client.events.append(_event(2))
+        clock.now += 5
+
+        assert sorted(v["id"] for v in spool_b.events(5)) == [1, 2]
+        assert sorted(v["id"] for v in spool_a.events(5)) == [1, 2]
+        assert len(client.requests) == 2
+
+        # Only events created since the last refresh are requested
+        assert client.requests[-1][1]["created"] == {
+            "+gte": "2024-01-01T00:00:01"
+        }
+
+    def test_spool_since(self, tmp_path, clock):
+        client = MockEventsClient([_event(1)])
+        spool = EventSpool(client, "token", state_dir=str(tmp_path))
+
+        spool.events(5)
+        clock.now += 1
+
+        # Waits started after the last refresh require a new refresh
+        spool.events(5, since=clock.now)
+        spool.events(5, since=clock.now)
+
+        assert len(client.requests) == 2
+
+    def test_spool_token_isolation(self, tmp_path, clock):
+        client = MockEventsClient([_event(1)])
+
+        EventSpool(client, "token-a", state_dir=str(tmp_path)).events(5)
+        EventSpool(client, "token-b", state_dir=str(tmp_path)).events(5)
+
+        assert len(client.requests) == 2
+
+    def test_spool_refreshes_pending(self, tmp_path, clock):
+        client = MockEventsClient([_event(1, status="started"), _event(2)])
+        spool = EventSpool(client, "token", state_dir=str(tmp_path))
+
+        spool.events(5)
+
+        client.events[0]["status"] = "finished"
+        clock.now += 5
+
+        events = {v["id"]: v for v in spool.events(5)}
+
+        assert events[1]["status"] == "finished"
+        assert client.requests[-1] == ("/account/events", {"+or": [{"id": 1}]})
+
+    def test_spool_tracked_events(self, tmp_path, clock):
+        client = MockEventsClient([_event(1)])
+        spool = EventSpool(client, "token", state_dir=str(tmp_path))
+
+        spool.events(5)
+
+        # An event created after the sweep is not listed until a tracked
+        # newer event has been spooled
+        client.events.append(_event(2))
+        client.events.append(_event(3))
+        spool.track([_event(3)])
+        clock.now += 5
+
+        assert sorted(v["id"] for v in spool.events(5)) == [1, 2, 3]
+        assert client.requests[-1][1]["created"] == {
+            "+gte": "2024-01-01T00:00:01"
+        }
+
+    def test_spool_idle(self, tmp_path, clock):
+        client = MockEventsClient([_event(1)])
+        spool = EventSpool(client, "token", state_dir=str(tmp_path))
+
+        spool.events(5)
+        clock.now += linode_events.EVENT_SPOOL_MAX_IDLE_SECONDS
+
+        spool.events(5)
+
+        # Idle spools only request the most recent events
+        assert "created" not in client.requests[-1][1]
+
+    def test_event_poller(self, tmp_path):
+        client = MockEventsClient([_event(1)])
+        group = SharedPollingGroup(
+            client, EventSpool(client, "token", state_dir=str(tmp_path))
+        )
+
+        poller = group.event_poller_create("linode", "linode_boot", 1)
+
+        # Events from before the poller was created and events of other
+        # entities and actions are ignored
+        client.events += [
+            _event(2, action="linode_shutdown"),
+            _event(3, entity_id=2),
+        ]
+
+        with pytest.raises(polling.TimeoutException):
+            poller.wait_for_next_event_finished(timeout=0.05, interval=0)
+
+        client.events.append(_event(4))
+
+        event = poller.wait_for_next_event_finished(timeout=1, interval=0)
+
+        assert event.id == 4
+        assert event.status == "finished"
+
+    def test_event_poller_failed(self, tmp_path):
+        client = MockEventsClient()
+        group = SharedPollingGroup(
+            client, EventSpool(client, "token", state_dir=str(tmp_path))
+        )
+
+        poller = group.event_poller_create("linode", "linode_boot")
+        poller.set_entity_id(1)
+
+        client.events.append(_event(1, status="failed"))
+
+        with pytest.raises(linode_events.EventError):
+            poller.wait_for_next_event_finished(timeout=1, interval=0)
+
+    def test_wait_for_entity_free(self, tmp_path):
+        client = MockEventsClient([_event(1)])
+        group = SharedPollingGroup(
+            client, EventSpool(client, "token", state_dir=str(tmp_path))
+        )
+
+        # Free entities only require a single request
+        group.wait_for_entity_free("linode", 1)
+        assert len(client.requests) == 1
+
+        client.events.append(_event(2, status="started"))
+
+        with pytest.raises(polling.TimeoutException):
+            group.wait_for_entity_free("linode", 1, timeout=0.05, interval=0)
+
+        client.events[-1]["status"] = "finished"
+
+        group.wait_for_entity_free("linode", 1, timeout=1, interval=0)
+
+    def test_adaptive_event_poller(self):
+        client = MockEventsClient([_event(1)])
+        group = AdaptivePollingGroup(client)
+
+        poller = group.event_poller_create("linode", "linode_boot", 1)
+        client.events.append(_event(2))
+
+        event = poller.wait_for_next_event_finished(timeout=1, interval=0)
+
+        # Events found finished are not requested again
+        assert event.id == 2
+        assert [v[0] for v in client.requests] == ["/account/events"] * 2
+
+    def test_adaptive_event_poller_progress(self):
+        client = MockEventsClient()
+        group = AdaptivePollingGroup(client)
+
+        poller = group.event_poller_create("linode", "linode_resize", 1)
+        client.events.append(
+            _event(1, status="started", action="linode_resize")
+        )
+        client.events[0]["percent_complete"] = 0
+
+        event = poller.wait_for_next_event_finished(timeout=1, interval=0)
+
+        assert event.status == "finished"
+        assert [v[0] for v in client.requests[2:]] == ["/account/events/1"] * 2
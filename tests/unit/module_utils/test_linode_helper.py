@@ -1,12 +1,78 @@
+import threading
+from urllib.parse import parse_qs, urlparse
+
 import pytest
+from ansible_collections.linode.cloud.plugins.module_utils import (
+    linode_helper,
+)
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    BackoffPollStrategy,
+    PaginationStats,
+    ProgressPollStrategy,
     dict_select_spec,
     drop_empty_strings,
     filter_null_values,
+    find_by_values,
     generate_device_suffixes,
+    get_all_paginated,
+    iter_concurrent_results,
+    iter_paginated,
+    poll_condition,
+    resolve_page_size,
+    safe_find,
     validate_required,
 )
-from ansible_collections.linode.cloud.plugins.modules.instance import MAX_DEVICE_LIMIT
+from ansible_collections.linode.cloud.plugins.module_utils.modules.instance.linode_instance import (
+    MAX_DEVICE_LIMIT,
+)
+from linode_api4 import ApiError
+
+
+class MockPaginatedClient:
+    """
+    A minimal stand-in for LinodeClient that serves a paginated collection.
+    """
+
+    def __init__(self, num_entries: int, max_page_size: int = 500):
+        self.entries = [{"id": i} for i in range(num_entries)]
+        self.max_page_size = max_page_size
+        self.requested_pages = []
+        self.requested_page_sizes = []
+        self._lock = threading.Lock()
+
+    def get(self, endpoint, filters=None):
+        query = parse_qs(urlparse(endpoint).query)
+        page = int(query["page"][0])
+        page_size = int(query["page_size"][0])
+
+        with self._lock:
+            self.requested_page_sizes.append(page_size)
+
+        if page_size > self.max_page_size:
+            raise ApiError(
+                "Invalid page size",
+                status=400,
+                json={
+                    "errors": [
+                        {
+                            "field": "page_size",
+                            "reason": "Must be between 25 and 100",
+                        }
+                    ]
+                },
+            )
+
+        with self._lock:
+            self.requested_pages.append(page)
+
+        start = (page - 1) * page_size
+
+        return {
+            "data": self.entries[start : start + page_size],
+            "page": page,
+            "pages": max((len(self.entries) + page_size - 1) // page_size, 1),
+            "results": len(self.entries),
+        }
 
 
 class TestLinodeHelper:
@@ -91,4 +157,258 @@ class TestLinodeHelper:
                              'aw', 'ax', 'ay', 'az', 'ba', 'bb', 'bc', 'bd', 'be', 'bf', 'bg', 
                              'bh', 'bi', 'bj', 'bk', 'bl']
         result = generate_device_suffixes(MAX_DEVICE_LIMIT)
-        assert result == expected_suffixes
\ No newline at end of file
+        assert result == expected_suffixes
+
+    def test_get_all_paginated_concurrent(self):
+        client = MockPaginatedClient(1050)
+
+        result = get_all_paginated(
+            client, "/linode/instances", {}, page_concurrency=4, page_size=100
+        )
+
+        assert result == client.entries
+        assert sorted(client.requested_pages) == list(range(1, 12))
+
+    def test_get_all_paginated_count(self):
+        client = MockPaginatedClient(1050)
+
+        result = get_all_paginated(
+            client,
+            "/linode/instances",
+            {},
+            num_results=250,
+            page_concurrency=4,
+            page_size=100,
+        )
+
+        assert result == client.entries[:250]
+        assert sorted(client.requested_pages) == [1, 2, 3]
+
+    def test_get_all_paginated_empty(self):
+        client = MockPaginatedClient(0)
+
+        result = get_all_paginated(client, "/linode/instances", {})
+
+        assert result == []
+        assert client.requested_pages == [1]
+
+    def test_iter_paginated_early_exit(self):
+        client = MockPaginatedClient(1050)
+
+        entries = iter_paginated(client, "/account/events", {}, page_size=100)
+
+        assert [next(entries) for _ in range(150)] == client.entries[:150]
+        entries.close()
+
+        assert client.requested_pages == [1, 2]
+
+    def test_iter_paginated_concurrent_window(self):
+        client = MockPaginatedClient(1050)
+
+        entries = iter_paginated(
+            client, "/account/events", {}, page_concurrency=2, page_size=100
+        )
+
+        assert next(entries) == client.entries[0]
+        entries.close()
+
+        # Only the first page and the prefetch window should be requested
+        assert sorted(client.requested_pages) == [1, 2, 3]
+
+    def test_safe_find_generator(self):
+        consumed = []
+
+        def __entries():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        assert safe_find(lambda: (v for v in __entries() if v > 2)) == 3
+        assert consumed == [0, 1, 2, 3]
+
+        assert safe_find(lambda: iter([])) is None
+
+        with pytest.raises(ValueError):
+            safe_find(lambda: iter([]), raise_not_found=True)
+
+    def test_resolve_page_size(self):
+        assert resolve_page_size() == 500
+        assert resolve_page_size(max_page_size=1000) == 500
+        assert resolve_page_size(10) == 25
+        assert resolve_page_size(250) == 250
+        assert resolve_page_size(600) == 300
+        assert resolve_page_size(1050) == 350
+        assert resolve_page_size(1050, max_page_size=100) == 96
+
+    def test_get_all_paginated_stats(self):
+        client = MockPaginatedClient(1050)
+        stats = PaginationStats()
+
+        result = get_all_paginated(
+            client, "/linode/instances", {}, page_concurrency=4, stats=stats
+        )
+
+        assert result == client.entries
+        assert stats.to_dict() == {"pages_fetched": 3, "page_size": 500}
+
+    def test_get_all_paginated_page_size_fallback(self):
+        client = MockPaginatedClient(250, max_page_size=100)
+        stats = PaginationStats()
+
+        result = get_all_paginated(
+            client, "/fallback/endpoint", {}, stats=stats
+        )
+
+        assert result == client.entries
+        assert client.requested_page_sizes == [500, 100, 100, 100]
+        assert stats.to_dict() == {"pages_fetched": 3, "page_size": 100}
+
+        # The rejected page size should be remembered for the endpoint
+        client.requested_page_sizes = []
+        get_all_paginated(client, "/fallback/endpoint", {})
+
+        assert client.requested_page_sizes == [100, 100, 100]
+
+    def test_iter_concurrent_results(self):
+        # Every call must be in flight at once for the barrier to pass
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _get(value):
+            barrier.wait()
+
+            if value == 2:
+                raise ValueError("bad value")
+
+            return value * 10
+
+        results = list(iter_concurrent_results(_get, [1, 2, 3], max_workers=3))
+
+        assert [v[0] for v in results] == [10, None, 30]
+        assert results[0][1] is None
+        assert isinstance(results[1][1], ValueError)
+
+    def test_iter_concurrent_results_serial(self):
+        calls = []
+
+        def _get(value):
+            calls.append(value)
+            raise ValueError("bad value")
+
+        results = iter_concurrent_results(_get, [1, 2, 3])
+
+        _, exception = next(results)
+        results.close()
+
+        assert isinstance(exception, ValueError)
+        assert calls == [1]
+
+    def test_find_by_values(self):
+        requested_filters = []
+
+        class _Client:
+            def get(self, endpoint, filters=None):
+                requested_filters.append(filters)
+
+                data = [
+                    {"id": v["id"]} for v in filters["+or"] if v["id"] % 2 == 0
+                ]
+
+                return {"data": data, "page": 1, "pages": 1, "results": len(data)}
+
+        result = find_by_values(
+            _Client(), "/linode/instances", "id", [0, 1, 2, 3, 0, 4, 5], chunk_size=4
+        )
+
+        assert result == [{"id": 0}, {"id": 2}, {"id": 4}]
+        assert requested_filters == [
+            {"+or": [{"id": 0}, {"id": 1}, {"id": 2}, {"id": 3}]},
+            {"+or": [{"id": 4}, {"id": 5}]},
+        ]
+
+    def test_find_by_values_filters(self):
+        requested_filters = []
+
+        class _Client:
+            def get(self, endpoint, filters=None):
+                requested_filters.append(filters)
+                return {"data": [], "page": 1, "pages": 1, "results": 0}
+
+        find_by_values(
+            _Client(),
+            "/linode/instances",
+            "id",
+            [1, 2],
+            filters={"region": "us-east"},
+        )
+
+        assert requested_filters == [
+            {
+                "+and": [
+                    {"region": "us-east"},
+                    {"+or": [{"id": 1}, {"id": 2}]},
+                ]
+            },
+        ]
+
+    def test_backoff_poll_strategy(self):
+        strategy = BackoffPollStrategy(2, factor=2, max_step=10, jitter=0)
+
+        assert [strategy.next_step() for _ in range(5)] == [2, 4, 8, 10, 10]
+
+    def test_backoff_poll_strategy_jitter(self):
+        strategy = BackoffPollStrategy(10, factor=1, jitter=0.5)
+
+        # Jitter never shortens a step
+        assert all(10 <= strategy.next_step() <= 15 for _ in range(100))
+
+    def test_progress_poll_strategy(self, monkeypatch):
+        clock = {"now": 0.0}
+        monkeypatch.setattr(
+            linode_helper.time, "monotonic", lambda: clock["now"]
+        )
+
+        strategy = ProgressPollStrategy(2, max_step=60, jitter=0)
+
+        # Without observed progress, the strategy backs off
+        strategy.observe_progress(None)
+        strategy.observe_progress(10)
+        assert strategy.next_step() == 2
+
+        # 10% in 20 seconds leaves 160 seconds for the remaining 80%
+        clock["now"] += 20
+        strategy.observe_progress(20)
+        assert strategy.next_step() == 60
+
+        clock["now"] += 140
+        strategy.observe_progress(90)
+        assert strategy.next_step() == 20
+
+        # Steps never fall below the initial step
+        clock["now"] += 20
+        strategy.observe_progress(99.9)
+        assert strategy.next_step() == 2
+
+    def test_poll_condition_timeout(self, monkeypatch):
+        clock = {"now": 0.0}
+        sleeps = []
+
+        def _sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+        monkeypatch.setattr(
+            linode_helper.time, "monotonic", lambda: clock["now"]
+        )
+        monkeypatch.setattr("polling.time.time", lambda: clock["now"])
+        monkeypatch.setattr("polling.time.sleep", _sleep)
+
+        with pytest.raises(linode_helper.polling.TimeoutException):
+            poll_condition(
+                lambda: False,
+                step=4,
+                timeout=20,
+                strategy=BackoffPollStrategy(4, factor=2, jitter=0),
+            )
+
+        # The last step is shortened to end at the timeout
+        assert sleeps == [4, 8, 8]
@@ -0,0 +1,158 @@
+import io
+import json
+
+import pytest
+from requests import Request, Response
+from requests.adapters import BaseAdapter
+
+from ansible_collections.linode.cloud.plugins.module_utils import (
+    linode_metrics,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    BackoffPollStrategy,
+    poll_condition,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_metrics import (
+    ApiMetrics,
+    MetricsAdapter,
+    endpoint_template,
+    histogram_percentile,
+    merge_histograms,
+    set_active_metrics,
+)
+
+
+class MockAdapter(BaseAdapter):
+    """
+    A transport adapter that returns canned responses.
+    """
+
+    def __init__(self, status=200, body=None):
+        super().__init__()
+        self.status = status
+        self.body = body or {"id": 123}
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.status_code = self.status
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.raw = io.BytesIO(response._content)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestLinodeMetrics:
+
+    @pytest.fixture(scope="function")
+    def metrics(self):
+        metrics = ApiMetrics()
+        set_active_metrics(metrics)
+        yield metrics
+        set_active_metrics(None)
+
+    def test_endpoint_template(self):
+        assert (
+            endpoint_template(
+                "GET", "https://api.linode.com/v4/linode/instances/123/disks"
+            )
+            == "GET /linode/instances/{id}/disks"
+        )
+        assert (
+            endpoint_template(
+                "POST", "https://api.linode.com/v4beta/lke/clusters?page=2"
+            )
+            == "POST /lke/clusters"
+        )
+        assert (
+            endpoint_template(
+                "GET", "https://api.linode.com/v4/linode/types/g6-standard-1"
+            )
+            == "GET /linode/types/g6-standard-1"
+        )
+
+    def test_record_request(self, metrics):
+        endpoint = "GET /linode/instances/{id}"
+
+        metrics.record_request(endpoint, 200, 0, 0.01, bytes_in=10)
+        metrics.record_request(
+            endpoint, 200, 0, 3, bytes_in=10, retry_statuses=[429, 502]
+        )
+        metrics.record_request(endpoint, 404, 0, 0.2)
+
+        result = metrics.to_dict()
+        stats = result["endpoints"][endpoint]
+
+        assert result["requests"] == 3
+        assert stats["count"] == 3
+        assert stats["errors"] == 1
+        assert stats["retries"] == 2
+        assert stats["rate_limited"] == 1
+        assert stats["bytes_in"] == 20
+        assert stats["latency_seconds_max"] == 3
+        assert stats["latency_histogram"] == {"0.05": 1, "0.25": 1, "5.0": 1}
+
+    def test_event_poll_sleep(self, metrics):
+        metrics.record_request("GET /account/events", 200, 0, 1)
+        metrics.record_request("GET /linode/instances/{id}", 200, 1, 2)
+        metrics.record_request("GET /account/events", 200, 5, 6)
+
+        assert metrics.to_dict()["event_poll_sleep_seconds"] == 4
+
+    def test_adapter(self, metrics):
+        adapter = MetricsAdapter(metrics, MockAdapter())
+
+        request = Request(
+            "PUT",
+            "https://api.linode.com/v4/volumes/1",
+            json={"label": "test"},
+        ).prepare()
+        adapter.send(request)
+
+        stats = metrics.to_dict()["endpoints"]["PUT /volumes/{id}"]
+
+        assert stats["count"] == 1
+        assert stats["bytes_in"] == len(b'{"id": 123}')
+        assert stats["bytes_out"] == len(request.body)
+
+    def test_poll_condition_sleep(self, metrics, monkeypatch):
+        clock = {"now": 0.0}
+
+        monkeypatch.setattr(
+            linode_metrics.time, "monotonic", lambda: clock["now"]
+        )
+
+        def _sleep(seconds):
+            clock["now"] += seconds
+
+        monkeypatch.setattr("polling.time.sleep", _sleep)
+
+        attempts = iter([False, False, True])
+
+        poll_condition(
+            lambda: next(attempts),
+            step=2,
+            timeout=60,
+            strategy=BackoffPollStrategy(2, factor=1, jitter=0),
+        )
+
+        assert metrics.to_dict()["poll_sleep_seconds"] == 4
+
+    def test_histogram_percentile(self):
+        histogram = {"0.05": 50, "0.1": 40, "1.0": 10}
+
+        assert histogram_percentile({}, 50) is None
+        assert histogram_percentile(histogram, 50) == pytest.approx(0.05)
+        assert histogram_percentile(histogram, 70) == pytest.approx(0.075)
+        assert histogram_percentile(histogram, 95) == pytest.approx(0.75)
+        assert histogram_percentile(histogram, 99, max_value=0.6) == 0.6
+        assert histogram_percentile({"+Inf": 1}, 100, max_value=20) == 20
+
+    def test_merge_histograms(self):
+        target = {"0.05": 1}
+        merge_histograms(target, {"0.05": 2, "+Inf": 1})
+
+        assert target == {"0.05": 3, "+Inf": 1}
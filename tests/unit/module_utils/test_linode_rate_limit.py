@@ -0,0 +1,141 @@
+import pytest
+
+from ansible_collections.linode.cloud.plugins.module_utils import (
+    linode_rate_limit,
+)
+from ansible_collections.linode.cloud.plugins.module_utils.linode_rate_limit import (
+    JitteredRetry,
+    RateLimiter,
+)
+
+
+class MockClock:
+    """
+    A fake clock that advances whenever the code under test sleeps.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestLinodeRateLimit:
+
+    @pytest.fixture(scope="function")
+    def clock(self, monkeypatch):
+        clock = MockClock()
+        monkeypatch.setattr(linode_rate_limit.time, "time", clock.time)
+        monkeypatch.setattr(linode_rate_limit.time, "sleep", clock.sleep)
+        return clock
+
+    def test_unlimited_until_observed(self, tmp_path, clock):
+        limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        for _ in range(100):
+            assert limiter.acquire() == 0
+
+        assert clock.slept == []
+
+    def test_retry_after_shared(self, tmp_path, clock):
+        # Two limiters for the same token simulate two forks
+        limiter_a = RateLimiter("token", state_dir=str(tmp_path))
+        limiter_b = RateLimiter("token", state_dir=str(tmp_path))
+
+        limiter_a.observe(429, {"Retry-After": "10"})
+
+        assert limiter_b.acquire() >= 10
+        assert clock.now >= 1010
+
+    def test_token_isolation(self, tmp_path, clock):
+        limiter_a = RateLimiter("token-a", state_dir=str(tmp_path))
+        limiter_b = RateLimiter("token-b", state_dir=str(tmp_path))
+
+        limiter_a.observe(429, {"Retry-After": "10"})
+
+        assert limiter_b.acquire() == 0
+
+    def test_bucket_from_headers(self, tmp_path, clock):
+        limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        limiter.observe(
+            200,
+            {
+                "X-RateLimit-Limit": "10",
+                "X-RateLimit-Remaining": "2",
+                "X-RateLimit-Reset": str(clock.now + 10),
+            },
+        )
+
+        # The remaining budget can be used immediately
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+
+        # The next request must wait for the bucket to refill at 1 req/s
+        waited = limiter.acquire()
+        assert 1 <= waited <= 1 + linode_rate_limit.RATE_LIMIT_JITTER
+
+    def test_exhausted_budget_blocks_until_reset(self, tmp_path, clock):
+        limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        limiter.observe(
+            200,
+            {
+                "X-RateLimit-Limit": "10",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(clock.now + 30),
+            },
+        )
+
+        assert limiter.acquire() >= 30
+
+    def test_endpoint_isolation(self, tmp_path, clock):
+        limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        limiter.observe(
+            200,
+            {
+                "X-RateLimit-Limit": "10",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(clock.now + 30),
+            },
+            "POST /linode/instances",
+        )
+
+        # Other endpoints keep their own budget
+        assert limiter.acquire("GET /linode/instances") == 0
+        assert limiter.acquire("POST /linode/instances") >= 30
+
+    def test_retry_after_all_endpoints(self, tmp_path, clock):
+        limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        limiter.observe(429, {"Retry-After": "10"}, "POST /linode/instances")
+
+        assert limiter.acquire("GET /linode/instances") >= 10
+
+    def test_jittered_backoff(self):
+        retry = JitteredRetry(total=5, backoff_factor=1)
+
+        for attempt in range(1, 10):
+            retry = retry.increment(method="GET", url="/")
+            if attempt >= 5:
+                break
+
+            backoff = retry.get_backoff_time()
+            ceiling = min(
+                linode_rate_limit.RETRY_BACKOFF_MAX_SECONDS,
+                2 ** (attempt - 1),
+            )
+            assert 0 <= backoff <= ceiling
+
+    def test_retry_carries_limiter(self, tmp_path):
+        retry = JitteredRetry(total=5)
+        retry.limiter = RateLimiter("token", state_dir=str(tmp_path))
+
+        assert retry.increment(method="GET", url="/").limiter is retry.limiter